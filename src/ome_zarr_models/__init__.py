@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from importlib.metadata import PackageNotFoundError, version
 from typing import TYPE_CHECKING, Any, Literal
 
 import zarr
+import zarr.api.asynchronous
 import zarr.storage
 
 import ome_zarr_models.v04.bioformats2raw
@@ -21,7 +24,9 @@ import ome_zarr_models.v06.image_label
 import ome_zarr_models.v06.labels
 import ome_zarr_models.v06.scene
 import ome_zarr_models.v06.well
+from ome_zarr_models import _io
 from ome_zarr_models.base import BaseGroup
+from ome_zarr_models.difference import Difference, _diff_groups
 from ome_zarr_models.v04.base import BaseGroupv04
 from ome_zarr_models.v05.base import BaseGroupv05
 from ome_zarr_models.v06.base import BaseGroupv06
@@ -32,7 +37,9 @@ except PackageNotFoundError:  # pragma: no cover
     __version__ = "uninstalled"
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+
+    from ome_zarr_models.selection import Selection
 
 _V04_groups: list[type[BaseGroupv04[Any]]] = [
     ome_zarr_models.v04.hcs.HCS,
@@ -83,19 +90,97 @@ _ome_zarr_zarr_map: dict[str, Literal[2, 3]] = {"0.4": 2, "0.5": 3, "0.6": 3}
 
 _AnyGroup = type[BaseGroupv06[Any] | BaseGroupv05[Any] | BaseGroupv04[Any]]
 
+# Metadata keys that identify each group type.
+# These are used to pick which group classes are worth trying in open_ome_zarr(),
+# so that data is not loaded once for every group class.
+_GROUP_KEYS: dict[_AnyGroup, str] = {
+    ome_zarr_models.v04.hcs.HCS: "plate",
+    ome_zarr_models.v04.image_label.ImageLabel: "image-label",
+    ome_zarr_models.v04.image.Image: "multiscales",
+    ome_zarr_models.v04.labels.Labels: "labels",
+    ome_zarr_models.v04.well.Well: "well",
+    ome_zarr_models.v04.bioformats2raw.BioFormats2Raw: "bioformats2raw.layout",
+    ome_zarr_models.v05.hcs.HCS: "plate",
+    ome_zarr_models.v05.image.Image: "multiscales",
+    ome_zarr_models.v05.labels.Labels: "labels",
+    ome_zarr_models.v05.well.Well: "well",
+    ome_zarr_models.v06.hcs.HCS: "plate",
+    ome_zarr_models.v06.image.Image: "multiscales",
+    ome_zarr_models.v06.labels.Labels: "labels",
+    ome_zarr_models.v06.well.Well: "well",
+    ome_zarr_models.v06.scene.Scene: "scene",
+}
+
+
+def _get_candidate_groups(
+    group: zarr.Group, groups: Sequence[_AnyGroup]
+) -> Sequence[_AnyGroup]:
+    """
+    Get the group classes that might be able to validate a Zarr group.
+
+    This only looks at the metadata of the Zarr group itself, which has already
+    been read when the group was opened, so does not do any I/O.
+
+    Parameters
+    ----------
+    group :
+        Zarr group to inspect.
+    groups :
+        Group classes to choose from, in order of priority.
+
+    Returns
+    -------
+    candidates :
+        Group classes whose identifying metadata key is present, in the same
+        order as `groups`. If the metadata does not identify any group class,
+        all of `groups` are returned.
+    """
+    attrs = group.attrs.asdict()
+    ome_attrs_v2: Mapping[str, Any] = {}
+    ome_attrs_v3: Mapping[str, Any] = {}
+    if group.metadata.zarr_format == 2:
+        # OME-Zarr 0.4 metadata lives at the top level of the attributes
+        ome_attrs_v2 = attrs
+    elif isinstance(ome := attrs.get("ome"), dict):
+        ome_attrs_v3 = ome
+
+    version = ome_attrs_v3.get("version")
+    candidates: list[_AnyGroup] = []
+    for group_cls in groups:
+        if issubclass(group_cls, BaseGroupv04):
+            ome_attrs = ome_attrs_v2
+        elif issubclass(group_cls, BaseGroupv05):
+            if version is not None and version != "0.5":
+                continue
+            ome_attrs = ome_attrs_v3
+        else:
+            if version is not None and not str(version).startswith("0.6"):
+                continue
+            ome_attrs = ome_attrs_v3
+        if _GROUP_KEYS[group_cls] in ome_attrs:
+            candidates.append(group_cls)
+
+    if len(candidates) == 0:
+        # Metadata is not recognised, so fall back to trying everything
+        return groups
+    return candidates
+
 
 def open_ome_zarr(
     group: zarr.Group | zarr.storage.StoreLike,
     *,
     version: Literal["0.4", "0.5", "0.6"] | None = None,
+    selection: Selection | None = None,
 ) -> BaseGroup:
     """
     Create an ome-zarr-models object from an existing OME-Zarr group.
 
     This function will 'guess' which type of OME-Zarr data exists by
-    trying to validate each group metadata definition against your data.
-    If validation is successful, that data class is returned without
-    trying any more.
+    looking at the metadata keys present in the group (e.g., `"plate"` or
+    `"multiscales"`), and then validating the matching group metadata
+    definition against your data.
+    If more than one group type matches, each is tried in turn and the first
+    one where validation is successful is returned.
 
     It tries more recent versions of OME-Zarr first.
 
@@ -108,6 +193,9 @@ def open_ome_zarr(
         If you know which version of OME-Zarr your data is, you can
         specify it here. If not specified, all versions will be tried.
         The default is None, which means all versions will be tried.
+    selection :
+        Parts of the hierarchy to read (e.g., only some wells of a plate).
+        If `None`, everything is read.
 
     Raises
     ------
@@ -116,73 +204,190 @@ def open_ome_zarr(
 
     Warnings
     --------
-    This will try and load your data with every version of every OME-Zarr group type,
-    until a match is found. If data access is slow (e.g., in a remote store), this may
-    take a long time. It will be quicker to directly use the OME-Zarr group class if you
-    know which version and group you expect.
+    If the group metadata does not identify a group type, this will try and load your
+    data with every version of every OME-Zarr group type, until a match is found.
+    If data access is slow (e.g., in a remote store), this may take a long time.
     """
     if not isinstance(group, zarr.Group):
         zarr_format = _ome_zarr_zarr_map.get(version, None)  # type: ignore[arg-type]
         group = zarr.open_group(group, zarr_format=zarr_format, mode="r")
 
+    errors: list[tuple[_AnyGroup, Exception]] = []
+    grp = None
+    # Nodes opened while trying one group class are re-used by the next one
+    with _io.sync_session(selection=selection):
+        for group_cls in _get_candidate_groups(group, _get_version_groups(version)):
+            try:
+                grp = group_cls.from_zarr(group)
+                break
+            except Exception as e:
+                errors.append((group_cls, e))
+
+    if grp is None:
+        raise _open_error(group, errors)
+    return _check_image_label(grp)
+
+
+async def open_ome_zarr_async(
+    group: zarr.Group | zarr.AsyncGroup | zarr.storage.StoreLike,
+    *,
+    version: Literal["0.4", "0.5", "0.6"] | None = None,
+    max_concurrency: int | None = None,
+    selection: Selection | None = None,
+) -> BaseGroup:
+    """
+    Asynchronously create an ome-zarr-models object from an existing OME-Zarr group.
+
+    This is the asynchronous version of
+    [open_ome_zarr][ome_zarr_models.open_ome_zarr]. Metadata for members of the
+    group that do not depend on each other (e.g., the arrays in an image, or
+    the wells in a plate) is read concurrently.
+
+    Parameters
+    ----------
+    group : zarr.Group, zarr.AsyncGroup, zarr.storage.StoreLike
+        Zarr group containing OME-Zarr data. Alternatively any object that can be
+        parsed by [zarr.open_group][].
+    version : Literal['0.4', '0.5', '0.6'], optional
+        If you know which version of OME-Zarr your data is, you can
+        specify it here. If not specified, all versions will be tried.
+        The default is None, which means all versions will be tried.
+    max_concurrency :
+        Maximum number of metadata documents to read at the same time.
+        If not given, the `async.concurrency` setting from the Zarr
+        config is used.
+    selection :
+        Parts of the hierarchy to read (e.g., only some wells of a plate).
+        If `None`, everything is read.
+
+    Raises
+    ------
+    RuntimeError
+        If the passed group cannot be validated with any of the OME-Zarr group models.
+    """
+    if isinstance(group, zarr.Group):
+        group = group._async_group
+    elif not isinstance(group, zarr.AsyncGroup):
+        zarr_format = _ome_zarr_zarr_map.get(version, None)  # type: ignore[arg-type]
+        group = await zarr.api.asynchronous.open_group(
+            group, zarr_format=zarr_format, mode="r"
+        )
+
+    errors: list[tuple[_AnyGroup, Exception]] = []
+    grp = None
+    # Nodes opened while trying one group class are re-used by the next one
+    async with _io.read_session(max_concurrency=max_concurrency, selection=selection):
+        for group_cls in _get_candidate_groups(
+            zarr.Group(group), _get_version_groups(version)
+        ):
+            try:
+                grp = await group_cls.from_zarr_async(
+                    group, max_concurrency=max_concurrency, selection=selection
+                )
+                break
+            except Exception as e:
+                errors.append((group_cls, e))
+
+    if grp is None:
+        raise _open_error(zarr.Group(group), errors)
+    return _check_image_label(grp)
+
+
+def diff(
+    a: BaseGroup | zarr.Group | zarr.storage.StoreLike,
+    b: BaseGroup | zarr.Group | zarr.storage.StoreLike,
+) -> list[Difference]:
+    """
+    Find the differences between the metadata of two OME-Zarr hierarchies.
+
+    Each group and array in the two hierarchies is matched up by its path.
+    Nodes are compared using their content hashes (see
+    [content_hash][ome_zarr_models.base.BaseGroup.content_hash]), so the
+    metadata of groups and arrays is only compared in detail if it (or the
+    metadata of one of their members) is different.
+
+    Parameters
+    ----------
+    a, b :
+        OME-Zarr groups to compare. Each can be a loaded OME-Zarr group, a
+        Zarr group, or any object that can be parsed by [zarr.open_group][].
+        Groups that are not already loaded are loaded with
+        [open_ome_zarr][ome_zarr_models.open_ome_zarr].
+
+    Returns
+    -------
+    differences :
+        Differences between the two hierarchies, ordered by path.
+        This is empty if the metadata of the two hierarchies is the same.
+    """
+    if not isinstance(a, BaseGroup):
+        a = open_ome_zarr(a)
+    if not isinstance(b, BaseGroup):
+        b = open_ome_zarr(b)
+    return _diff_groups(a, b)
+
+
+def _get_version_groups(
+    version: Literal["0.4", "0.5", "0.6"] | None,
+) -> Sequence[_AnyGroup]:
+    """
+    Get all the group classes to try for a given OME-Zarr version.
+    """
     # because 'from_zarr' isn't defined on a shared super-class, list all variants here
-    groups: Sequence[_AnyGroup]
     match version:
         case None:
-            groups = [*_V06_groups, *_V05_groups, *_V04_groups]
+            return [*_V06_groups, *_V05_groups, *_V04_groups]
         case "0.4":
-            groups = _V04_groups
+            return _V04_groups
         case "0.5":
-            groups = _V05_groups
+            return _V05_groups
         case "0.6":
-            groups = _V06_groups
+            return _V06_groups
         case _:
             _versions = ("0.4", "0.5", "0.6")  # type: ignore[unreachable]
             raise ValueError(
                 f"Unsupported version '{version}', must be one of {_versions}, or None"
             )
 
-    errors: list[tuple[_AnyGroup, Exception]] = []
-    grp = None
-    for group_cls in groups:
-        try:
-            grp = group_cls.from_zarr(group)
-            break
-        except Exception as e:
-            errors.append((group_cls, e))
 
-    # See if we have ImageLabel instead of an Image
+def _check_image_label(grp: BaseGroup) -> BaseGroup:
+    """
+    Convert an Image to an ImageLabel, if it has image-label metadata.
+    """
     if (
         isinstance(grp, ome_zarr_models.v05.image.Image)
         and "image-label" in grp.ome_attributes.model_dump()
     ):
-        try:
+        with _io.member_checks(grp):
             return ome_zarr_models.v05.image_label.ImageLabel(
                 attributes=grp.attributes.model_dump(), members=grp.members
             )
-        except Exception:
-            raise
 
     elif (
         isinstance(grp, ome_zarr_models.v06.image.Image)
         and "image-label" in grp.ome_attributes.model_dump()
     ):
-        try:
+        with _io.member_checks(grp):
             return ome_zarr_models.v06.image_label.ImageLabel(
                 attributes=grp.attributes.model_dump(), members=grp.members
             )
-        except Exception:
-            raise
 
-    if grp is None:
-        raise RuntimeError(
-            f"Could not successfully validate {group} "
-            "against any OME-Zarr group model.\n"
-            "\n"
-            "The following errors were encountered while trying to validate:\n\n"
-            + "\n\n".join(
-                f"{e[0].__module__}.{e[0].__name__}\n{type(e[1]).__name__}: {e[1]}"
-                for e in errors
-            )
-        )
     return grp
+
+
+def _open_error(
+    group: zarr.Group, errors: list[tuple[_AnyGroup, Exception]]
+) -> RuntimeError:
+    """
+    Create the error raised when a group can't be opened with any group class.
+    """
+    return RuntimeError(
+        f"Could not successfully validate {group} "
+        "against any OME-Zarr group model.\n"
+        "\n"
+        "The following errors were encountered while trying to validate:\n\n"
+        + "\n\n".join(
+            f"{e[0].__module__}.{e[0].__name__}\n{type(e[1]).__name__}: {e[1]}"
+            for e in errors
+        )
+    )
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+from zarr.abc.store import Store
+
 from ome_zarr_models import __version__, open_ome_zarr
 from ome_zarr_models.exceptions import ValidationWarning
+from ome_zarr_models.selection import Selection
 from ome_zarr_models.v06.image import Image
 from ome_zarr_models.v06.scene import Scene
 
@@ -37,6 +41,40 @@ def main() -> None:
     validate_cmd.add_argument(
         "path", type=str, help="Path to OME-Zarr group to validate"
     )
+    validate_cmd.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory to cache metadata documents in",
+    )
+    validate_cmd.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=0,
+        help=(
+            "Seconds for which cached metadata documents are used without "
+            "checking if they have changed (default: 0)"
+        ),
+    )
+    validate_cmd.add_argument(
+        "--attrs-only",
+        action="store_true",
+        help="Only validate group attributes, without reading any array metadata",
+    )
+    validate_cmd.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep validating a local OME-Zarr group every time it changes, "
+            "only reading the groups that have changed"
+        ),
+    )
+    validate_cmd.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for changes with --watch (default: 1)",
+    )
 
     # info sub-command
     info_cmd = subparsers.add_parser(
@@ -45,6 +83,51 @@ def main() -> None:
     info_cmd.add_argument(
         "path", type=str, help="Path to OME-Zarr group to get information about"
     )
+    info_cmd.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory to cache metadata documents in",
+    )
+    info_cmd.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=0,
+        help=(
+            "Seconds for which cached metadata documents are used without "
+            "checking if they have changed (default: 0)"
+        ),
+    )
+
+    # consolidate sub-command
+    consolidate_cmd = subparsers.add_parser(
+        "consolidate", help="Write consolidated metadata for an OME-Zarr group"
+    )
+    consolidate_cmd.add_argument(
+        "path", type=str, help="Path to OME-Zarr group to consolidate"
+    )
+
+    # diff sub-command
+    diff_cmd = subparsers.add_parser(
+        "diff", help="Show differences between the metadata of two OME-Zarr groups"
+    )
+    diff_cmd.add_argument("path_a", type=str, help="Path to first OME-Zarr group")
+    diff_cmd.add_argument("path_b", type=str, help="Path to second OME-Zarr group")
+    diff_cmd.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory to cache metadata documents in",
+    )
+    diff_cmd.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=0,
+        help=(
+            "Seconds for which cached metadata documents are used without "
+            "checking if they have changed (default: 0)"
+        ),
+    )
 
     # transform-graph sub-command
     graph_cmd = subparsers.add_parser(
@@ -60,9 +143,29 @@ def main() -> None:
     # Execute the appropriate command
     match args.command:
         case "validate":
-            validate(args.path)
+            if args.watch and (args.cache_dir is not None or args.attrs_only):
+                validate_cmd.error(
+                    "--watch can't be used with --cache-dir or --attrs-only"
+                )
+            validate(
+                args.path,
+                cache_dir=args.cache_dir,
+                cache_max_age=args.cache_max_age,
+                attrs_only=args.attrs_only,
+                watch=args.watch,
+                interval=args.interval,
+            )
         case "info":
-            info(args.path)
+            info(args.path, cache_dir=args.cache_dir, cache_max_age=args.cache_max_age)
+        case "consolidate":
+            consolidate(args.path)
+        case "diff":
+            diff(
+                args.path_a,
+                args.path_b,
+                cache_dir=args.cache_dir,
+                cache_max_age=args.cache_max_age,
+            )
         case "transform-graph":
             render_transform_graph(args.path, args.output_image_path)
         case None:
@@ -70,7 +173,16 @@ def main() -> None:
             sys.exit(1)
 
 
-def validate(path: StoreLike, version: Literal["0.4", "0.5"] | None = None) -> None:
+def validate(
+    path: StoreLike,
+    version: Literal["0.4", "0.5"] | None = None,
+    *,
+    cache_dir: str | None = None,
+    cache_max_age: float = 0,
+    attrs_only: bool = False,
+    watch: bool = False,
+    interval: float = 1.0,
+) -> None:
     """Validate an OME-Zarr at the given path.
 
     Parameters
@@ -80,6 +192,20 @@ def validate(path: StoreLike, version: Literal["0.4", "0.5"] | None = None) -> N
     version : str | None, optional
         OME-Zarr version to validate against. If `None`, the version will be
         inferred from the metadata, by default `None`.
+    cache_dir : str | None, optional
+        If given, metadata documents are cached in this directory.
+    cache_max_age : float, optional
+        With *cache_dir*, the number of seconds for which cached metadata
+        documents are used without checking if they have changed.
+    attrs_only : bool, optional
+        If `True`, only the attributes of each group are validated. Array
+        metadata is not read, and the checks that need it are listed as skipped.
+    watch : bool, optional
+        If `True`, the group is validated again every time it changes, until
+        the command is interrupted. Only the groups that have changed are read
+        again. The group must be in a local directory.
+    interval : float, optional
+        With *watch*, the number of seconds between checks for changes.
 
     Examples
     --------
@@ -87,19 +213,81 @@ def validate(path: StoreLike, version: Literal["0.4", "0.5"] | None = None) -> N
     ome-zarr-models validate https://uk1s3.embassy.ebi.ac.uk/idr/zarr/v0.5/idr0066/ExpD_chicken_embryo_MIP.ome.zarr
     ```
     """
+    if watch:
+        _watch(path, version, interval=interval)
+        return
+    selection = Selection(include_arrays=False) if attrs_only else None
     try:
         with warnings.catch_warnings(action="error", category=ValidationWarning):
-            open_ome_zarr(path, version=version)
+            obj = open_ome_zarr(
+                _get_store(path, cache_dir, cache_max_age),
+                version=version,
+                selection=selection,
+            )
     except Exception as e:
         print(f"{e}\n")
         print(f"❌ Invalid OME-Zarr: {path}")
         sys.exit(1)
-    print("✅ Valid OME-Zarr")
+    if attrs_only:
+        print("✅ Valid OME-Zarr attributes")
+        if obj.skipped_checks:
+            print("Skipped checks that need array metadata:")
+            for check in obj.skipped_checks:
+                print(f"  - {check}")
+    else:
+        print("✅ Valid OME-Zarr")
+
+
+def _watch(
+    path: StoreLike, version: Literal["0.4", "0.5"] | None, *, interval: float
+) -> None:
+    """
+    Validate an OME-Zarr in a local directory every time it changes.
+
+    This runs until it is interrupted (e.g., with Ctrl+C).
+    """
+    from ome_zarr_models.incremental import IncrementalValidator
+
+    if not isinstance(path, str | Path):
+        print(f"❌ --watch only works with local directories: {path}")
+        sys.exit(1)
+    try:
+        validator = IncrementalValidator(path, version=version)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
 
+    print(f"Watching {path} for changes (press Ctrl+C to stop)")
+    try:
+        while True:
+            try:
+                with warnings.catch_warnings(
+                    action="error", category=ValidationWarning
+                ):
+                    validator.validate()
+            except Exception as e:
+                print(f"{e}\n")
+                print(f"❌ Invalid OME-Zarr: {path}")
+            else:
+                n_changed = len(validator.changed_paths)
+                if n_changed:
+                    print(f"✅ Valid OME-Zarr ({n_changed} changed groups or arrays)")
+                else:
+                    print("✅ Valid OME-Zarr")
+            while not validator.has_changed():
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
 
-def info(path: StoreLike) -> None:
+
+def info(
+    path: StoreLike, *, cache_dir: str | None = None, cache_max_age: float = 0
+) -> None:
     """Print information about an OME-Zarr at the given path.
 
+    If *cache_dir* is given, metadata documents are cached in this directory,
+    and used without checking if they have changed for *cache_max_age* seconds.
+
     Examples
     --------
     ```bash
@@ -117,7 +305,7 @@ def info(path: StoreLike) -> None:
         from builtins import print
 
     try:
-        group = zarr.open_group(path, mode="r")
+        group = zarr.open_group(_get_store(path, cache_dir, cache_max_age), mode="r")
         obj = open_ome_zarr(group)
     except Exception as e:
         print(f"{e}\n")
@@ -127,6 +315,108 @@ def info(path: StoreLike) -> None:
         print(obj)
 
 
+def _get_store(
+    path: StoreLike, cache_dir: str | None, cache_max_age: float = 0
+) -> StoreLike:
+    """
+    Get a store for a path, that caches metadata if *cache_dir* is given.
+
+    Cached metadata is used without checking if it has changed for
+    *cache_max_age* seconds.
+    """
+    if cache_dir is None:
+        return path
+
+    from zarr.storage import FsspecStore, LocalStore
+
+    from ome_zarr_models.cache import DiskMetadataCacheStore
+
+    store: Store
+    if isinstance(path, Store):
+        store = path
+    elif isinstance(path, str) and "://" in path:
+        store = FsspecStore.from_url(path, read_only=True)
+    elif isinstance(path, str | Path):
+        store = LocalStore(path, read_only=True)
+    else:
+        raise ValueError(f"Can't cache metadata for {path}")
+    return DiskMetadataCacheStore(store, cache_dir, max_age=cache_max_age)
+
+
+def consolidate(path: StoreLike) -> None:
+    """Write consolidated metadata for an OME-Zarr at the given path.
+
+    The OME-Zarr group is validated, and metadata for all the groups and arrays
+    that are part of the OME-Zarr hierarchy is consolidated into the metadata
+    of the group at the given path.
+
+    Examples
+    --------
+    ```bash
+    ome-zarr-models consolidate path/to/plate.ome.zarr
+    ```
+    """
+    import zarr
+
+    from ome_zarr_models._utils import _write_consolidated_metadata
+
+    try:
+        # Don't use any existing consolidated metadata, as it might be out of date
+        group = zarr.open_group(path, mode="r+", use_consolidated=False)
+        obj = open_ome_zarr(group)
+    except Exception as e:
+        print(f"{e}\n")
+        print(f"❌ Invalid OME-Zarr: {path}")
+        sys.exit(1)
+
+    _write_consolidated_metadata(obj, group)  # type: ignore[arg-type]
+    print("✅ Wrote consolidated metadata")
+
+
+def diff(
+    path_a: StoreLike,
+    path_b: StoreLike,
+    *,
+    cache_dir: str | None = None,
+    cache_max_age: float = 0,
+) -> None:
+    """Print the differences between the metadata of two OME-Zarr groups.
+
+    Each node (group or array) that is different is printed with its path,
+    followed by the keys in its metadata that are different. Nodes that
+    are only in the first group are marked with `-`, nodes that are only in
+    the second group with `+`, and nodes that have changed with `~`.
+    Exits with status 1 if there are any differences.
+
+    If *cache_dir* is given, metadata documents are cached in this directory,
+    and used without checking if they have changed for *cache_max_age* seconds.
+
+    Examples
+    --------
+    ```bash
+    ome-zarr-models diff path/to/plate.ome.zarr s3://bucket/plate.ome.zarr
+    ```
+    """
+    from ome_zarr_models import diff as diff_groups
+
+    groups = []
+    for path in [path_a, path_b]:
+        try:
+            groups.append(open_ome_zarr(_get_store(path, cache_dir, cache_max_age)))
+        except Exception as e:
+            print(f"{e}\n")
+            print(f"❌ Invalid OME-Zarr: {path}")
+            sys.exit(1)
+
+    differences = diff_groups(*groups)
+    if not differences:
+        print("✅ No differences")
+        return
+    for difference in differences:
+        print(difference)
+    sys.exit(1)
+
+
 def render_transform_graph(path: StoreLike, output_image_path: PathLike[str]) -> None:
     """
     Render a coordinate transformation graph to a PNG image.
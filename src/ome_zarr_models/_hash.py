@@ -0,0 +1,114 @@
+"""
+Content hashes of OME-Zarr hierarchies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+__all__ = ["TreeHasher"]
+
+
+class TreeHasher:
+    """
+    Computes Merkle hashes of group and array specifications.
+
+    The hash of an array is a hash of its metadata. The hash of a group is a
+    hash of its metadata (apart from its members), and the names and hashes of
+    its members. This means two nodes have the same hash if, and only if, they
+    have the same metadata and the same members (to within hash collisions).
+    Metadata is serialized with its JSON keys, and keys with `null` values are
+    left out, so a model has the same hash as the raw metadata it was made from.
+
+    Hashes of the nodes, and of the attributes, that have been seen are kept,
+    so models that are shared between several nodes (see
+    `_io.MetadataInterner`) are only serialized once. A hasher should not be
+    kept after the hierarchy it was used on has been changed.
+    """
+
+    def __init__(self) -> None:
+        # Keyed by object id. The objects are kept so their ids are not re-used.
+        self._node_hashes: dict[int, tuple[Any, bytes]] = {}
+        self._attribute_documents: dict[int, tuple[Any, str]] = {}
+
+    def hash(self, node: Any) -> bytes:
+        """
+        Get the hash of a group or array specification.
+        """
+        cached = self._node_hashes.get(id(node))
+        if cached is not None:
+            return cached[1]
+        if hasattr(node, "members"):
+            document = _without_nulls(
+                node.model_dump(
+                    mode="json", by_alias=True, exclude={"attributes", "members"}
+                )
+            )
+            # Members of groups loaded with lazy=True are all read here
+            members = node.members or {}
+            document["members"] = {
+                name: self.hash(members[name]).hex() for name in sorted(members)
+            }
+            content = f"{self._attributes(node)}\n{_canonical_json(document)}"
+        else:
+            content = _canonical_json(
+                _without_nulls(node.model_dump(mode="json", by_alias=True))
+            )
+        digest = hashlib.sha256(content.encode()).digest()
+        self._node_hashes[id(node)] = (node, digest)
+        return digest
+
+    def _attributes(self, node: Any) -> str:
+        """
+        Get the canonical JSON document of the attributes of a node.
+        """
+        attributes = node.attributes
+        cached = self._attribute_documents.get(id(attributes))
+        if cached is not None:
+            return cached[1]
+        if isinstance(attributes, BaseModel):
+            attributes = attributes.model_dump(mode="json", by_alias=True)
+        document = _canonical_json(_without_nulls(attributes))
+        self._attribute_documents[id(node.attributes)] = (node.attributes, document)
+        return document
+
+
+def _document_hash(document: Any) -> bytes:
+    """
+    Get the SHA-256 hash of a JSON document, regardless of the order of its keys.
+    """
+    return hashlib.sha256(_canonical_json(document).encode()).digest()
+
+
+def _canonical_json(value: Any) -> str:
+    """
+    Serialize a JSON-compatible value, with keys sorted and no whitespace.
+    """
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def _without_nulls(value: Any) -> Any:
+    """
+    Convert a value to JSON, leaving out keys with `null` values.
+
+    This is used to compare attributes, as optional keys that are missing
+    are the same as optional keys that are `null`.
+    """
+    value = to_jsonable_python(value, by_alias=True)
+    if isinstance(value, dict):
+        return {
+            key: _without_nulls(item) for key, item in value.items() if item is not None
+        }
+    if isinstance(value, list):
+        return [_without_nulls(item) for item in value]
+    return value
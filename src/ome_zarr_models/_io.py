@@ -0,0 +1,1513 @@
+"""
+Private asynchronous reading of Zarr nodes.
+
+All metadata reads that happen while loading an OME-Zarr group go through the
+functions in this module.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import itertools
+import weakref
+from collections import deque
+from collections.abc import Callable, Coroutine, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+import zarr
+import zarr.api.asynchronous
+import zarr.errors
+from pydantic import BaseModel
+from zarr.core.array import AsyncArray
+from zarr.core.group import AsyncGroup, GroupMetadata
+from zarr.core.metadata import ArrayV2Metadata, ArrayV3Metadata
+from zarr.core.sync import _get_loop, sync
+
+from ome_zarr_models._hash import _document_hash
+from ome_zarr_models.base import BaseGroup
+from ome_zarr_models.cache import (
+    ListingIndexStore,
+    _get_cache_key,
+    _get_store_metadata_cache,
+)
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
+
+    import pydantic_zarr.v2
+    import pydantic_zarr.v3
+    from zarr.storage import StorePath
+
+    from ome_zarr_models.selection import Selection
+
+    GroupSpecClass = (
+        type[pydantic_zarr.v2.GroupSpec[Any, Any]]
+        | type[pydantic_zarr.v3.GroupSpec[Any, Any]]
+    )
+
+T = TypeVar("T")
+
+
+NodeKey = tuple[str, str, Literal["group", "array"], Literal[2, 3]]
+"""Store identity, path, node type and Zarr format of an opened node."""
+NodeRegistry = dict[NodeKey, "asyncio.Future[Any]"]
+"""Opened nodes, or the errors raised opening them."""
+
+
+@dataclass
+class ReadSession:
+    """
+    State shared by all the reads made while loading a single OME-Zarr group.
+    """
+
+    semaphore: asyncio.Semaphore
+    """Limits the number of concurrent reads from the store."""
+    selection: Selection | None = None
+    """Parts of the hierarchy to read. If `None`, everything is read."""
+    skipped_checks: set[str] = field(default_factory=set)
+    """Checks that were not run, because they need metadata that was not read."""
+    nodes: NodeRegistry = field(default_factory=dict)
+    """Groups and arrays that have been opened, so each is only opened once."""
+    interner: MetadataInterner = field(default_factory=lambda: MetadataInterner())
+    """Metadata models created in this session, so identical models are shared."""
+    previous_models: Mapping[str, BaseGroup] = field(default_factory=dict)
+    """Models of groups that have not changed since an earlier load, by path."""
+
+    def finish_load(self, result: T) -> T:
+        """
+        Finish loading a group model.
+
+        This shares identical metadata models in the loaded model, and records
+        the checks skipped in this session on it.
+        """
+        if isinstance(result, BaseGroup):
+            # Models re-used from an earlier load, and their specifications,
+            # have already been shared
+            skip: list[Any] = list(self.previous_models.values())
+            for model in self.previous_models.values():
+                skip.extend(model._group_specs.values())
+            self.interner.share(result, skip=skip)
+            if self.skipped_checks:
+                result._skipped_checks = tuple(sorted(self.skipped_checks))  # type: ignore[attr-defined]
+        return result
+
+
+_read_session: ContextVar[ReadSession | None] = ContextVar(
+    "_read_session", default=None
+)
+_depth: ContextVar[int] = ContextVar("_depth", default=0)
+"""Depth of the group that is being read, below the group that was opened."""
+
+
+@dataclass
+class _SyncDefaults:
+    """
+    Read session settings shared by `run_sync()` calls in a `sync_session()`.
+    """
+
+    selection: Selection | None
+    nodes: NodeRegistry
+
+
+_sync_defaults: ContextVar[_SyncDefaults | None] = ContextVar(
+    "_sync_defaults", default=None
+)
+_previous_models: ContextVar[Mapping[str, BaseGroup] | None] = ContextVar(
+    "_previous_models", default=None
+)
+"""Models of unchanged groups that `run_sync()` calls in this context re-use."""
+
+
+@contextlib.asynccontextmanager
+async def read_session(
+    *,
+    max_concurrency: int | None,
+    selection: Selection | None = None,
+    nodes: NodeRegistry | None = None,
+    previous_models: Mapping[str, BaseGroup] | None = None,
+) -> AsyncIterator[ReadSession]:
+    """
+    Start a read session, or re-use the current session if there is one.
+
+    Parameters
+    ----------
+    max_concurrency :
+        Maximum number of concurrent reads from the store. If `None`, the
+        `async.concurrency` setting from the Zarr config is used.
+    selection :
+        Parts of the hierarchy to read. If `None`, everything is read.
+    nodes :
+        Nodes opened in an earlier session to re-use. These must have been
+        opened on the same event loop.
+    previous_models :
+        Models of groups loaded in an earlier session that have not changed
+        since, by path in the store. These are used instead of reading the
+        groups again.
+    """
+    session = _read_session.get()
+    if session is not None:
+        yield session
+        return
+
+    if max_concurrency is None:
+        max_concurrency = zarr.config.get("async.concurrency")
+    if max_concurrency is None or max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1 (got {max_concurrency})")
+    session = ReadSession(
+        semaphore=asyncio.Semaphore(max_concurrency), selection=selection
+    )
+    if nodes is not None:
+        session.nodes = nodes
+    if previous_models is not None:
+        session.previous_models = previous_models
+    token = _read_session.set(session)
+    try:
+        if selection is not None and not selection.include_arrays:
+            with skipping_array_checks() as skipped_checks:
+                session.skipped_checks = skipped_checks
+                yield session
+        else:
+            yield session
+    finally:
+        _read_session.reset(token)
+
+
+def run_sync[T](
+    coro: Coroutine[Any, Any, T], *, selection: Selection | None = None
+) -> T:
+    """
+    Run a coroutine that reads Zarr nodes, and wait for the result.
+
+    This is how the synchronous `from_zarr()` methods load groups. The
+    coroutine is run on the Zarr event loop, in a new read session with the
+    default concurrency limit.
+
+    Inside a `sync_session()`, nodes opened by earlier calls are re-used, and
+    the selection of the `sync_session()` is used if *selection* is not given.
+    Otherwise the selection of the current read session is used, if there is one.
+    Inside a `reusing_models()` context, the models it was given are re-used.
+    """
+    defaults = _sync_defaults.get()
+    if selection is None:
+        selection = defaults.selection if defaults is not None else None
+    if selection is None:
+        selection = current_selection()
+    nodes = defaults.nodes if defaults is not None else None
+    previous_models = _previous_models.get()
+
+    async def run() -> T:
+        async with read_session(
+            max_concurrency=None,
+            selection=selection,
+            nodes=nodes,
+            previous_models=previous_models,
+        ) as session:
+            return session.finish_load(await coro)
+
+    return sync(run())
+
+
+def iter_sync[T](
+    readers: Iterable[Callable[[], Coroutine[Any, Any, T]]],
+    *,
+    read_ahead: int,
+    selection: Selection | None = None,
+) -> Iterator[T]:
+    """
+    Run coroutines that read Zarr nodes, and yield their results in order.
+
+    The coroutines are run on the Zarr event loop. While the caller is
+    processing one result, up to *read_ahead* of the following coroutines are
+    run in the background. *readers* is only consumed as far as needed to
+    fill the read-ahead window, so it can be a lazy iterable.
+
+    If a coroutine raises an error, it is raised when its result would have
+    been yielded. Coroutines that are still running are cancelled when the
+    iterator is closed.
+
+    Each coroutine is run in a new read session with *selection*.
+    """
+    if read_ahead < 1:
+        raise ValueError(f"read_ahead must be at least 1 (got {read_ahead})")
+
+    async def run(reader: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        async with read_session(max_concurrency=None, selection=selection):
+            return await reader()
+
+    loop = _get_loop()
+    readers = iter(readers)
+    pending: deque[concurrent.futures.Future[T]] = deque()
+    try:
+        for reader in itertools.islice(readers, read_ahead):
+            pending.append(asyncio.run_coroutine_threadsafe(run(reader), loop))
+        while pending:
+            result = pending.popleft().result()
+            for reader in itertools.islice(readers, 1):
+                pending.append(asyncio.run_coroutine_threadsafe(run(reader), loop))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+@contextlib.contextmanager
+def sync_session(*, selection: Selection | None = None) -> Iterator[None]:
+    """
+    Share a selection, and the nodes that are opened, between `run_sync()` calls.
+
+    This is used to try loading the same group with several group classes,
+    without opening the same node more than once.
+    """
+    token = _sync_defaults.set(_SyncDefaults(selection=selection, nodes={}))
+    try:
+        yield
+    finally:
+        _sync_defaults.reset(token)
+
+
+@contextlib.contextmanager
+def reusing_models(models: Mapping[str, BaseGroup]) -> Iterator[None]:
+    """
+    Re-use models of groups from an earlier load in `run_sync()` calls.
+
+    Parameters
+    ----------
+    models :
+        Models of groups that have not changed since they were loaded, by
+        path in the store. When one of these groups is read as a member of
+        another group with the same class, the model is used instead of reading
+        and validating the group again.
+    """
+    token = _previous_models.set(models)
+    try:
+        yield
+    finally:
+        _previous_models.reset(token)
+
+
+def previous_model(group_cls: type[Any], path: str) -> Any:
+    """
+    Get the model of a group from an earlier load, if it can be re-used.
+
+    See `reusing_models()`.
+
+    Parameters
+    ----------
+    group_cls :
+        Class of the group.
+    path :
+        Path of the group in the store.
+    """
+    session = _read_session.get()
+    if session is None:
+        return None
+    model = session.previous_models.get(path)
+    return model if type(model) is group_cls else None
+
+
+_checked_selection: ContextVar[Selection | None] = ContextVar(
+    "_checked_selection", default=None
+)
+"""Selection that the groups checked outside a read session were read with."""
+
+
+def record_read_attributes(model: BaseGroup, group: AsyncGroup) -> None:
+    """
+    Record the attributes document that a group model was read from.
+
+    When changes to the model are written (e.g., by
+    `BaseGroup.update_attributes()`), the attributes in the store are compared
+    with this document, to check they have not changed since they were read.
+    """
+    model.__dict__["_read_attributes_hash"] = _document_hash(group.attrs)
+
+
+def current_selection() -> Selection | None:
+    """
+    Get the selection of the current read session.
+
+    Outside a read session, this is the selection of a `checking_as_read()`
+    context, if there is one.
+    """
+    session = _read_session.get()
+    return _checked_selection.get() if session is None else session.selection
+
+
+@contextlib.contextmanager
+def checking_as_read(selection: Selection | None, depth: int) -> Iterator[None]:
+    """
+    Check a group in this context as if it were being read in a read session.
+
+    This is used to run checks of groups with lazy members once the members
+    have been read, so checks that depend on the selection give the same
+    result as if they had been run when the group was read.
+
+    Parameters
+    ----------
+    selection :
+        Selection that the group was read with.
+    depth :
+        Depth of the group, below the group that was opened.
+    """
+    token = _checked_selection.set(selection)
+    try:
+        with at_depth(depth):
+            if selection is not None and not selection.include_arrays:
+                with skipping_array_checks():
+                    yield
+            else:
+                yield
+    finally:
+        _checked_selection.reset(token)
+
+
+def get_depth() -> int:
+    """
+    Get the depth of the group that is being read, below the group that was opened.
+    """
+    return _depth.get()
+
+
+@contextlib.contextmanager
+def at_depth(depth: int) -> Iterator[None]:
+    """
+    Set the depth of the group that is being read in this context.
+    """
+    token = _depth.set(depth)
+    try:
+        yield
+    finally:
+        _depth.reset(token)
+
+
+def path_depth(path: str) -> int:
+    """
+    Get the number of components in a Zarr path.
+    """
+    return len(path.strip("/").split("/"))
+
+
+def is_selected(path: str, group_cls: type[Any]) -> bool:
+    """
+    Check if an optional member group of the group being read should be read.
+
+    Parameters
+    ----------
+    path :
+        Path of the member, relative to the group being read.
+    group_cls :
+        Class that will be used to read the member.
+    """
+    selection = current_selection()
+    if selection is None:
+        return True
+    return selection._includes(path, group_cls, depth=get_depth() + path_depth(path))
+
+
+def arrays_selected() -> bool:
+    """
+    Check if array metadata should be read in the current read session.
+    """
+    selection = current_selection()
+    return selection is None or selection.include_arrays
+
+
+_array_checks_skipped: ContextVar[set[str] | None] = ContextVar(
+    "_array_checks_skipped", default=None
+)
+"""If set, checks that need array metadata are skipped, and recorded here."""
+
+
+@contextlib.contextmanager
+def skipping_array_checks() -> Iterator[set[str]]:
+    """
+    Skip checks that need array metadata in this context.
+
+    Yields
+    ------
+    skipped_checks :
+        Set that the checks that are skipped are added to.
+    """
+    skipped_checks: set[str] = set()
+    token = _array_checks_skipped.set(skipped_checks)
+    try:
+        yield skipped_checks
+    finally:
+        _array_checks_skipped.reset(token)
+
+
+def array_checks_run() -> bool:
+    """
+    Check if checks that need array metadata are run in this context.
+    """
+    return _array_checks_skipped.get() is None
+
+
+def member_checks(group: Any) -> contextlib.AbstractContextManager[Any]:
+    """
+    Context manager to create models of the members of a group in.
+
+    If the group was loaded without array metadata, checks that need array
+    metadata are also skipped for its members.
+    """
+    if getattr(group, "_array_checks_run", True):
+        return contextlib.nullcontext()
+    return skipping_array_checks()
+
+
+GroupT = TypeVar("GroupT")
+
+
+def requires_arrays(check: Callable[[GroupT], GroupT]) -> Callable[[GroupT], GroupT]:
+    """
+    Mark a model validator as needing the array metadata of the group.
+
+    In a `skipping_array_checks()` context the validator is not run, and is
+    recorded as skipped on the group and in the context.
+    """
+
+    @functools.wraps(check)
+    def wrapper(group: GroupT) -> GroupT:
+        skipped_checks = _array_checks_skipped.get()
+        if skipped_checks is None:
+            return check(group)
+        name = f"{type(group).__name__}.{check.__name__}"
+        skipped_checks.add(name)
+        _record_skipped_check(group, name)
+        return group
+
+    return wrapper
+
+
+def requires_selected_members(
+    check: Callable[[GroupT], GroupT],
+) -> Callable[[GroupT], GroupT]:
+    """
+    Mark a model validator as needing all the optional member groups of the group.
+
+    If some of the optional member groups (e.g., labels or wells) are not in
+    the selection of the current read session, the validator is only run on
+    the members that were read. It is then recorded as skipped on the group and
+    in the read session, as it has not checked the whole group.
+    """
+
+    @functools.wraps(check)
+    def wrapper(group: GroupT) -> GroupT:
+        if current_selection() is not None:
+            optional_paths = group.ome_attributes.get_optional_group_paths()  # type: ignore[attr-defined]
+            if not all(
+                is_selected(path, member_cls)
+                for path, member_cls in optional_paths.items()
+            ):
+                name = f"{type(group).__name__}.{check.__name__}"
+                session = _read_session.get()
+                if session is not None:
+                    session.skipped_checks.add(name)
+                _record_skipped_check(group, name)
+        return check(group)
+
+    return wrapper
+
+
+def _record_skipped_check(group: Any, name: str) -> None:
+    """
+    Record a check as skipped on a group, if it has not been recorded already.
+    """
+    if name not in group._skipped_checks:
+        group._skipped_checks = (*group._skipped_checks, name)
+
+
+def defer_model_validators[GroupT](group: GroupT) -> GroupT:
+    """
+    Run the model validators of a group with lazy members once they have all been read.
+
+    Groups with lazy members are made with `model_construct()`, which does not
+    run any model validators. Until all the members have been read, and the
+    validators have passed, the validators are reported in the skipped checks
+    of the group. If a validator fails, the error is raised again every time
+    the members are accessed.
+
+    The validators are run with the selection and depth that the group was
+    read with, so checks that are skipped when reading a group are also
+    skipped here.
+    """
+    members = group.members  # type: ignore[attr-defined]
+    validators = type(group).__pydantic_decorators__.model_validators  # type: ignore[attr-defined]
+    if not isinstance(members, LazyMembers) or not validators:
+        return group
+    members._pending_checks = tuple(
+        sorted(f"{type(group).__name__}.{name}" for name in validators)
+    )
+    group_ref = weakref.ref(group)
+    depth = get_depth()
+
+    def run_validators() -> None:
+        group = group_ref()
+        if group is not None:
+            with checking_as_read(members._selection, depth):
+                for validator in validators.values():
+                    validator.func(group)
+        members._pending_checks = ()
+
+    members._on_loaded.append(run_validators)
+    return group
+
+
+_loaded_models: ContextVar[dict[int, tuple[Any, Any]] | None] = ContextVar(
+    "_loaded_models", default=None
+)
+"""Models of members validated when they were loaded, by member specification id."""
+
+
+def member_model[MemberT](
+    group: BaseGroup, path: str, spec: Any, build: Callable[[], MemberT]
+) -> MemberT:
+    """
+    Get the model of a member group, only validating it the first time.
+
+    Models are stored on *group*, and re-used as long as the specification of
+    the member is the same object. If the member was loaded with *group*,
+    the model that was validated when the member was loaded is used.
+
+    Parameters
+    ----------
+    group :
+        Parent group.
+    path :
+        Path of the member in the parent group.
+    spec :
+        Specification of the member in the members of the parent group.
+    build :
+        Function that validates and returns a new model of the member.
+    """
+    models = group._member_models
+    entry = models.get(path)
+    if entry is not None and entry[0] is spec:
+        cached_model: MemberT = entry[1]
+        return cached_model
+    loaded = (_loaded_models.get() or {}).get(id(spec))
+    model = loaded[1] if loaded is not None and loaded[0] is spec else build()
+    models[path] = (spec, model)
+    return model
+
+
+def construct_with_members[GroupT](
+    construct: Callable[[], GroupT],
+    members: Mapping[str, Any] | None,
+    models: Mapping[str, Any],
+) -> GroupT:
+    """
+    Construct a group, re-using the models of members validated when they were loaded.
+
+    While the group is being validated, `member_model()` returns the loaded
+    models instead of validating the members again. Afterwards the loaded
+    models are stored on the group.
+
+    Parameters
+    ----------
+    construct :
+        Function that validates and returns the group.
+    members :
+        Members that are passed to the group.
+    models :
+        Mapping from member paths to loaded models.
+    """
+    loaded = {}
+    for path, model in models.items():
+        spec = get_member_spec(members, path)
+        if spec is not None:
+            loaded[id(spec)] = (spec, model)
+    token = _loaded_models.set({**(_loaded_models.get() or {}), **loaded})
+    try:
+        group = construct()
+    finally:
+        _loaded_models.reset(token)
+
+    for path, model in models.items():
+        spec = get_member_spec(group.members, path)  # type: ignore[attr-defined]
+        if spec is not None and loaded.get(id(spec), (None,))[0] is spec:
+            group._member_models.setdefault(path, (spec, model))  # type: ignore[attr-defined]
+    return group
+
+
+def get_member_spec(members: Mapping[str, Any] | None, path: str) -> Any:
+    """
+    Get the specification of a member at a (possibly nested) path.
+
+    Returns `None` if there is no member at the path.
+    """
+    spec: Any = None
+    for part in path.strip("/").split("/"):
+        if not isinstance(members, Mapping) or part not in members:
+            return None
+        spec = members[part]
+        members = getattr(spec, "members", None)
+    return spec
+
+
+class MetadataInterner:
+    """
+    Share structurally identical metadata models.
+
+    In a large hierarchy (e.g., a plate), many groups and arrays have identical
+    metadata. Models are frozen, so one model can be shared between all of them
+    instead of storing a copy for each.
+    """
+
+    def __init__(self) -> None:
+        self._documents: dict[Any, Any] = {}
+        """Models, by a key of the metadata document they were created from."""
+        self._models: dict[Any, Any] = {}
+        """Shared models, by a key of their contents."""
+        self._keys: dict[int, Any] = {}
+        """Keys of shared models, by the id of the model."""
+        self._skip: set[int] = set()
+        """Ids of values to leave out when sharing models."""
+
+    def from_document[ModelT: BaseModel](
+        self, kind: object, document: Mapping[str, Any], build: Callable[[], ModelT]
+    ) -> ModelT:
+        """
+        Get a model, re-using the model created from an identical document.
+
+        A model is only validated the first time its document is seen.
+        """
+        key = _freeze((kind, document))
+        if key is None:
+            return build()
+        model: ModelT | None = self._documents.get(key)
+        if model is None:
+            model = self.share(build())
+            self._documents[key] = model
+        return model
+
+    def share(self, value: T, *, skip: Iterable[object] = ()) -> T:
+        """
+        Replace frozen models in *value* with identical models seen before.
+
+        Models are replaced in place in the fields of other models, and in
+        dictionaries and lists. This is safe, because they are replaced with
+        an equal model. Group models are never shared, but the models in them are.
+        The values in *skip*, and the models in them, are left as they are.
+        """
+        self._skip = {id(item) for item in skip}
+        try:
+            shared: T = self._share(value)[0]
+        finally:
+            self._skip = set()
+        return shared
+
+    def _share(self, value: Any) -> tuple[Any, Any]:
+        """
+        Share the models in *value*.
+
+        Returns
+        -------
+        value :
+            Value with shared models.
+        key :
+            Key of the contents of the value, or `None` if it can't be shared.
+        """
+        if type(value) in _JSON_SCALAR_TYPES:
+            return value, (type(value), value)
+        if id(value) in self._skip:
+            return value, None
+        if isinstance(value, BaseGroup):
+            self._share_group(value)
+            return value, None
+        if isinstance(value, BaseModel):
+            key = self._keys.get(id(value))
+            if key is not None:
+                return value, key
+            if not value.model_config.get("frozen"):
+                return value, None
+            fields_key = self._share_items(value.__dict__, type(value).model_fields)
+            extra_key = _freeze(
+                (value.__pydantic_extra__ or {}, value.__pydantic_private__ or {})
+            )
+            if fields_key is None or extra_key is None:
+                return value, None
+            key = (type(value), fields_key, extra_key)
+            shared = self._models.setdefault(key, value)
+            self._keys[id(shared)] = key
+            return shared, key
+        if isinstance(value, dict):
+            items_key = self._share_items(value, list(value))
+            return value, None if items_key is None else (dict, frozenset(items_key))
+        if isinstance(value, list | tuple):
+            items = dict(enumerate(value))
+            items_key = self._share_items(items, items)
+            if any(items[i] is not item for i, item in enumerate(value)):
+                if isinstance(value, list):
+                    value[:] = items.values()
+                elif type(value) is tuple:
+                    value = tuple(items.values())
+                else:
+                    return value, None
+            if items_key is None:
+                return value, None
+            return value, (type(value), tuple(key for _, key in items_key))
+        return value, _freeze(value)
+
+    def _share_items(self, items: dict[Any, Any], names: Iterable[Any]) -> Any:
+        """
+        Share the models in some items of a dictionary, replacing them in place.
+
+        Returns `None` if any of the items can't be shared.
+        """
+        keys = []
+        can_share = True
+        for name in names:
+            shared, key = self._share(items[name])
+            if shared is not items[name]:
+                items[name] = shared
+            can_share = can_share and key is not None
+            keys.append((name, key))
+        return tuple(keys) if can_share else None
+
+    def _share_group(self, group: BaseGroup) -> None:
+        """
+        Share the models in a group, and in the models of its members.
+        """
+        # Member models are only re-used while their specification is the same
+        # object, so keep track of them while the specifications are replaced
+        current_models = {
+            path: model
+            for path, (spec, model) in group._member_models.items()
+            if get_member_spec(group.members, path) is spec  # type: ignore[attr-defined]
+        }
+        self._share_items(group.__dict__, type(group).model_fields)  # type: ignore[attr-defined]
+        for path, model in current_models.items():
+            self._share(model)
+            group._member_models[path] = (
+                get_member_spec(group.members, path),  # type: ignore[attr-defined]
+                model,
+            )
+
+
+def interned[ModelT: BaseModel](
+    kind: object, document: Mapping[str, Any], build: Callable[[], ModelT]
+) -> ModelT:
+    """
+    Get a metadata model, re-using an identical model created earlier in the session.
+
+    Parameters
+    ----------
+    kind :
+        Kind of model. Models are only re-used for documents of the same kind.
+    document :
+        Metadata document that the model is created from.
+    build :
+        Function that validates and returns a new model from *document*.
+    """
+    session = _read_session.get()
+    if session is None:
+        return build()
+    return session.interner.from_document(kind, document, build)
+
+
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Get a hashable key that is equal for equal JSON-like values.
+
+    Types are part of the key, so values that compare equal but have different
+    types (e.g., `1` and `True`) have different keys. Returns `None` if part of
+    the value is not hashable.
+    """
+    if type(value) in _JSON_SCALAR_TYPES:
+        return (type(value), value)
+    if isinstance(value, dict):
+        items = []
+        for item_key, item in value.items():
+            frozen_item = _freeze(item)
+            if frozen_item is None:
+                return None
+            items.append((item_key, frozen_item))
+        return (type(value), frozenset(items))
+    if isinstance(value, list | tuple):
+        frozen_items = tuple(_freeze(item) for item in value)
+        if None in frozen_items:
+            return None
+        return (type(value), frozen_items)
+    if isinstance(value, BaseModel):
+        return None
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return (type(value), value)
+
+
+def _limit() -> contextlib.AbstractAsyncContextManager[Any]:
+    """
+    Context manager that limits the number of concurrent reads.
+    """
+    session = _read_session.get()
+    if session is None:
+        return contextlib.nullcontext()
+    return session.semaphore
+
+
+async def gather_in_order(*aws: Awaitable[Any]) -> list[Any]:
+    """
+    Run awaitables concurrently, and return their results in order.
+
+    If any of the awaitables raise an error, the error from the first
+    awaitable (in the order given) that raises is re-raised. This is the same
+    error that would be raised if the awaitables were run one after another.
+    As soon as this error is known, all the other awaitables are cancelled.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        pending = set(tasks)
+        while pending:
+            _, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for index, task in enumerate(tasks):
+                if task.done() and not task.cancelled() and task.exception():
+                    # Later tasks cannot change the result, so cancel them
+                    for later_task in tasks[index + 1 :]:
+                        later_task.cancel()
+                    pending = {t for t in tasks[:index] if not t.done()}
+                    break
+        return [task.result() for task in tasks]
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Wait for cancelled tasks to finish, and retrieve all exceptions
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def open_group_path(
+    group: AsyncGroup,
+    group_path: str,
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> AsyncGroup:
+    """
+    Open a group at a given path in a group.
+
+    If *group* has consolidated metadata, this is used to open the group
+    without reading anything from the store. Otherwise the metadata cache
+    is used, if one is set.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the path doesn't exist.
+    zarr.errors.ContainsArrayError
+        If there is an array at the path.
+    """
+    not_found_msg = (
+        f"Expected to find a group at {group_path}, but no group was found there."
+    )
+    is_array_msg = (
+        f"Expected to find an group at {group_path}, "
+        "but an array was found there instead."
+    )
+    if group.metadata.consolidated_metadata is not None:
+        try:
+            node = await get_consolidated_node(group, group_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(not_found_msg) from e
+        if not isinstance(node, AsyncGroup):
+            raise zarr.errors.ContainsArrayError(is_array_msg)
+        return node
+
+    store_path = group.store_path / group_path
+    cache = _get_store_metadata_cache(store_path.store)
+    if cache is not None:
+        metadata = cache.get(_get_cache_key(store_path))
+        if (
+            isinstance(metadata, GroupMetadata)
+            and metadata.zarr_format == expected_zarr_version
+        ):
+            return AsyncGroup(metadata=metadata, store_path=store_path)
+
+    if await _index_contains_node(store_path) is False:
+        raise FileNotFoundError(not_found_msg)
+
+    async def open_group() -> AsyncGroup:
+        async with _limit():
+            return await zarr.api.asynchronous.open_group(
+                store=group.store_path,
+                path=group_path,
+                mode="r",
+                zarr_format=expected_zarr_version,
+                # Consolidated metadata is only looked for in the group that is
+                # opened by the user. This saves reading a '.zmetadata' document
+                # that doesn't exist for every Zarr v2 group. (Zarr v3 groups
+                # keep their consolidated metadata in 'zarr.json', so this
+                # doesn't change anything for them.)
+                use_consolidated=False if expected_zarr_version == 2 else None,
+            )
+
+    try:
+        opened_group = await _open_once(
+            (*_get_cache_key(store_path), "group", expected_zarr_version), open_group
+        )
+    except FileNotFoundError as e:
+        raise FileNotFoundError(not_found_msg) from e
+    except zarr.errors.ContainsArrayError as e:
+        raise zarr.errors.ContainsArrayError(is_array_msg) from e
+    if cache is not None:
+        cache.set(_get_cache_key(store_path), opened_group.metadata)
+    return opened_group
+
+
+async def open_array_path(
+    group: AsyncGroup,
+    array_path: str,
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> AsyncArray[Any]:
+    """
+    Open an array at a given path in a group.
+
+    If *group* has consolidated metadata, this is used to open the array
+    without reading anything from the store. Otherwise the metadata cache
+    is used, if one is set.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the path doesn't exist.
+    zarr.errors.ContainsGroupError
+        If there is a group at the path.
+    """
+    if group.metadata.consolidated_metadata is not None:
+        node = await get_consolidated_node(group, array_path)
+        if not isinstance(node, AsyncArray):
+            raise zarr.errors.ContainsGroupError(group.store_path, array_path)
+        return node
+
+    store_path = group.store_path / array_path
+    cache = _get_store_metadata_cache(store_path.store)
+    if cache is not None:
+        metadata = cache.get(_get_cache_key(store_path))
+        if (
+            isinstance(metadata, ArrayV2Metadata | ArrayV3Metadata)
+            and metadata.zarr_format == expected_zarr_version
+        ):
+            return AsyncArray(metadata=metadata, store_path=store_path)
+
+    if await _index_contains_node(store_path) is False:
+        raise FileNotFoundError(f"No array found at {array_path}")
+
+    async def open_array() -> AsyncArray[Any]:
+        async with _limit():
+            return await zarr.api.asynchronous.open_array(
+                store=group.store_path,
+                path=array_path,
+                mode="r",
+                zarr_format=expected_zarr_version,
+            )
+
+    array = await _open_once(
+        (*_get_cache_key(store_path), "array", expected_zarr_version), open_array
+    )
+    if cache is not None:
+        cache.set(_get_cache_key(store_path), array.metadata)
+    return array
+
+
+_PROBES_PER_ROUND = 6
+"""Number of paths checked concurrently in each round of `open_numbered_groups()`."""
+
+
+async def open_numbered_groups(
+    group: AsyncGroup,
+    *,
+    expected_zarr_version: Literal[2, 3],
+    paths: Sequence[str] | None = None,
+) -> dict[str, AsyncGroup]:
+    """
+    Open the groups at paths `"0"`, `"1"`, `"2"`... in a group.
+
+    Groups are opened up to the first path that doesn't exist, so the result
+    is the same as opening each path in turn until one is not found.
+    Rather than doing this one path at a time, the number of groups is found
+    with a few rounds of concurrent existence checks, and then all the groups
+    are opened concurrently.
+
+    Parameters
+    ----------
+    group :
+        Parent group.
+    expected_zarr_version :
+        Zarr format of the groups.
+    paths :
+        Paths of the groups, if they are listed in the metadata. These are
+        used instead of searching for numbered paths.
+
+    Returns
+    -------
+    dict[str, AsyncGroup]
+        Mapping from path to opened group.
+    """
+    if paths is None:
+        count = await _count_numbered_groups(
+            group, expected_zarr_version=expected_zarr_version
+        )
+        paths = [str(index) for index in range(count)]
+
+    async def try_open(path: str) -> AsyncGroup | None:
+        try:
+            return await open_group_path(
+                group, path, expected_zarr_version=expected_zarr_version
+            )
+        except FileNotFoundError:
+            return None
+
+    groups: dict[str, AsyncGroup] = {}
+    for path, opened_group in zip(
+        paths, await gather_in_order(*(try_open(path) for path in paths)), strict=True
+    ):
+        if opened_group is None:
+            break
+        groups[path] = opened_group
+    return groups
+
+
+async def _count_numbered_groups(
+    group: AsyncGroup, *, expected_zarr_version: Literal[2, 3]
+) -> int:
+    """
+    Find the first index that is not the path of a group in a group.
+
+    If the indices are not contiguous the result is an upper bound,
+    and is never lower than the first index that doesn't exist.
+    """
+    if group.metadata.consolidated_metadata is None and (
+        await _index_contains_node(group.store_path / "0") is not None
+    ):
+        # The listing of the store can be checked without reading anything
+        count = 0
+        while await _index_contains_node(group.store_path / str(count)):
+            count += 1
+        return count
+
+    async def exists(index: int) -> bool:
+        try:
+            await open_group_path(
+                group, str(index), expected_zarr_version=expected_zarr_version
+            )
+        except FileNotFoundError:
+            return False
+        return True
+
+    async def first_missing(indices: list[int]) -> tuple[int, int | None]:
+        # Returns the last index that exists before the first missing index,
+        # and the first missing index
+        found = -1
+        for index, index_exists in zip(
+            indices, await gather_in_order(*(exists(i) for i in indices)), strict=True
+        ):
+            if not index_exists:
+                return found, index
+            found = index
+        return found, None
+
+    # Check exponentially spaced indices (0, 1, 3, 7, 15...) until one is missing
+    low, high = -1, None
+    exponent = 0
+    while high is None:
+        exponents = range(exponent, exponent + _PROBES_PER_ROUND)
+        found, high = await first_missing([2**e - 1 for e in exponents])
+        low = max(low, found)
+        exponent += _PROBES_PER_ROUND
+    # Then narrow down the range between the last index found and the
+    # first missing index
+    while high - low > 1:
+        step = max(1, (high - low) // (_PROBES_PER_ROUND + 1))
+        indices = list(range(low + step, high, step))[:_PROBES_PER_ROUND]
+        found, missing = await first_missing(indices)
+        low = max(low, found)
+        if missing is not None:
+            high = missing
+    return high
+
+
+async def _open_once[NodeT: (AsyncGroup, AsyncArray[Any])](
+    key: NodeKey, open_node: Callable[[], Awaitable[NodeT]]
+) -> NodeT:
+    """
+    Open a node, or get it from the current read session if it is already open.
+
+    If opening the node raised an error, the same error is raised again.
+    Concurrent calls for the same node wait for the first one to finish.
+    """
+    session = _read_session.get()
+    if session is None:
+        return await open_node()
+    future = session.nodes.get(key)
+    if future is None:
+        future = asyncio.ensure_future(open_node())
+        session.nodes[key] = future
+    # Shield the shared future, so cancelling one caller doesn't cancel the others
+    node: NodeT = await asyncio.shield(future)
+    return node
+
+
+async def _index_contains_node(store_path: StorePath) -> bool | None:
+    """
+    Check if there is a node at a path, using the listing of a `ListingIndexStore`.
+
+    Returns `None` if the store doesn't have a listing for the path.
+    """
+    if isinstance(store_path.store, ListingIndexStore):
+        return await store_path.store.contains_node(store_path.path)
+    return None
+
+
+async def get_consolidated_node(
+    group: AsyncGroup, path: str
+) -> AsyncArray[Any] | AsyncGroup:
+    """
+    Get a node from the consolidated metadata of a group.
+
+    This does not read anything from the store.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the path isn't in the consolidated metadata.
+    """
+    try:
+        return await group.getitem(path)
+    except KeyError as e:
+        raise FileNotFoundError(f"No node found at {path}") from e
+
+
+MemberReader = Callable[[], Coroutine[Any, Any, Any]]
+"""
+Function that reads a single member of a group.
+
+When awaited, this returns an array specification or a group model, or `None`
+if the member is optional and does not exist.
+"""
+
+
+def build_members(
+    members: Mapping[str, Any], group_spec_cls: GroupSpecClass
+) -> dict[str, Any]:
+    """
+    Build the members of a group from members read at (possibly nested) paths.
+
+    This gives the same members as flattening every member with `to_flat()`
+    and then calling `group_spec_cls.from_flat()`, but the specifications that
+    have already been built are attached under their parents, instead of being
+    copied at every level of the hierarchy.
+
+    Parameters
+    ----------
+    members :
+        Mapping from paths to members read by a `MemberReader`. Members that
+        are `None` are left out.
+    group_spec_cls :
+        Class used for group members. Intermediate groups (e.g., the rows of
+        a plate) are created with no attributes.
+    """
+    tree: dict[str, Any] = {}
+    for path, member in members.items():
+        if member is None:
+            continue
+        *parent_names, name = path.strip("/").split("/")
+        level = tree
+        for parent_name in parent_names:
+            parent = level.get(parent_name)
+            if not isinstance(parent, _GroupNode):
+                parent = level[parent_name] = _GroupNode.from_spec(parent)
+            level = parent.members
+        spec = as_group_spec(member, group_spec_cls)
+        existing = level.get(name)
+        if isinstance(existing, _GroupNode):
+            # Members of this group were added before the group itself
+            existing.attributes = spec.attributes
+            existing.members = {**(spec.members or {}), **existing.members}
+        else:
+            level[name] = spec
+    return _finish_members(tree, group_spec_cls)
+
+
+def as_group_spec(member: Any, group_spec_cls: GroupSpecClass) -> Any:
+    """
+    Convert a group model to a plain group specification.
+
+    Array specifications, and group specifications that are already plain,
+    are returned as they are. The result is the same as
+    `group_spec_cls.from_flat(member.to_flat())`, except that attributes use
+    their JSON keys (e.g., `"image-label"`), as in the stored metadata. The
+    specification of an OME-Zarr group model is stored on the model, so it is
+    only made once.
+    """
+    if not _is_group_spec(member):
+        return member
+    if isinstance(member, BaseGroup):
+        specs = member._group_specs
+        if group_spec_cls not in specs:
+            specs[group_spec_cls] = as_plain_group_spec(member, group_spec_cls)
+        return specs[group_spec_cls]
+    return as_plain_group_spec(member, group_spec_cls)
+
+
+def as_plain_group_spec(member: Any, group_spec_cls: GroupSpecClass) -> Any:
+    """
+    Convert a group specification to a plain group specification.
+    """
+    members = _finish_members(member.members or {}, group_spec_cls)
+    attributes = member.attributes
+    if isinstance(attributes, BaseModel):
+        attributes = attributes.model_dump(by_alias=True)
+    if (
+        type(member) is group_spec_cls
+        and attributes is member.attributes
+        and member.members is not None
+        and list(members) == list(member.members)
+        and all(members[name] is member.members[name] for name in members)
+    ):
+        return member
+    return group_spec_cls(attributes=attributes, members=members)
+
+
+@dataclass
+class _GroupNode:
+    """
+    A group that is being built, which members can still be added to.
+    """
+
+    attributes: Any = field(default_factory=dict)
+    members: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_spec(cls, spec: Any) -> _GroupNode:
+        """
+        Start building a group from an existing group specification, if there is one.
+        """
+        if spec is None:
+            return cls()
+        return cls(attributes=spec.attributes, members=dict(spec.members or {}))
+
+
+def _finish_members(
+    members: Mapping[str, Any], group_spec_cls: GroupSpecClass
+) -> dict[str, Any]:
+    """
+    Convert all the members of a group to plain specifications.
+
+    As in `GroupSpec.from_flat()`, groups come before arrays.
+    """
+    finished = {}
+    for name, member in members.items():
+        if isinstance(member, _GroupNode):
+            finished[name] = group_spec_cls(
+                attributes=member.attributes,
+                members=_finish_members(member.members, group_spec_cls),
+            )
+        else:
+            finished[name] = as_group_spec(member, group_spec_cls)
+    return {
+        **{name: m for name, m in finished.items() if _is_group_spec(m)},
+        **{name: m for name, m in finished.items() if not _is_group_spec(m)},
+    }
+
+
+def _is_group_spec(member: Any) -> bool:
+    """
+    Check if a member is a group specification (and not an array specification).
+    """
+    # pydantic_zarr isn't imported in this module, because the order that
+    # pydantic_zarr.v2 and pydantic_zarr.v3 are imported in affects how
+    # forward references in the v0.4 group models are resolved
+    return hasattr(member, "members")
+
+
+class LazyMembers(Mapping[str, Any]):
+    """
+    Members of a group that are read from the store when they are first accessed.
+
+    Once read, members are stored and not read again. Iterating over the
+    members, or getting the number of members, reads all the members that
+    have not been read yet, concurrently.
+
+    Parameters
+    ----------
+    readers :
+        Mapping from member paths to functions that read the member.
+        Paths can contain several levels (e.g., ``"A/1"``) - intermediate
+        groups are created with no attributes, as in `GroupSpec.from_flat()`.
+    group_spec_cls :
+        Class used for intermediate groups, and for group members.
+    """
+
+    def __init__(
+        self,
+        readers: dict[str, MemberReader],
+        group_spec_cls: type[pydantic_zarr.v2.GroupSpec[Any, Any]]
+        | type[pydantic_zarr.v3.GroupSpec[Any, Any]],
+        *,
+        _prefix: str = "",
+        _loaded: dict[str, Any] | None = None,
+        _models: dict[str, Any] | None = None,
+        _on_loaded: list[Callable[[], None]] | None = None,
+    ) -> None:
+        self._readers = readers
+        self._group_spec_cls = group_spec_cls
+        self._prefix = _prefix
+        # Members are read in new read sessions, so keep the selection
+        self._selection = current_selection()
+        # Shared with the members of intermediate groups
+        self._loaded: dict[str, Any] = {} if _loaded is None else _loaded
+        # OME-Zarr models of the members that have been read, by path
+        self._models: dict[str, Any] = {} if _models is None else _models
+        # Checks of the group that are run once all the members have been read
+        self._pending_checks: tuple[str, ...] = ()
+        # Called after all the members have been read, until they succeed
+        self._on_loaded: list[Callable[[], None]] = (
+            [] if _on_loaded is None else _on_loaded
+        )
+        self._keys: dict[str, None] = {}
+        for path in readers:
+            if path.startswith(_prefix):
+                self._keys[path[len(_prefix) :].split("/", 1)[0]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        path = self._prefix + key
+        if path in self._readers:
+            if path not in self._loaded:
+                self._add_loaded(
+                    path, run_sync(self._readers[path](), selection=self._selection)
+                )
+            self._check_all_loaded()
+            member = self._loaded[path]
+            if member is None:
+                raise KeyError(key)
+            return member
+
+        # Intermediate group. This isn't checked for members here, so getting
+        # it doesn't read anything from the store.
+        members = LazyMembers(
+            self._readers,
+            self._group_spec_cls,
+            _prefix=path + "/",
+            _loaded=self._loaded,
+            _models=self._models,
+            _on_loaded=self._on_loaded,
+        )
+        return self._group_spec_cls.model_construct(attributes={}, members=members)
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_all()
+        for key in self._keys:
+            path = self._prefix + key
+            if path in self._readers:
+                if self._loaded[path] is not None:
+                    yield key
+            elif any(
+                loaded_path.startswith(path + "/") and member is not None
+                for loaded_path, member in self._loaded.items()
+            ):
+                # Intermediate groups are only included if they have members,
+                # as in GroupSpec.from_flat()
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        loaded = [
+            path[len(self._prefix) :]
+            for path in self._loaded
+            if path.startswith(self._prefix)
+        ]
+        return f"{type(self).__name__}(keys={list(self._keys)}, loaded={loaded})"
+
+    def _load_all(self) -> None:
+        """
+        Read all members under this group that have not been read yet.
+        """
+        paths = [
+            path
+            for path in self._readers
+            if path.startswith(self._prefix) and path not in self._loaded
+        ]
+        if paths:
+            members = run_sync(
+                gather_in_order(*(self._readers[path]() for path in paths)),
+                selection=self._selection,
+            )
+            for path, member in zip(paths, members, strict=True):
+                self._add_loaded(path, member)
+        self._check_all_loaded()
+
+    def _check_all_loaded(self) -> None:
+        """
+        Call the functions waiting for all the members to be read, if they have been.
+
+        If a function raises an error, it is called again on the next check,
+        so the error is raised every time the members are accessed.
+        """
+        if not self._on_loaded or len(self._loaded) < len(self._readers):
+            return
+        # Clear the functions while they are called, as they can access the
+        # members themselves
+        callbacks = list(self._on_loaded)
+        self._on_loaded.clear()
+        for index, callback in enumerate(callbacks):
+            try:
+                callback()
+            except BaseException:
+                self._on_loaded[:0] = callbacks[index:]
+                raise
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Read all the members, and return them as a normal dictionary.
+        """
+        self._load_all()
+        return build_members(
+            {
+                path[len(self._prefix) :]: member
+                for path, member in self._loaded.items()
+                if path.startswith(self._prefix)
+            },
+            self._group_spec_cls,
+        )
+
+    def loaded_models(self) -> dict[str, Any]:
+        """
+        Get the OME-Zarr models of the members that have been read so far, by path.
+        """
+        return {
+            path[len(self._prefix) :]: model
+            for path, model in self._models.items()
+            if path.startswith(self._prefix)
+        }
+
+    def _add_loaded(self, path: str, member: Any) -> None:
+        """
+        Store a member that has been read.
+
+        Group models are converted to plain group specifications, so lazily
+        read members are the same as members that are read straight away.
+        """
+        if isinstance(member, BaseGroup):
+            self._models[path] = member
+        self._loaded[path] = as_group_spec(member, self._group_spec_cls)
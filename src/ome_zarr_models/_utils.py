@@ -4,31 +4,41 @@ Private utilities.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import heapq
 import itertools
 from collections import Counter, defaultdict
+from collections.abc import Mapping
 from copy import deepcopy
 from dataclasses import MISSING, dataclass, fields, is_dataclass
-from functools import total_ordering
-from typing import TYPE_CHECKING, Any, Self, TypeVar
+from functools import partial, total_ordering
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar
 
 import pydantic
 import pydantic_zarr.v2
 import pydantic_zarr.v3
+import zarr
 from pydantic import create_model
-
-from ome_zarr_models.base import BaseAttrsv2, BaseAttrsv3
+from pydantic_core import to_jsonable_python
+from zarr.core.group import ConsolidatedMetadata
+from zarr.core.sync import sync
+
+from ome_zarr_models import _io
+from ome_zarr_models._hash import TreeHasher, _document_hash, _without_nulls
+from ome_zarr_models.base import BaseAttrsv2, BaseAttrsv3, BaseGroup
+from ome_zarr_models.cache import _invalidate_metadata_cache
 from ome_zarr_models.common.validation import (
-    check_array_path,
-    check_group_path,
+    _check_array_path_async,
 )
+from ome_zarr_models.exceptions import MetadataConflictError
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     import graphviz
-    import zarr
     from zarr.abc.store import Store
+    from zarr.core.common import JSON
 
     from ome_zarr_models.v04.base import BaseGroupv04
     from ome_zarr_models.v05.base import BaseGroupv05
@@ -41,154 +51,514 @@ if TYPE_CHECKING:
     )
 
 
-TBaseGroupv2 = TypeVar("TBaseGroupv2", bound="BaseGroupv04[Any]")
-TAttrsv2 = TypeVar("TAttrsv2", bound=BaseAttrsv2)
-
-
-def _from_zarr_v2(
-    group: zarr.Group,
+async def _from_zarr_v2_async[
+    TBaseGroupv2: BaseGroupv04[Any],
+    TAttrsv2: BaseAttrsv2,
+](
+    group: zarr.AsyncGroup,
     group_cls: type[TBaseGroupv2],
     attrs_cls: type[TAttrsv2],
+    *,
+    lazy: bool = False,
 ) -> TBaseGroupv2:
     """
-    Create a GroupSpec from a potentially unlistable Zarr group.
+    Create a v2 OME-Zarr group model from a potentially unlistable Zarr group.
 
     This uses methods on the attribute class to get required and optional
-    paths to ararys and groups, and then manually constructs the GroupSpec
-    from those paths.
+    paths to arrays and groups, reads all of these concurrently, and then
+    manually constructs the group from those paths.
 
     Parameters
     ----------
     group :
-        Zarr group to create GroupSpec from.
+        Zarr group to create the model from.
     group_cls :
         Class of the Group to return.
     attrs_cls :
         Attributes class.
+    lazy :
+        If `True`, don't read any members, and instead return a group
+        with members that are read on first access.
     """
-    # on unlistable storage backends, the members of this group will be {}
-    group_spec_in: pydantic_zarr.v2.AnyGroupSpec
-    group_spec_in = pydantic_zarr.v2.GroupSpec.from_zarr(group, depth=0)
-    attributes = attrs_cls.model_validate(group_spec_in.attributes)
-
-    members_tree_flat: dict[
-        str, pydantic_zarr.v2.AnyGroupSpec | pydantic_zarr.v2.AnyArraySpec
-    ] = {}
-
-    # Required array paths
-    for array_path in attrs_cls.get_array_paths(attributes):
-        array_spec = check_array_path(group, array_path, expected_zarr_version=2)
-        members_tree_flat["/" + array_path] = array_spec
-
-    # Optional array paths
-    for array_path in attrs_cls.get_optional_array_paths(attributes):
-        try:
-            array_spec = check_array_path(group, array_path, expected_zarr_version=2)
-        except ValueError:
-            continue
-        members_tree_flat["/" + array_path] = array_spec
-
-    # Required group paths
-    required_groups = attrs_cls.get_group_paths(attributes)
-    for group_path in required_groups:
-        check_group_path(group, group_path, expected_zarr_version=2)
-        group_flat = required_groups[group_path].from_zarr(group[group_path]).to_flat()  # type: ignore[arg-type]
-        for path in group_flat:
-            members_tree_flat["/" + group_path + path] = group_flat[path]
-
-    # Optional group paths
-    optional_groups = attrs_cls.get_optional_group_paths(attributes)
-    for group_path in optional_groups:
-        try:
-            check_group_path(group, group_path, expected_zarr_version=2)
-        except FileNotFoundError:
-            continue
-        group_flat = optional_groups[group_path].from_zarr(group[group_path]).to_flat()  # type: ignore[arg-type]
-        for path in group_flat:
-            members_tree_flat["/" + group_path + path] = group_flat[path]
-
-    members_normalized: pydantic_zarr.v2.AnyGroupSpec = (
-        pydantic_zarr.v2.GroupSpec.from_flat(members_tree_flat)
+    attributes = _io.interned(
+        attrs_cls, group.attrs, partial(attrs_cls.model_validate, group.attrs)
     )
-    return group_cls(members=members_normalized.members, attributes=attributes)
-
-
-TBaseGroupv3 = TypeVar("TBaseGroupv3", bound="BaseGroupv05[Any] | BaseGroupv06[Any]")
-TAttrsv3 = TypeVar("TAttrsv3", bound=BaseAttrsv3)
+    readers = _get_member_readers(group, attrs_cls, attributes, expected_zarr_version=2)
+    model: TBaseGroupv2
+    if lazy:
+        model = _io.defer_model_validators(  # type: ignore[assignment]
+            group_cls.model_construct(
+                attributes=attributes,
+                members=_io.LazyMembers(readers, pydantic_zarr.v2.GroupSpec),
+            )
+        )
+    else:
+        members_read, member_models = await _read_members_async(readers)
+        members = _io.build_members(members_read, pydantic_zarr.v2.GroupSpec)
+        model = _io.construct_with_members(
+            partial(group_cls, members=members, attributes=attributes),
+            members,
+            member_models,
+        )
+    _io.record_read_attributes(model, group)
+    return model
 
 
-def _from_zarr_v3(
-    group: zarr.Group,
+async def _from_zarr_v3_async[
+    TBaseGroupv3: BaseGroupv05[Any] | BaseGroupv06[Any],
+    TAttrsv3: BaseAttrsv3,
+](
+    group: zarr.AsyncGroup,
     group_cls: type[TBaseGroupv3],
     attrs_cls: type[TAttrsv3],
+    *,
+    lazy: bool = False,
 ) -> TBaseGroupv3:
     """
-    Create a GroupSpec from a potentially unlistable Zarr group.
+    Create a v3 OME-Zarr group model from a potentially unlistable Zarr group.
 
     This uses methods on the attribute class to get required and optional
-    paths to ararys and groups, and then manually constructs the GroupSpec
-    from those paths.
+    paths to arrays and groups, reads all of these concurrently, and then
+    manually constructs the group from those paths.
 
     Parameters
     ----------
     group :
-        Zarr group to create GroupSpec from.
+        Zarr group to create the model from.
     group_cls :
         Class of the Group to return.
     attrs_cls :
         Attributes class.
+    lazy :
+        If `True`, don't read any members, and instead return a group
+        with members that are read on first access.
     """
-    # on unlistable storage backends, the members of this group will be {}
-    group_spec_in: pydantic_zarr.v3.AnyGroupSpec
-    group_spec_in = pydantic_zarr.v3.GroupSpec.from_zarr(group, depth=0)
-    attrs_dict = group.attrs.asdict()
+    attrs_dict = dict(group.attrs)
     if "ome" not in attrs_dict:
         raise ValueError("Zarr group attributes does not contain an 'ome' key")
-    ome_attributes = attrs_cls.model_validate(attrs_dict["ome"])
+    ome_attributes = _io.interned(
+        attrs_cls,
+        attrs_dict["ome"],
+        partial(attrs_cls.model_validate, attrs_dict["ome"]),
+    )
+    readers = _get_member_readers(
+        group, attrs_cls, ome_attributes, expected_zarr_version=3
+    )
+    if lazy:
+        model = _construct_lazy(
+            group_cls, attrs_dict, _io.LazyMembers(readers, pydantic_zarr.v3.GroupSpec)
+        )
+    else:
+        members_read, member_models = await _read_members_async(readers)
+        members = _io.build_members(members_read, pydantic_zarr.v3.GroupSpec)
+        # Pass the OME attributes that have already been validated, so they are
+        # not validated again
+        model = _io.construct_with_members(  # type: ignore[assignment]
+            partial(
+                group_cls,
+                members=members,
+                attributes={**attrs_dict, "ome": ome_attributes},
+            ),
+            members,
+            member_models,
+        )
+    _io.record_read_attributes(model, group)
+    return model
 
-    members_tree_flat: dict[
-        str, pydantic_zarr.v3.AnyGroupSpec | pydantic_zarr.v3.AnyArraySpec
-    ] = {}
 
-    # Required array paths
-    for array_path in attrs_cls.get_array_paths(ome_attributes):
-        array_spec = check_array_path(group, array_path, expected_zarr_version=3)
-        members_tree_flat["/" + array_path] = array_spec
+def _get_member_readers(
+    group: zarr.AsyncGroup,
+    attrs_cls: type[BaseAttrsv2 | BaseAttrsv3],
+    attributes: BaseAttrsv2 | BaseAttrsv3,
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> dict[str, _io.MemberReader]:
+    """
+    Get functions to read all the members of a group that are given by its attributes.
 
-    # Optional array paths
-    for array_path in attrs_cls.get_optional_array_paths(ome_attributes):
+    Returns
+    -------
+    readers :
+        Mapping from member paths to functions that read the member.
+        Required arrays come first, followed by optional arrays, required groups,
+        and optional groups. Arrays and optional groups that are not in the
+        selection of the current read session are left out.
+    """
+    depth = _io.get_depth()
+
+    async def read_array(array_path: str, *, optional: bool) -> Any:
         try:
-            array_spec = check_array_path(group, array_path, expected_zarr_version=3)
+            return await _check_array_path_async(
+                group, array_path, expected_zarr_version=expected_zarr_version
+            )
         except ValueError:
-            continue
-        members_tree_flat["/" + array_path] = array_spec
-
-    # Required group paths
-    required_groups = attrs_cls.get_group_paths(ome_attributes)
-    for group_path in required_groups:
-        check_group_path(group, group_path, expected_zarr_version=3)
-        group_flat = required_groups[group_path].from_zarr(group[group_path]).to_flat()  # type: ignore[arg-type]
-        for path in group_flat:
-            members_tree_flat["/" + group_path + path] = group_flat[path]
-
-    # Optional group paths
-    optional_groups = attrs_cls.get_optional_group_paths(ome_attributes)
-    for group_path in optional_groups:
+            if optional:
+                return None
+            raise
+
+    async def read_group(
+        group_path: str, member_cls: type[Any], *, optional: bool
+    ) -> Any:
+        model = _io.previous_model(
+            member_cls, f"{group.path}/{group_path}" if group.path else group_path
+        )
+        if model is not None:
+            return model
         try:
-            check_group_path(group, group_path, expected_zarr_version=3)
+            member_group = await _io.open_group_path(
+                group, group_path, expected_zarr_version=expected_zarr_version
+            )
         except FileNotFoundError:
+            if optional:
+                return None
+            raise
+        with _io.at_depth(depth + _io.path_depth(group_path)):
+            return await _group_from_zarr_async(member_cls, member_group)
+
+    readers: dict[str, _io.MemberReader] = {}
+    if _io.arrays_selected():
+        for array_path in attrs_cls.get_array_paths(attributes):  # type: ignore[arg-type]
+            readers[array_path] = partial(read_array, array_path, optional=False)
+        for array_path in attrs_cls.get_optional_array_paths(attributes):  # type: ignore[arg-type]
+            readers[array_path] = partial(read_array, array_path, optional=True)
+    for group_path, member_cls in attrs_cls.get_group_paths(
+        attributes  # type: ignore[arg-type]
+    ).items():
+        readers[group_path] = partial(
+            read_group, group_path, member_cls, optional=False
+        )
+    for group_path, member_cls in attrs_cls.get_optional_group_paths(
+        attributes  # type: ignore[arg-type]
+    ).items():
+        if _io.is_selected(group_path, member_cls):
+            readers[group_path] = partial(
+                read_group, group_path, member_cls, optional=True
+            )
+    return readers
+
+
+async def _read_members_async(
+    readers: dict[str, _io.MemberReader],
+) -> tuple[dict[str, Any], dict[str, BaseGroup]]:
+    """
+    Read members of a group concurrently.
+
+    If there are errors, the error that is raised is the same as if the members
+    were read one after another.
+
+    Returns
+    -------
+    members :
+        Mapping from paths to the members that were read. Members that are
+        optional and don't exist are `None`. These can be passed to
+        `_io.build_members()`.
+    member_models :
+        Mapping from paths to the OME-Zarr models of member groups.
+        These can be passed to `_io.construct_with_members()`, so the
+        members are not validated again.
+    """
+    results = await _io.gather_in_order(*(reader() for reader in readers.values()))
+    members = dict(zip(readers, results, strict=True))
+    member_models = {
+        path: member
+        for path, member in members.items()
+        if isinstance(member, BaseGroup)
+    }
+    return members, member_models
+
+
+async def _group_from_zarr_async(group_cls: type[Any], group: zarr.AsyncGroup) -> Any:
+    """
+    Create a group model from a Zarr group, using an asynchronous
+    `_from_zarr_async()` method if the group class has one.
+
+    If the group has not changed since an earlier load, the model from that
+    load is returned (see `_io.reusing_models()`).
+    """
+    model = _io.previous_model(group_cls, group.path)
+    if model is not None:
+        return model
+    if hasattr(group_cls, "_from_zarr_async"):
+        return await group_cls._from_zarr_async(group)
+    return await asyncio.to_thread(group_cls.from_zarr, zarr.Group(group))
+
+
+def _construct_lazy[TBaseGroupv3: BaseGroupv05[Any] | BaseGroupv06[Any]](
+    group_cls: type[TBaseGroupv3], attributes: dict[str, Any], members: _io.LazyMembers
+) -> TBaseGroupv3:
+    """
+    Create a v3 group with lazy members.
+
+    The attributes are validated, but validators that check the members of the
+    group are run once all the members have been read.
+    """
+    attributes_cls = group_cls.model_fields["attributes"].annotation
+    return _io.defer_model_validators(  # type: ignore[return-value]
+        group_cls.model_construct(
+            attributes=attributes_cls.model_validate(attributes),  # type: ignore[union-attr]
+            members=members,
+        )
+    )
+
+
+def _write_consolidated_metadata(
+    group_spec: pydantic_zarr.v2.GroupSpec[Any, Any]
+    | pydantic_zarr.v3.GroupSpec[Any, Any],
+    group: zarr.Group,
+) -> zarr.Group:
+    """
+    Write consolidated metadata for a hierarchy to a Zarr group.
+
+    The consolidated metadata is created from the members of *group_spec*
+    instead of crawling the store, so only nodes that are part of the
+    specification are included.
+
+    Parameters
+    ----------
+    group_spec :
+        Specification of the whole hierarchy below *group*.
+    group :
+        Zarr group to write consolidated metadata to.
+
+    Returns
+    -------
+    group :
+        The Zarr group, with consolidated metadata set.
+    """
+    flat_metadata: dict[str, JSON] = {}
+    for path, node in group_spec.to_flat().items():
+        if path == "":
             continue
-        group_flat = optional_groups[group_path].from_zarr(group[group_path]).to_flat()  # type: ignore[arg-type]
-        for path in group_flat:
-            members_tree_flat["/" + group_path + path] = group_flat[path]
-
-    members_normalized: pydantic_zarr.v3.AnyGroupSpec
-    members_normalized = pydantic_zarr.v3.GroupSpec.from_flat(members_tree_flat)
-    return group_cls(  # type: ignore[return-value]
-        members=members_normalized.members, attributes=group_spec_in.attributes
+        node_metadata = node.model_dump(mode="json", exclude={"members"})
+        if isinstance(node, pydantic_zarr.v2.GroupSpec | pydantic_zarr.v3.GroupSpec):
+            # Be explicit about groups that don't have any children
+            node_metadata["consolidated_metadata"] = {
+                "kind": "inline",
+                "must_understand": False,
+                "metadata": {},
+            }
+        flat_metadata[path.lstrip("/")] = node_metadata
+
+    consolidated_metadata = ConsolidatedMetadata.from_dict(
+        {"kind": "inline", "must_understand": False, "metadata": flat_metadata}
+    )
+    async_group = dataclasses.replace(
+        group._async_group,
+        metadata=dataclasses.replace(
+            group.metadata, consolidated_metadata=consolidated_metadata
+        ),
+    )
+    sync(async_group._save_metadata())
+    return zarr.Group(async_group)
+
+
+def _write_changed_metadata(
+    old: BaseGroup, new: BaseGroup, store: Store, path: str
+) -> list[str]:
+    """
+    Write the metadata documents of a hierarchy that have changed.
+
+    Group attributes are only written if they are different in *new* and
+    *old*, and only if the attributes in the store are still the same as when
+    *old* was read. Groups and arrays that are not in *old* are created. Keys
+    with `null` values are left out of the attributes that are written. If the
+    group has consolidated metadata, it is re-written.
+
+    Parameters
+    ----------
+    old :
+        The hierarchy as it was read from the store.
+    new :
+        The updated hierarchy.
+    store :
+        Store to write to.
+    path :
+        Path to the group within the store.
+
+    Returns
+    -------
+    paths :
+        Paths of the groups and arrays that were written.
+
+    Raises
+    ------
+    MetadataConflictError
+        If a document that needs to be written has been changed in the store
+        since *old* was read.
+    ValueError
+        If the metadata of an array, or the type of a node, has changed.
+    """
+    written: list[str] = []
+    _write_changed_node(
+        old,
+        new,
+        store,
+        path,
+        hasher=TreeHasher(),
+        written=written,
+        old_root=old,
+        member_path="",
+    )
+    if written:
+        _invalidate_metadata_cache(store, path)
+        group = zarr.open_group(store, path=path, mode="r+")
+        if group.metadata.consolidated_metadata is not None:
+            _write_consolidated_metadata(new, group)  # type: ignore[arg-type]
+    return written
+
+
+def _write_changed_node(
+    old: Any,
+    new: Any,
+    store: Store,
+    path: str,
+    *,
+    hasher: TreeHasher,
+    written: list[str],
+    old_root: BaseGroup,
+    member_path: str,
+) -> None:
+    """
+    Write the metadata documents of a node, and its members, that have changed.
+
+    *member_path* is the path of the node in *old_root*, the hierarchy that
+    *old* is part of.
+    """
+    if old is None:
+        try:
+            zarr.open(store=store, path=path, mode="r", zarr_format=new.zarr_format)
+        except FileNotFoundError:
+            _without_null_attributes(new).to_zarr(store, path)
+            written.append(path)
+            return
+        raise MetadataConflictError(
+            f"A group or array has been created at '{path}' since the metadata was read"
+        )
+    if hasher.hash(old) == hasher.hash(new):
+        return
+    if not _io._is_group_spec(old) or not _io._is_group_spec(new):
+        raise ValueError(
+            f"The metadata of the array at '{path}' has changed. Only group "
+            "attributes can be updated in place - use to_zarr(overwrite=True) "
+            "to re-write the hierarchy."
+        )
+
+    old_attributes = old.model_dump(by_alias=True, exclude={"members"})["attributes"]
+    new_attributes = new.model_dump(by_alias=True, exclude={"members"})["attributes"]
+    if to_jsonable_python(old_attributes) != to_jsonable_python(new_attributes):
+        group = zarr.open_group(
+            store, path=path, mode="r+", zarr_format=new.zarr_format
+        )
+        read_hash = _read_attributes_hash(old_root, member_path)
+        if read_hash is None:
+            # Not read from a store, so compare with the attributes of the model
+            changed = _without_nulls(group.attrs.asdict()) != _without_nulls(
+                old_attributes
+            )
+        else:
+            changed = _document_hash(group.attrs.asdict()) != read_hash
+        if changed:
+            raise MetadataConflictError(
+                f"The attributes of the group at '{path}' have changed since "
+                "the metadata was read"
+            )
+        group.attrs.put(_without_nulls(new_attributes))
+        written.append(path)
+
+    old_members = old.members or {}
+    for name, member in (new.members or {}).items():
+        _write_changed_node(
+            old_members.get(name),
+            member,
+            store,
+            f"{path}/{name}" if path else name,
+            hasher=hasher,
+            written=written,
+            old_root=old_root,
+            member_path=f"{member_path}/{name}" if member_path else name,
+        )
+
+
+def _without_null_attributes(node: Any) -> Any:
+    """
+    Copy a group specification, leaving out keys with `null` values from the
+    attributes of all its groups.
+
+    Array specifications are returned as they are.
+    """
+    if not _io._is_group_spec(node):
+        return node
+    return type(node)(
+        attributes=_without_nulls(node.attributes),
+        members={
+            name: _without_null_attributes(member)
+            for name, member in (node.members or {}).items()
+        },
     )
 
 
+def _read_attributes_hash(group: BaseGroup, path: str) -> bytes | None:
+    """
+    Get the hash of the attributes document that a group in a hierarchy was read from.
+
+    Parameters
+    ----------
+    group :
+        Root group of the hierarchy.
+    path :
+        Path of the group in the hierarchy.
+
+    Returns
+    -------
+    hash :
+        Hash of the attributes document, or `None` if the group was not read
+        from a store (e.g., it was created or replaced after the hierarchy was
+        read, or it is an intermediate group with no model).
+    """
+    model: Any = group
+    while path:
+        for model_path, member in _read_member_models(model).items():
+            if path == model_path or path.startswith(f"{model_path}/"):
+                model, path = member, path[len(model_path) + 1 :]
+                break
+        else:
+            return None
+    return model._read_attributes_hash if isinstance(model, BaseGroup) else None
+
+
+def _read_member_models(group: BaseGroup) -> dict[str, BaseGroup]:
+    """
+    Get the models of the member groups of a group that are still its members.
+    """
+    members = group.members  # type: ignore[attr-defined]
+    models = {
+        path: model
+        for path, (spec, model) in group._member_models.items()
+        if _io.get_member_spec(members, path) is spec
+    }
+    if isinstance(members, _io.LazyMembers):
+        models = {**members.loaded_models(), **models}
+    return models
+
+
+def _merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Apply a JSON merge patch (RFC 7386) to a JSON value.
+
+    Keys in *patch* replace the same keys in *target*, apart from objects,
+    which are merged, and `None`, which removes the key.
+    """
+    if not isinstance(patch, Mapping):
+        return patch
+    merged = dict(target) if isinstance(target, Mapping) else {}
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = _merge_patch(merged.get(key), value)
+    return merged
+
+
 def get_store_path(store: Store) -> str:
     """
     Get a path from a zarr store
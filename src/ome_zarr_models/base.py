@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal, Self
 
 from pydantic import BaseModel, ConfigDict
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     import pydantic_zarr.v2
     import pydantic_zarr.v3
+    from zarr.abc.store import Store
 
 
 class BaseAttrs(BaseModel):
@@ -128,3 +132,163 @@ class BaseGroup(ABC):
         OME attributes.
         """
         raise NotImplementedError
+
+    @property
+    def skipped_checks(self) -> tuple[str, ...]:
+        """
+        Checks that were not run when this group was loaded.
+
+        Checks are skipped if the metadata they need was not read (e.g., checks
+        on arrays when loading with `Selection(include_arrays=False)`).
+        Checks of groups loaded with `lazy=True` that need their members are
+        skipped until all the members have been read.
+        Each check is given as `"<class name>.<check name>"`.
+        """
+        skipped_checks: tuple[str, ...] = getattr(self, "_skipped_checks", ())
+        # Set on lazy members by `_io.defer_model_validators()`
+        pending_checks = getattr(getattr(self, "members", None), "_pending_checks", ())
+        if pending_checks:
+            return tuple(sorted({*skipped_checks, *pending_checks}))
+        return skipped_checks
+
+    def content_hash(self) -> str:
+        """
+        Get a hash of the metadata of this group, and of all its members.
+
+        The hash is the root of a Merkle tree: the hash of each group or array
+        is computed from its own metadata (attributes, and array metadata),
+        and the names and hashes of its members. Two hierarchies have the same
+        hash if their metadata is the same, regardless of the order that keys
+        were written in, or where they are stored. The hash does not depend on
+        any array data.
+
+        If this group was loaded with `lazy=True`, any members that have not
+        been read yet are read first.
+
+        Returns
+        -------
+        hash :
+            Hexadecimal SHA-256 hash.
+        """
+        from ome_zarr_models._hash import TreeHasher
+
+        return TreeHasher().hash(self).hex()
+
+    def update_attributes(
+        self, store: Store, patch: Mapping[str, Any], *, path: str = ""
+    ) -> Self:
+        """
+        Update the attributes of this group, and write them to a Zarr store.
+
+        The whole group (including its members) is validated with the new
+        attributes before anything is written. Only the metadata document of
+        this group is re-written, and only if the attributes have changed.
+
+        The write is conditional: if the attributes in the store are not the
+        same as the attributes of this group (e.g., because they have been
+        updated by someone else since this group was read), nothing is
+        written. This check is not atomic, so concurrent updates can still
+        overwrite each other if they happen at the same time.
+
+        Parameters
+        ----------
+        store :
+            Store that this group was read from.
+        patch :
+            Changes to the Zarr attributes of this group, as a JSON merge patch
+            (RFC 7386). Objects in the patch are merged with the existing
+            attributes, keys that are `None` are removed, and any other values
+            (including lists) replace the existing value. For example, for an
+            OME-Zarr 0.5 image, `{"ome": {"omero": new_omero}}` replaces the
+            omero metadata.
+        path :
+            Path to this group within the store.
+
+        Returns
+        -------
+        group :
+            The updated group.
+
+        Raises
+        ------
+        MetadataConflictError
+            If the attributes of the group in the store have changed since this
+            group was read.
+        """
+        from ome_zarr_models import _io
+        from ome_zarr_models._utils import _merge_patch, _write_changed_metadata
+
+        attributes = self.model_dump(  # type: ignore[attr-defined]
+            by_alias=True, exclude={"members"}
+        )["attributes"]
+        members = self.members  # type: ignore[attr-defined]
+        updated = _io.construct_with_members(
+            functools.partial(
+                type(self),  # type: ignore[call-arg]
+                attributes=_merge_patch(attributes, patch),
+                members=members,
+            ),
+            members,
+            {
+                member_path: model
+                for member_path, (_, model) in self._member_models.items()
+            },
+        )
+        _write_changed_metadata(self, updated, store, path)
+        return updated
+
+    @functools.cached_property
+    def _member_models(self) -> dict[str, tuple[Any, Any]]:
+        """
+        Validated models of member groups, and the specification each was made from.
+
+        This is filled in by `_io.member_model()`. It is not a field, so it is
+        not serialized or compared.
+        """
+        return {}
+
+    @functools.cached_property
+    def _group_specs(self) -> dict[Any, Any]:
+        """
+        Plain group specifications of this group, by specification class.
+
+        This is filled in by `_io.as_group_spec()`. It is not a field, so it is
+        not serialized or compared.
+        """
+        return {}
+
+    @functools.cached_property
+    def _read_attributes_hash(self) -> bytes | None:
+        """
+        Hash of the attributes document this group was read from.
+
+        This is set by `_io.record_read_attributes()`, and is `None` if the
+        group was not read from a store. It is not a field, so it is not
+        serialized or compared.
+        """
+        return None
+
+    def __copy__(self) -> Self:
+        """
+        Make a shallow copy of this group, without the cached group specifications.
+
+        Cached properties are stored in the instance `__dict__`, which pydantic
+        copies along with the fields. Copies made by `model_copy(update=...)`
+        can have different fields, so they must not share these caches.
+        """
+        copied = super().__copy__()  # type: ignore[misc]
+        copied.__dict__.pop("_group_specs", None)
+        if "_member_models" in self.__dict__:
+            # Models are only re-used while their specification is the same
+            # object, so the entries are still valid for the copy
+            copied.__dict__["_member_models"] = dict(self._member_models)
+        return copied  # type: ignore[no-any-return]
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        """
+        Make a deep copy of this group, without the cached models and specifications.
+        """
+        copied = super().__deepcopy__(memo)  # type: ignore[misc]
+        copied.__dict__.pop("_group_specs", None)
+        copied.__dict__.pop("_member_models", None)
+        return copied  # type: ignore[no-any-return]
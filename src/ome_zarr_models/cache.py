@@ -0,0 +1,575 @@
+"""
+Caching of Zarr metadata that is read when loading OME-Zarr groups.
+
+By default no metadata is cached. To turn on caching, set a cache with
+[set_metadata_cache][ome_zarr_models.cache.set_metadata_cache]:
+
+```python
+from ome_zarr_models.cache import LRUMetadataCache, set_metadata_cache
+
+set_metadata_cache(LRUMetadataCache(maxsize=4096, ttl=60))
+```
+
+After this, every Zarr group or array that is read when loading an OME-Zarr
+group is stored in the cache, and re-used the next time the same group or
+array is loaded.
+Metadata from in-memory stores is not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from zarr.abc.store import Store
+from zarr.storage import FsspecStore, LocalStore, MemoryStore, WrapperStore
+
+if TYPE_CHECKING:
+    from zarr.abc.store import ByteRequest
+    from zarr.core.buffer import Buffer, BufferPrototype
+    from zarr.core.group import GroupMetadata
+    from zarr.core.metadata import ArrayMetadata
+    from zarr.storage import StorePath
+
+__all__ = [
+    "CacheKey",
+    "DiskMetadataCacheStore",
+    "LRUMetadataCache",
+    "ListingIndexStore",
+    "MetadataCache",
+    "get_metadata_cache",
+    "set_metadata_cache",
+]
+
+CacheKey = tuple[str, str]
+"""
+Key of a cache entry.
+
+This is a tuple of the store identity (the string representation of the store,
+e.g., `"file:///path/to/data"`), and the path of the node within the store.
+"""
+
+
+class MetadataCache(ABC):
+    """
+    Base class for caches of Zarr node metadata.
+
+    To create a custom cache, subclass this class and implement all the
+    abstract methods. Implementations must be safe to use from several threads.
+    """
+
+    @abstractmethod
+    def get(self, key: CacheKey) -> ArrayMetadata | GroupMetadata | None:
+        """
+        Get metadata from the cache.
+
+        Returns
+        -------
+        metadata :
+            Cached metadata, or `None` if there is no metadata stored for *key*.
+        """
+
+    @abstractmethod
+    def set(self, key: CacheKey, metadata: ArrayMetadata | GroupMetadata) -> None:
+        """
+        Store metadata in the cache.
+        """
+
+    @abstractmethod
+    def invalidate(self, store: str, path: str = "") -> None:
+        """
+        Remove all metadata for a node and its children from the cache.
+
+        Parameters
+        ----------
+        store :
+            Store identity.
+        path :
+            Path to the node within the store. If `""`, all metadata
+            for the store is removed.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all metadata from the cache.
+        """
+
+
+class LRUMetadataCache(MetadataCache):
+    """
+    In-memory least recently used (LRU) cache of Zarr node metadata.
+
+    Parameters
+    ----------
+    maxsize :
+        Maximum number of nodes to store metadata for. When the cache is full
+        the least recently used metadata is removed.
+    ttl :
+        Time to live of cache entries in seconds. Entries that are older than
+        this are not used, and read again from the store instead. If `None`,
+        entries do not expire.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1 (got {maxsize})")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be greater than 0 (got {ttl})")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        """Number of times metadata was found in the cache."""
+        self.misses = 0
+        """Number of times metadata was not found in the cache."""
+        self._entries: OrderedDict[
+            CacheKey, tuple[ArrayMetadata | GroupMetadata, float]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Number of nodes that metadata is stored for.
+        """
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: CacheKey) -> ArrayMetadata | GroupMetadata | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry[1]):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: CacheKey, metadata: ArrayMetadata | GroupMetadata) -> None:
+        with self._lock:
+            self._entries[key] = (metadata, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, store: str, path: str = "") -> None:
+        path = path.strip("/")
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == store and (
+                    path == "" or key[1] == path or key[1].startswith(path + "/")
+                ):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _is_expired(self, timestamp: float) -> bool:
+        return self.ttl is not None and time.monotonic() - timestamp > self.ttl
+
+
+_metadata_cache: MetadataCache | None = None
+
+
+def get_metadata_cache() -> MetadataCache | None:
+    """
+    Get the metadata cache used when loading OME-Zarr groups.
+
+    Returns `None` if caching is turned off.
+    """
+    return _metadata_cache
+
+
+def set_metadata_cache(cache: MetadataCache | None) -> None:
+    """
+    Set the metadata cache used when loading OME-Zarr groups.
+
+    Parameters
+    ----------
+    cache :
+        Cache to use. Pass `None` to turn off caching.
+    """
+    global _metadata_cache
+    _metadata_cache = cache
+
+
+def _get_store_metadata_cache(store: Store) -> MetadataCache | None:
+    """
+    Get the metadata cache to use for a store.
+
+    Returns `None` if metadata from the store should not be cached. In-memory
+    stores are identified by the id of the dictionary that holds their
+    contents, which can be re-used by a different store once the dictionary
+    has been garbage collected, so they are never cached.
+    """
+    while isinstance(store, WrapperStore):
+        store = store._store
+    if isinstance(store, MemoryStore):
+        return None
+    return _metadata_cache
+
+
+def _get_cache_key(store_path: StorePath) -> CacheKey:
+    """
+    Get the cache key for a node in a store.
+    """
+    return (str(store_path.store), store_path.path)
+
+
+def _invalidate_metadata_cache(store: Store, path: str) -> None:
+    """
+    Remove a node and its children from the metadata cache, if there is one.
+    """
+    if _metadata_cache is not None:
+        _metadata_cache.invalidate(str(store), path)
+
+
+_METADATA_KEYS = frozenset({"zarr.json", ".zgroup", ".zarray", ".zattrs", ".zmetadata"})
+
+
+class DiskMetadataCacheStore(WrapperStore[Store]):
+    """
+    A store that keeps a copy of Zarr metadata documents in a local directory.
+
+    This wraps another (usually remote) store. Only metadata documents
+    (`zarr.json`, `.zgroup`, `.zarray`, `.zattrs` and `.zmetadata`) are
+    cached - array chunks are always read from the wrapped store.
+
+    Alongside each cached document, revalidation information from the wrapped
+    store (ETag, last modified time, and size) is saved. When a cached document
+    is older than *max_age*, this information is fetched again, and the
+    document is only downloaded again if it has changed. Documents that don't
+    exist in the wrapped store (e.g., Zarr v2 documents of a Zarr v3 group)
+    are also cached, so they are not requested again.
+
+    Parameters
+    ----------
+    store :
+        Store to wrap.
+    cache_dir :
+        Directory to store cached metadata in. This is created if it does not
+        exist, and can be shared between several stores.
+    max_age :
+        Time in seconds for which cached documents are used without checking
+        if they have changed in the wrapped store.
+
+    Examples
+    --------
+    ```python
+    import zarr
+    from zarr.storage import FsspecStore
+
+    from ome_zarr_models import open_ome_zarr
+    from ome_zarr_models.cache import DiskMetadataCacheStore
+
+    store = DiskMetadataCacheStore(
+        FsspecStore.from_url("https://example.com/image.ome.zarr", read_only=True),
+        cache_dir="~/.cache/ome-zarr-models",
+    )
+    ome_zarr_group = open_ome_zarr(zarr.open_group(store, mode="r"))
+    ```
+    """
+
+    def __init__(
+        self, store: Store, cache_dir: str | Path, *, max_age: float = 0
+    ) -> None:
+        super().__init__(store)
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_age = max_age
+        store_hash = hashlib.sha256(str(store).encode()).hexdigest()[:32]
+        self._store_cache_dir = self.cache_dir / store_hash
+
+    def _with_store(self, store: Store) -> Self:
+        return type(self)(store, self.cache_dir, max_age=self.max_age)
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        if byte_range is not None or key.rsplit("/", 1)[-1] not in _METADATA_KEYS:
+            return await self._store.get(key, prototype, byte_range)
+
+        # Files are read and written in other threads, so the event loop
+        # is not blocked while other documents are being read concurrently
+        data_path = self._store_cache_dir / key
+        info_path = data_path.with_name(data_path.name + ".info.json")
+        cached = await asyncio.to_thread(_read_cached, data_path, info_path)
+        validators: dict[str, Any] | None = None
+        if cached is not None:
+            cached_info, cached_data = cached
+            fresh = time.time() - cached_info["checked"] <= self.max_age
+            if not fresh:
+                validators = await self._get_validators(key)
+                if validators is None:
+                    # The document doesn't exist
+                    fresh = cached_data is None
+                else:
+                    fresh = validators == cached_info["validators"]
+                if fresh:
+                    cached_info["checked"] = time.time()
+                    await asyncio.to_thread(
+                        _write_atomic, info_path, json.dumps(cached_info).encode()
+                    )
+            if fresh:
+                # Documents that are cached as missing have no data
+                if cached_data is None:
+                    return None
+                return prototype.buffer.from_bytes(cached_data)
+
+        # The validators are fetched before the document (or re-used from the
+        # check above). If the document changes in between, they describe an
+        # older version, so it is downloaded again the next time it is checked,
+        # instead of a stale copy being kept.
+        if cached is None:
+            validators = await self._get_validators(key)
+        value = await self._store.get(key, prototype)
+        await asyncio.to_thread(
+            _write_cached,
+            data_path,
+            info_path,
+            None if value is None else value.to_bytes(),
+            {"checked": time.time(), "validators": validators},
+        )
+        return value
+
+    async def set(self, key: str, value: Buffer) -> None:
+        await self._store.set(key, value)
+        await asyncio.to_thread(self._remove_cached, key)
+
+    async def delete(self, key: str) -> None:
+        await self._store.delete(key)
+        await asyncio.to_thread(self._remove_cached, key)
+
+    def _remove_cached(self, key: str) -> None:
+        data_path = self._store_cache_dir / key
+        data_path.unlink(missing_ok=True)
+        data_path.with_name(data_path.name + ".info.json").unlink(missing_ok=True)
+
+    async def _get_validators(self, key: str) -> dict[str, Any] | None:
+        """
+        Get information used to check if a document in the wrapped store has changed.
+
+        Returns `None` if the document does not exist.
+        """
+        store = self._store
+        if isinstance(store, FsspecStore):
+            try:
+                info = await store.fs._info(f"{store.path.rstrip('/')}/{key}")
+            except (FileNotFoundError, OSError):
+                return None
+            return {
+                name: str(info[name])
+                for name in ("ETag", "etag", "LastModified", "last_modified", "mtime")
+                if name in info
+            } | {"size": info.get("size")}
+        elif isinstance(store, LocalStore):
+            try:
+                stat = await asyncio.to_thread((store.root / key).stat)
+            except FileNotFoundError:
+                return None
+            return {"mtime": str(stat.st_mtime_ns), "size": stat.st_size}
+        else:
+            size = await store.getsize(key) if await store.exists(key) else None
+            return None if size is None else {"size": size}
+
+
+class ListingIndexStore(WrapperStore[Store]):
+    """
+    A store that lists the keys of another store once, to avoid requests for
+    metadata documents that do not exist.
+
+    Loading an OME-Zarr group checks for a lot of nodes that might not exist
+    (e.g., optional labels groups, wells that were not imaged, or the images
+    of a bioformats2raw group). With this store, the metadata documents in
+    the wrapped store are listed the first time one is requested.
+    After that, requests for metadata documents that are not in the listing
+    are answered without a round trip to the wrapped store.
+    Array chunks, and metadata documents that are in the listing, are always
+    read from the wrapped store.
+
+    The wrapped store must support listing. Listing returns every key in the
+    store, including array chunks, so this is best suited to stores where
+    listing is fast compared to individual requests (e.g., remote object
+    stores).
+
+    Parameters
+    ----------
+    store :
+        Store to wrap.
+    prefix :
+        Only list keys below this path. Requests for keys outside this path
+        are always passed to the wrapped store.
+
+    Examples
+    --------
+    ```python
+    import zarr
+    from zarr.storage import FsspecStore
+
+    from ome_zarr_models import open_ome_zarr
+    from ome_zarr_models.cache import ListingIndexStore
+
+    store = ListingIndexStore(
+        FsspecStore.from_url("s3://bucket/plate.ome.zarr", read_only=True)
+    )
+    ome_zarr_group = open_ome_zarr(zarr.open_group(store, mode="r"))
+    ```
+    """
+
+    def __init__(self, store: Store, *, prefix: str = "") -> None:
+        if not store.supports_listing:
+            raise ValueError(f"{store} does not support listing")
+        super().__init__(store)
+        self.prefix = prefix.strip("/")
+        self._index: set[str] | None = None
+        self._listing: asyncio.Future[set[str]] | None = None
+
+    def _with_store(self, store: Store) -> Self:
+        return type(self)(store, prefix=self.prefix)
+
+    def _is_indexed(self, key: str) -> bool:
+        """
+        Check if a key is a metadata document below the listed prefix.
+        """
+        return key.rsplit("/", 1)[-1] in _METADATA_KEYS and (
+            self.prefix == "" or key.startswith(self.prefix + "/")
+        )
+
+    async def _get_index(self) -> set[str]:
+        """
+        Get the keys of all the metadata documents below the listed prefix.
+
+        The wrapped store is only listed once, even if this is called
+        concurrently.
+        """
+        if self._index is None:
+            if self._listing is None:
+                self._listing = asyncio.ensure_future(self._list_metadata_keys())
+            self._index = await self._listing
+        return self._index
+
+    async def _list_metadata_keys(self) -> set[str]:
+        prefix = "" if self.prefix == "" else self.prefix + "/"
+        return {
+            key
+            async for key in self._store.list_prefix(prefix)
+            if key.rsplit("/", 1)[-1] in _METADATA_KEYS
+        }
+
+    async def contains_node(self, path: str) -> bool | None:
+        """
+        Check if there is a group or array at a path, using the listing.
+
+        Returns
+        -------
+        contains_node :
+            Whether there is a group or array at *path*, or `None` if *path*
+            is not below the listed prefix.
+        """
+        path = path.strip("/")
+        keys = [
+            f"{path}/{name}" if path else name
+            for name in ("zarr.json", ".zgroup", ".zarray")
+        ]
+        if not self._is_indexed(keys[0]):
+            return None
+        index = await self._get_index()
+        return any(key in index for key in keys)
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        if self._is_indexed(key) and key not in await self._get_index():
+            return None
+        return await self._store.get(key, prototype, byte_range)
+
+    async def exists(self, key: str) -> bool:
+        if self._is_indexed(key):
+            return key in await self._get_index()
+        return await self._store.exists(key)
+
+    async def set(self, key: str, value: Buffer) -> None:
+        await self._store.set(key, value)
+        if self._index is not None and self._is_indexed(key):
+            self._index.add(key)
+
+    async def delete(self, key: str) -> None:
+        await self._store.delete(key)
+        if self._index is not None:
+            self._index.discard(key)
+
+
+def _read_cached(
+    data_path: Path, info_path: Path
+) -> tuple[dict[str, Any], bytes | None] | None:
+    """
+    Read a cached document, and its revalidation information.
+
+    Returns `None` if the document is not cached. The data is `None` if the
+    document is cached as not existing in the wrapped store.
+    """
+    try:
+        info = json.loads(info_path.read_text())
+    except FileNotFoundError:
+        return None
+    try:
+        data = data_path.read_bytes()
+    except FileNotFoundError:
+        if info["validators"] is not None:
+            # The document exists, but its data has been removed
+            return None
+        data = None
+    return info, data
+
+
+def _write_cached(
+    data_path: Path, info_path: Path, data: bytes | None, info: dict[str, Any]
+) -> None:
+    """
+    Write a cached document, and its revalidation information.
+
+    If *data* is `None`, the document is cached as not existing.
+    """
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    if data is None:
+        data_path.unlink(missing_ok=True)
+    else:
+        _write_atomic(data_path, data)
+    _write_atomic(info_path, json.dumps(info).encode())
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write data to a file, without leaving a partially written file on errors.
+    """
+    # A unique temporary file, so concurrent writes of the same file (from
+    # other threads or processes) don't write to the same temporary file
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal, Self
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from ome_zarr_models.base import BaseAttrs
 
@@ -110,6 +110,25 @@ VectorTransform = VectorScale | VectorTranslation
 ValidTransform = tuple[ScaleTransform] | tuple[ScaleTransform, TranslationTransform]
 
 
+_transforms_adapter: TypeAdapter[dict[Literal["transforms"], list[Transform]]] = (
+    TypeAdapter(dict[Literal["transforms"], list[Transform]])
+)
+
+
+def _validate_transforms(transforms_obj: object) -> list[Transform]:
+    """
+    Cast any input into a list of transforms.
+
+    The adapter is built once at import time, because building a pydantic schema
+    is much slower than validating a few transforms. The input is wrapped in a
+    dictionary so that the locations of any validation errors start with
+    `"transforms"`.
+    """
+    return _transforms_adapter.validate_python({"transforms": transforms_obj})[
+        "transforms"
+    ]
+
+
 def _ndim(transform: VectorTransform) -> int:
     """
     Get the dimensionality of a scale or translation transform.
@@ -76,12 +76,11 @@ class LabelBase(BaseAttrs):
         Check that label_values are consistent across properties and colors
         """
         if self.colors is not None and self.properties is not None:
-            prop_label_value = [prop.label_value for prop in self.properties]
-            color_label_value = [color.label_value for color in self.colors]
-
-            prop_label_value_set = set(prop_label_value)
-            color_label_value_set = set(color_label_value)
+            prop_label_value_set = {prop.label_value for prop in self.properties}
+            color_label_value_set = {color.label_value for color in self.colors}
             if color_label_value_set != prop_label_value_set:
+                prop_label_value = [prop.label_value for prop in self.properties]
+                color_label_value = [color.label_value for color in self.colors]
                 msg = (
                     "Inconsistent `label_value` attributes in "
                     "`colors` and `properties`."
@@ -1,4 +1,3 @@
-from collections import Counter
 from typing import Annotated, Self, TypeVar
 
 from pydantic import (
@@ -104,7 +103,7 @@ class PlateBase(BaseAttrs):
 
         for well in self.wells:
             path = well.path
-            if Counter(path)["/"] != 1:
+            if path.count("/") != 1:
                 errors.append(f"well path '{path}' does not contain a single '/'")
                 continue
 
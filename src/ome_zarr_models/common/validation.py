@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING, Literal, TypeVar, overload
 
 import zarr
 import zarr.errors
-from pydantic import StringConstraints
+from pydantic import BaseModel, StringConstraints
+from pydantic_zarr.core import tuplify_json
 from pydantic_zarr.v2 import AnyArraySpec as AnyArraySpecv2
 from pydantic_zarr.v2 import AnyGroupSpec as AnyGroupSpecv2
 from pydantic_zarr.v2 import ArraySpec as ArraySpecv2
@@ -14,17 +15,23 @@ from pydantic_zarr.v3 import AnyArraySpec as AnyArraySpecv3
 from pydantic_zarr.v3 import AnyGroupSpec as AnyGroupSpecv3
 from pydantic_zarr.v3 import ArraySpec as ArraySpecv3
 from pydantic_zarr.v3 import GroupSpec as GroupSpecv3
+from zarr.core.metadata import ArrayV2Metadata
+from zarr.core.sync import sync
 
+from ome_zarr_models import _io
 from ome_zarr_models.common.coordinate_transformations import VectorScale
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+
+    from zarr.core.metadata import ArrayV3Metadata
 
 
 __all__ = [
     "AlphaNumericConstraint",
     "RGBHexConstraint",
     "check_array_path",
+    "duplicate_items",
     "unique_items_validator",
 ]
 
@@ -37,6 +44,48 @@ RGBHexConstraint = StringConstraints(pattern=r"[0-9a-fA-F]{6}")
 T = TypeVar("T")
 
 
+def _bucket_key(value: object) -> object:
+    """
+    Get a key for putting a value into a bucket of possibly equal values.
+
+    Equal values always have the same key, but values with the same key are not
+    always equal. Pydantic models, which are not hashable, are keyed on their
+    type and their field values. Other values that are not hashable all share
+    one bucket per type.
+    """
+    if isinstance(value, BaseModel):
+        return (type(value), tuple(_bucket_key(v) for v in value.__dict__.values()))
+    try:
+        hash(value)
+    except TypeError:
+        return type(value)
+    return value
+
+
+def duplicate_items[T](values: Iterable[T]) -> list[T]:
+    """
+    Find duplicated items.
+
+    This takes time proportional to the number of values, as long as most values
+    have different bucket keys (see `_bucket_key`). Values are only compared
+    with `==` to other values in the same bucket.
+
+    Returns
+    -------
+    list
+        Every item that is equal to an item that comes before it, in order.
+    """
+    buckets: dict[object, list[T]] = {}
+    dupes = []
+    for value in values:
+        bucket = buckets.setdefault(_bucket_key(value), [])
+        if value in bucket:
+            dupes.append(value)
+        else:
+            bucket.append(value)
+    return dupes
+
+
 def unique_items_validator(values: list[T]) -> list[T]:
     """
     Make sure a list contains unique items.
@@ -46,9 +95,8 @@ def unique_items_validator(values: list[T]) -> list[T]:
     ValueError
         If duplicate values are found in *values*.
     """
-    for ind, value in enumerate(values, start=1):
-        if value in values[ind:]:
-            raise ValueError(f"Duplicate values found in {values}.")
+    if duplicate_items(values):
+        raise ValueError(f"Duplicate values found in {values}.")
     return values
 
 
@@ -89,36 +137,81 @@ def check_array_path(
     ValueError
         If the array doesn't exist, or the array is not the expected Zarr version.
     """
+    return sync(
+        _check_array_path_async(
+            group._async_group,
+            array_path,
+            expected_zarr_version=expected_zarr_version,
+        )
+    )
+
+
+async def _check_array_path_async(
+    group: zarr.AsyncGroup,
+    array_path: str,
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> AnyArraySpecv2 | AnyArraySpecv3:
+    """
+    Asynchronous version of `check_array_path`.
+    """
     try:
-        array = zarr.open_array(
-            store=group.store_path,
-            path=array_path,
-            mode="r",
-            zarr_format=expected_zarr_version,
+        array = await _io.open_array_path(
+            group, array_path, expected_zarr_version=expected_zarr_version
         )
     except FileNotFoundError as e:
-        msg = (
+        raise ValueError(
             f"Expected to find an array at {array_path}, but no array was found there."
-        )
-        raise ValueError(msg) from e
-    except (zarr.errors.ContainsGroupError, zarr.errors.NodeTypeValidationError) as e:
-        msg = (
+        ) from e
+    except (
+        zarr.errors.ContainsGroupError,
+        zarr.errors.NodeTypeValidationError,
+    ) as e:
+        raise ValueError(
             f"Expected to find an array at {array_path}, "
             "but a group was found there instead."
-        )
-        raise ValueError(msg) from e
+        ) from e
 
-    array_spec: AnyArraySpecv2 | AnyArraySpecv3
     if array.metadata.zarr_format == 2:
         if expected_zarr_version == 3:
             raise ValueError("Expected Zarr v3 array, but got v2 array")
-        array_spec = ArraySpecv2.from_zarr(array)
-    else:
-        if expected_zarr_version == 2:
-            raise ValueError("Expected Zarr v2 array, but got v3 array")
-        array_spec = ArraySpecv3.from_zarr(array)
+    elif expected_zarr_version == 2:
+        raise ValueError("Expected Zarr v2 array, but got v3 array")
+    return _array_spec_from_metadata(array.metadata)
+
+
+def _array_spec_from_metadata(
+    metadata: ArrayV2Metadata | ArrayV3Metadata,
+) -> AnyArraySpecv2 | AnyArraySpecv3:
+    """
+    Create an array specification from the metadata of an opened array.
 
-    return array_spec
+    This gives the same result as `ArraySpec.from_zarr()`, but builds the
+    specification straight from the metadata document that has already been
+    parsed, without creating a `zarr.Array` or looking up the installed
+    Zarr version for every array.
+    """
+    metadata_dict = metadata.to_dict()
+
+    def build() -> AnyArraySpecv2 | AnyArraySpecv3:
+        if isinstance(metadata, ArrayV2Metadata):
+            return ArraySpecv2.model_validate(metadata_dict)
+        metadata_json = tuplify_json(metadata_dict)
+        return ArraySpecv3(
+            attributes=metadata_json["attributes"],
+            shape=metadata.shape,
+            data_type=metadata_json["data_type"],
+            chunk_grid=metadata_json["chunk_grid"],
+            chunk_key_encoding=metadata_json["chunk_key_encoding"],
+            fill_value=metadata_json["fill_value"],
+            codecs=metadata_json["codecs"],
+            storage_transformers=metadata_json["storage_transformers"],
+            dimension_names=metadata_json.get("dimension_names", None),
+        )
+
+    # Arrays with identical metadata (e.g., the same level of every image in a
+    # plate) share one specification
+    return _io.interned(type(metadata), metadata_dict, build)
 
 
 @overload
@@ -160,22 +253,9 @@ def check_group_path(
     ValueError
         If the group doesn't exist, or the group is not the expected Zarr version.
     """
-    try:
-        group = zarr.open_group(
-            store=group.store_path,
-            path=group_path,
-            mode="r",
-            zarr_format=expected_zarr_version,
-        )
-    except FileNotFoundError as e:
-        msg = f"Expected to find a group at {group_path}, but no group was found there."
-        raise FileNotFoundError(msg) from e
-    except zarr.errors.ContainsArrayError as e:
-        msg = (
-            f"Expected to find an group at {group_path}, "
-            "but an array was found there instead."
-        )
-        raise zarr.errors.ContainsArrayError(msg) from e
+    group = _open_group_path(
+        group, group_path, expected_zarr_version=expected_zarr_version
+    )
 
     group_spec: AnyGroupSpecv2 | AnyGroupSpecv3
     if group.metadata.zarr_format == 2:
@@ -190,6 +270,37 @@ def check_group_path(
     return group_spec
 
 
+def _open_group_path(
+    group: zarr.Group,
+    group_path: str,
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> zarr.Group:
+    """
+    Open a group at a given path in a group.
+
+    If *group* has consolidated metadata, this is used to open the group
+    without reading anything from the store. Otherwise the metadata cache
+    is used, if one is set.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the path doesn't exist.
+    zarr.errors.ContainsArrayError
+        If there is an array at the path.
+    """
+    return zarr.Group(
+        sync(
+            _io.open_group_path(
+                group._async_group,
+                group_path,
+                expected_zarr_version=expected_zarr_version,
+            )
+        )
+    )
+
+
 def check_length(
     sequence: Sequence[T], *, valid_lengths: Sequence[int], variable_name: str
 ) -> None:
@@ -0,0 +1,148 @@
+"""
+Differences between the metadata of two OME-Zarr hierarchies.
+
+To find the differences between two OME-Zarr groups, use
+[ome_zarr_models.diff][]:
+
+```python
+import ome_zarr_models
+
+for difference in ome_zarr_models.diff("on-prem/plate.zarr", "s3://bucket/plate.zarr"):
+    print(difference)
+```
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel
+
+from ome_zarr_models._hash import TreeHasher, _without_nulls
+
+if TYPE_CHECKING:
+    from ome_zarr_models.base import BaseGroup
+
+__all__ = ["Difference"]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Difference:
+    """
+    A difference between a node (group or array) in two OME-Zarr hierarchies.
+
+    Parameters
+    ----------
+    path :
+        Path of the node, relative to the groups being compared. The groups
+        being compared have the path `""`.
+    change :
+        `"added"` if the node is only in the second hierarchy, `"removed"` if it
+        is only in the first hierarchy, and `"changed"` if the metadata of the
+        node is different. Members of added or removed groups are not listed
+        separately.
+    keys :
+        For changed nodes, the keys in the node metadata document that are
+        different, e.g., `"attributes.ome.multiscales[0].datasets[2]"` or
+        `"shape"`. Empty for added or removed nodes, and for groups where
+        only the members are different.
+    """
+
+    path: str
+    change: Literal["added", "removed", "changed"]
+    keys: tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        """
+        Format the difference as in the output of `ome-zarr-models diff`.
+        """
+        symbol = {"added": "+", "removed": "-", "changed": "~"}[self.change]
+        lines = [f"{symbol} /{self.path}"]
+        lines.extend(f"    {key}" for key in self.keys)
+        return "\n".join(lines)
+
+
+def _diff_groups(a: BaseGroup, b: BaseGroup) -> list[Difference]:
+    """
+    Find the differences between two OME-Zarr groups.
+
+    Members that have the same hash in both groups are not compared.
+    """
+    differences: list[Difference] = []
+    _diff_nodes(a, b, path="", hasher=TreeHasher(), differences=differences)
+    return differences
+
+
+def _diff_nodes(
+    a: Any, b: Any, *, path: str, hasher: TreeHasher, differences: list[Difference]
+) -> None:
+    """
+    Add the differences between two nodes, and all their members, to *differences*.
+    """
+    if hasher.hash(a) == hasher.hash(b):
+        return
+
+    keys = _diff_values(_node_document(a), _node_document(b))
+    members_a = getattr(a, "members", None) or {}
+    members_b = getattr(b, "members", None) or {}
+    if keys or members_a.keys() != members_b.keys():
+        differences.append(Difference(path=path, change="changed", keys=tuple(keys)))
+
+    prefix = f"{path}/" if path else ""
+    for name in members_a:
+        if name not in members_b:
+            differences.append(Difference(path=prefix + name, change="removed"))
+        else:
+            _diff_nodes(
+                members_a[name],
+                members_b[name],
+                path=prefix + name,
+                hasher=hasher,
+                differences=differences,
+            )
+    for name in members_b:
+        if name not in members_a:
+            differences.append(Difference(path=prefix + name, change="added"))
+
+
+def _node_document(node: Any) -> dict[str, Any]:
+    """
+    Get the metadata document of a node, without its members.
+    """
+    document: dict[str, Any] = node.model_dump(
+        mode="json", by_alias=True, exclude={"attributes", "members"}
+    )
+    attributes = node.attributes
+    if isinstance(attributes, BaseModel):
+        attributes = attributes.model_dump(mode="json", by_alias=True)
+    document["attributes"] = attributes
+    # Keys with null values are the same as missing keys, as in the hashes
+    return _without_nulls(document)  # type: ignore[no-any-return]
+
+
+def _diff_values(a: Any, b: Any, key: str = "") -> list[str]:
+    """
+    Get the keys of the parts of two JSON values that are different.
+    """
+    if isinstance(a, dict) and isinstance(b, dict):
+        prefix = f"{key}." if key else ""
+        keys = []
+        for name in {**a, **b}:
+            if name not in a or name not in b:
+                keys.append(prefix + name)
+            else:
+                keys.extend(_diff_values(a[name], b[name], prefix + name))
+        return keys
+    if isinstance(a, list) and isinstance(b, list):
+        keys = []
+        for i in range(max(len(a), len(b))):
+            if i >= len(a) or i >= len(b):
+                keys.append(f"{key}[{i}]")
+            else:
+                keys.extend(_diff_values(a[i], b[i], f"{key}[{i}]"))
+        return keys
+    # Compare types as well, as 1 == True in Python but not in JSON
+    if type(a) is not type(b) or a != b:
+        return [key]
+    return []
@@ -8,3 +8,10 @@ class ValidationWarning(UserWarning):
     Warning emitted for OME-Zarr data that can be interpreted
     by `ome-zarr-models`, but is not strictly compliant with the specification.
     """
+
+
+class MetadataConflictError(RuntimeError):
+    """
+    Error raised when metadata can't be updated, because it has been changed
+    in the store since it was read.
+    """
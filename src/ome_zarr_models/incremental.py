@@ -0,0 +1,325 @@
+"""
+Incremental validation of OME-Zarr groups in a local directory.
+
+To validate a group that is still being written (e.g., a plate that wells are
+being added to) every time it changes, use an
+[IncrementalValidator][ome_zarr_models.incremental.IncrementalValidator]:
+
+```python
+import time
+
+from ome_zarr_models.incremental import IncrementalValidator
+
+validator = IncrementalValidator("path/to/plate.ome.zarr")
+validator.validate()
+while True:
+    time.sleep(1)
+    if validator.has_changed():
+        validator.validate()
+```
+
+The same thing can be done from the command line with
+`ome-zarr-models validate --watch`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from zarr.storage import LocalStore
+
+from ome_zarr_models import _io, open_ome_zarr
+from ome_zarr_models.cache import _METADATA_KEYS, _invalidate_metadata_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ome_zarr_models.base import BaseGroup
+
+__all__ = ["Fingerprint", "IncrementalValidator"]
+
+Fingerprint = tuple[tuple[str, int, int, int], ...]
+"""
+Fingerprint of a group or array in a local directory.
+
+This is the name, modification time (in nanoseconds), size and inode number of
+each metadata document of the node. For groups, it also includes the
+modification time of the group directory (with the name `"."`), which changes
+when members are added or removed.
+"""
+
+
+class IncrementalValidator:
+    """
+    Validate an OME-Zarr group in a local directory, and validate it again after
+    it changes, only reading the groups that have changed.
+
+    Every time the group is validated, a fingerprint of each group and array in
+    the hierarchy is stored. The fingerprint is made from the modification
+    times of the metadata documents of the node, so working it out does not
+    read any metadata. When the group is validated again, OME-Zarr groups
+    (e.g., wells, images or labels) are only read and validated again if they,
+    or any of their members, have changed. The groups that contain them are
+    always validated again, so checks that depend on more than one group
+    (e.g., that the labels of an image have the same number of levels as the
+    image, or that the acquisitions of a well are in the plate metadata) are
+    run again with the changed groups.
+
+    Parameters
+    ----------
+    path :
+        Path to the directory of the OME-Zarr group.
+    version :
+        OME-Zarr version to validate against. If `None`, the version is inferred
+        from the metadata.
+
+    Raises
+    ------
+    ValueError
+        If *path* is not a directory.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        version: Literal["0.4", "0.5", "0.6"] | None = None,
+    ) -> None:
+        self._path = Path(path)
+        if not self._path.is_dir():
+            raise ValueError(f"'{path}' is not a local directory")
+        self._store = LocalStore(self._path, read_only=True)
+        self._version = version
+        self._group: BaseGroup | None = None
+        self._valid = False
+        # Fingerprints of the nodes when the group was last validated successfully
+        self._fingerprints: dict[str, Fingerprint] = {}
+        # Fingerprints of the nodes when the group was last validated
+        self._last_fingerprints: dict[str, Fingerprint] | None = None
+        self._changed_paths: tuple[str, ...] = ()
+
+    @property
+    def group(self) -> BaseGroup | None:
+        """
+        The group from the last successful validation.
+
+        `None` if the group has not been validated successfully yet.
+        """
+        return self._group
+
+    @property
+    def changed_paths(self) -> tuple[str, ...]:
+        """
+        Paths of the groups and arrays that had changed when the group was last
+        validated, compared with the last successful validation.
+
+        Empty after the first validation.
+        """
+        return self._changed_paths
+
+    def has_changed(self) -> bool:
+        """
+        Check if any metadata has changed since the group was last validated.
+
+        If the last validation was successful, the groups and arrays in the
+        validated hierarchy are checked. Otherwise, every group and array in the
+        directory is checked.
+        """
+        return self._scan() != self._last_fingerprints
+
+    def validate(self) -> BaseGroup:
+        """
+        Validate the group, only reading the groups that have changed since the
+        last successful validation.
+
+        Returns
+        -------
+        group :
+            The validated group.
+
+        Raises
+        ------
+        RuntimeError
+            If the group is not valid. See
+            [open_ome_zarr][ome_zarr_models.open_ome_zarr].
+        """
+        fingerprints = self._scan()
+        self._last_fingerprints = fingerprints
+        if self._group is None:
+            changed_paths: set[str] = set()
+        else:
+            changed_paths = {
+                path
+                for path in fingerprints.keys() | self._fingerprints.keys()
+                if fingerprints.get(path) != self._fingerprints.get(path)
+            }
+        self._changed_paths = tuple(sorted(changed_paths))
+        if self._group is not None and self._valid and not changed_paths:
+            return self._group
+
+        self._valid = False
+        previous_models = (
+            _unchanged_models(self._group, changed_paths)
+            if self._group is not None
+            else {}
+        )
+        for path in changed_paths:
+            _invalidate_metadata_cache(self._store, path)
+        with _io.reusing_models(previous_models):
+            group = open_ome_zarr(self._store, version=self._version)
+
+        # Nodes that were not in the old hierarchy were not in the scan
+        root = os.fspath(self._path)
+        self._fingerprints = {
+            path: fingerprints[path]
+            if path in fingerprints
+            else _fingerprint(os.path.join(root, path), is_group, documents)
+            for path, is_group, documents in _iter_nodes(group)
+        }
+        self._last_fingerprints = self._fingerprints
+        self._group = group
+        self._valid = True
+        return group
+
+    def _scan(self) -> dict[str, Fingerprint]:
+        """
+        Get the fingerprints of the groups and arrays to check for changes.
+        """
+        if self._group is not None and self._valid:
+            nodes: Iterator[tuple[str, bool, tuple[str, ...]]] = _iter_nodes(
+                self._group
+            )
+        else:
+            nodes = _walk_nodes(self._path)
+        root = os.fspath(self._path)
+        return {
+            path: _fingerprint(os.path.join(root, path), is_group, documents)
+            for path, is_group, documents in nodes
+        }
+
+
+def _fingerprint(
+    directory: str, is_group: bool, documents: tuple[str, ...]
+) -> Fingerprint:
+    """
+    Get the fingerprint of the group or array in a directory.
+
+    Parameters
+    ----------
+    directory :
+        Directory of the node.
+    is_group :
+        Whether the node is a group.
+    documents :
+        Names of the metadata documents that the node can have.
+    """
+    fingerprint = []
+    for name in documents:
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except FileNotFoundError:
+            continue
+        fingerprint.append((name, stat.st_mtime_ns, stat.st_size, stat.st_ino))
+    if is_group:
+        try:
+            stat = os.stat(directory)
+        except FileNotFoundError:
+            pass
+        else:
+            fingerprint.append((".", stat.st_mtime_ns, 0, stat.st_ino))
+    return tuple(fingerprint)
+
+
+def _metadata_documents(zarr_format: int, *, is_group: bool) -> tuple[str, ...]:
+    """
+    Get the names of the metadata documents a node can have.
+    """
+    if zarr_format == 3:
+        return ("zarr.json",)
+    if is_group:
+        return (".zattrs", ".zgroup", ".zmetadata")
+    return (".zarray", ".zattrs")
+
+
+def _iter_nodes(group: BaseGroup) -> Iterator[tuple[str, bool, tuple[str, ...]]]:
+    """
+    Get the paths of a group and all its members, whether each is a group,
+    and the names of their metadata documents.
+    """
+    yield "", True, _metadata_documents(group.zarr_format, is_group=True)  # type: ignore[attr-defined]
+    stack: list[tuple[str, Any]] = [("", group)]
+    while stack:
+        path, node = stack.pop()
+        for name, member in (node.members or {}).items():
+            member_path = f"{path}/{name}" if path else name
+            is_group = _io._is_group_spec(member)
+            yield (
+                member_path,
+                is_group,
+                _metadata_documents(member.zarr_format, is_group=is_group),
+            )
+            if is_group:
+                stack.append((member_path, member))
+
+
+def _walk_nodes(root: Path) -> Iterator[tuple[str, bool, tuple[str, ...]]]:
+    """
+    Get the paths of all the groups and arrays in a directory, whether each is
+    a group, and the names of their metadata documents.
+
+    Array directories are not searched, as they only contain chunks.
+    """
+    for directory, subdirectories, files in os.walk(root):
+        documents = tuple(sorted(_METADATA_KEYS.intersection(files)))
+        if not documents:
+            continue
+        path = Path(directory).relative_to(root).as_posix()
+        is_group = not _is_array_directory(Path(directory), files)
+        yield ("" if path == "." else path), is_group, documents
+        if not is_group:
+            subdirectories.clear()
+
+
+def _is_array_directory(directory: Path, files: list[str]) -> bool:
+    """
+    Check if a directory with Zarr metadata documents contains an array.
+    """
+    if ".zarray" in files:
+        return True
+    if "zarr.json" not in files:
+        return False
+    try:
+        metadata = json.loads((directory / "zarr.json").read_bytes())
+    except (OSError, ValueError):
+        return False
+    return isinstance(metadata, dict) and metadata.get("node_type") == "array"
+
+
+def _unchanged_models(
+    group: BaseGroup, changed_paths: set[str]
+) -> dict[str, BaseGroup]:
+    """
+    Get the models of the member groups of a hierarchy that have not changed.
+
+    A member group has not changed if none of the groups and arrays in it are
+    in *changed_paths*. Members of unchanged groups are not included, as they
+    are re-used along with the group.
+    """
+    models: dict[str, BaseGroup] = {}
+    stack: list[tuple[str, BaseGroup]] = [("", group)]
+    while stack:
+        path, model = stack.pop()
+        for member_path, (_, member) in model._member_models.items():
+            member_path = f"{path}/{member_path}" if path else member_path
+            prefix = f"{member_path}/"
+            if any(
+                changed == member_path or changed.startswith(prefix)
+                for changed in changed_paths
+            ):
+                stack.append((member_path, member))
+            else:
+                models[member_path] = member
+    return models
@@ -0,0 +1,137 @@
+"""
+Selecting which parts of an OME-Zarr hierarchy to read.
+
+By default, loading an OME-Zarr group reads every group and array in the
+hierarchy below it. To only read part of the hierarchy, pass a
+[Selection][ome_zarr_models.selection.Selection]:
+
+```python
+import ome_zarr_models
+from ome_zarr_models.selection import Selection
+
+# Only read well A/1 of a plate, and don't read any labels
+plate = ome_zarr_models.open_ome_zarr(
+    group, selection=Selection(wells=["A/1"], include_labels=False)
+)
+```
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = ["Selection"]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Selection:
+    """
+    Parts of an OME-Zarr hierarchy to read.
+
+    Only arrays and optional groups (labels, wells, and the images in a well)
+    are ever skipped. Groups that are skipped are not read at all, and the
+    resulting model is the same as if they did not exist in the store.
+    This means:
+
+    - `Image.labels` is `None` if labels are not included.
+    - `HCS.well_groups` only contains the selected wells, and
+      `HCS.get_well_group()` raises a `WellGroupNotFoundError` for wells
+      that are not selected.
+    - Images in a well that are not selected are not in `Well.members`, so
+      getting them from the well model raises a `KeyError`.
+    - Checks that depend on skipped groups (e.g., that the label images have
+      the same number of levels as the image, or that the acquisitions of the
+      images in a well are listed in the plate metadata) are only run on the
+      groups that are read. As they have not checked the whole hierarchy, they
+      are listed in the `skipped_checks` of the loaded model.
+    - If arrays are not read, checks that need array metadata (e.g., that the
+      arrays have the same number of dimensions as the multiscales metadata)
+      are not run. These are listed in the `skipped_checks` of the loaded model.
+
+    Parameters
+    ----------
+    include_arrays :
+        Whether to read array metadata. If `False`, only the attributes of
+        each group are read and validated.
+    include_labels :
+        Whether to read labels groups.
+    wells :
+        Paths of wells to read (e.g., `["A/1", "B/3"]`). If `None`, all wells
+        are read.
+    images :
+        Paths of images to read in each well (e.g., `["0"]`). If `None`, all
+        images are read.
+    max_depth :
+        Maximum depth of optional groups to read, counted in Zarr path
+        components below the group that is opened. For example,
+        the wells of a plate are at depth 2 (e.g., `"A/1"`), and the images in
+        those wells at depth 3 (e.g., `"A/1/0"`). If `None`, there is no limit.
+    """
+
+    include_arrays: bool = True
+    include_labels: bool = True
+    wells: Sequence[str] | None = None
+    images: Sequence[str] | None = None
+    max_depth: int | None = None
+
+    def __post_init__(self) -> None:
+        """
+        Check and normalize the selection.
+        """
+        if self.max_depth is not None and self.max_depth < 0:
+            raise ValueError(f"max_depth must be at least 0 (got {self.max_depth})")
+        # Normalize paths, so they can be compared with paths in the metadata
+        if self.wells is not None:
+            object.__setattr__(
+                self, "wells", tuple(path.strip("/") for path in self.wells)
+            )
+        if self.images is not None:
+            object.__setattr__(
+                self, "images", tuple(path.strip("/") for path in self.images)
+            )
+
+    def _includes(self, path: str, group_cls: type[Any], *, depth: int) -> bool:
+        """
+        Check if an optional group should be read.
+
+        Parameters
+        ----------
+        path :
+            Path of the group relative to its parent.
+        group_cls :
+            Class that will be used to read the group.
+        depth :
+            Depth of the group below the group that is being opened.
+        """
+        import ome_zarr_models.v04
+        import ome_zarr_models.v05
+        import ome_zarr_models.v06
+
+        if self.max_depth is not None and depth > self.max_depth:
+            return False
+        if issubclass(
+            group_cls,
+            ome_zarr_models.v04.Labels
+            | ome_zarr_models.v05.Labels
+            | ome_zarr_models.v06.Labels,
+        ):
+            return self.include_labels
+        if issubclass(
+            group_cls,
+            ome_zarr_models.v04.Well
+            | ome_zarr_models.v05.Well
+            | ome_zarr_models.v06.Well,
+        ):
+            return self.wells is None or path.strip("/") in self.wells
+        if issubclass(
+            group_cls,
+            ome_zarr_models.v04.Image
+            | ome_zarr_models.v05.Image
+            | ome_zarr_models.v06.Image,
+        ):
+            return self.images is None or path.strip("/") in self.images
+        return True
@@ -0,0 +1,162 @@
+"""
+Compact snapshots of OME-Zarr groups that have already been loaded.
+
+Loading a large OME-Zarr group (e.g., a plate with many wells) reads and
+validates the metadata of every group and array in the hierarchy. A snapshot
+stores a loaded group as bytes, so it can be passed to another process, or
+saved to disk, and loaded again without reading from the store or
+validating the metadata again:
+
+```python
+import ome_zarr_models
+from ome_zarr_models.snapshot import from_snapshot, to_snapshot
+
+plate = ome_zarr_models.open_ome_zarr(group)
+data = to_snapshot(plate)
+
+# In another process
+plate = from_snapshot(data)
+```
+
+Snapshots are written with [pickle][], so only load snapshots from sources
+you trust. They can only be loaded with the same version of `ome-zarr-models`
+that wrote them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import pickle
+import struct
+import zlib
+from typing import Any
+
+from ome_zarr_models._io import LazyMembers
+from ome_zarr_models.base import BaseGroup
+
+__all__ = ["from_snapshot", "to_snapshot"]
+
+_MAGIC = b"OMEZSNAP"
+_FORMAT_VERSION = 1
+_VALIDATED = 1
+# Magic bytes, format version, flags, SHA-256 hash of the (uncompressed)
+# payload, and length of the ome-zarr-models version string
+_HEADER = struct.Struct("<8sHH32sH")
+
+
+def to_snapshot(group: BaseGroup) -> bytes:
+    """
+    Store an OME-Zarr group, and all its members, as a snapshot.
+
+    Parameters
+    ----------
+    group :
+        Group to store. If the group (or one of its members) was loaded with
+        `lazy=True`, any members that have not been read yet are read first.
+
+    Returns
+    -------
+    bytes :
+        The snapshot. This is compressed, and contains a hash of the stored
+        group that is checked when it is loaded.
+    """
+    from ome_zarr_models import __version__
+
+    if not isinstance(group, BaseGroup):
+        raise TypeError(f"Expected an OME-Zarr group, got {type(group).__name__}")
+    buffer = io.BytesIO()
+    _SnapshotPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(group)
+    payload = buffer.getvalue()
+    package_version = __version__.encode()
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT_VERSION,
+        _VALIDATED,
+        hashlib.sha256(payload).digest(),
+        len(package_version),
+    )
+    return header + package_version + zlib.compress(payload, level=1)
+
+
+def from_snapshot(data: bytes) -> BaseGroup:
+    """
+    Load an OME-Zarr group from a snapshot made with `to_snapshot()`.
+
+    The group is not read from the store, and is not validated again. The
+    loaded group has the same `skipped_checks` as the group that was stored.
+
+    Parameters
+    ----------
+    data :
+        The snapshot.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a snapshot, is corrupted, or was written by a
+        different version of `ome-zarr-models`.
+    """
+    from ome_zarr_models import __version__
+
+    try:
+        magic, format_version, flags, content_hash, version_length = (
+            _HEADER.unpack_from(data)
+        )
+    except struct.error as e:
+        raise ValueError("Data is not an ome-zarr-models snapshot") from e
+    if magic != _MAGIC:
+        raise ValueError("Data is not an ome-zarr-models snapshot")
+    if format_version != _FORMAT_VERSION or not flags & _VALIDATED:
+        raise ValueError(f"Unsupported snapshot format (version {format_version})")
+
+    version_end = _HEADER.size + version_length
+    package_version = bytes(data[_HEADER.size : version_end]).decode()
+    if package_version != __version__:
+        raise ValueError(
+            f"Snapshot was written by ome-zarr-models {package_version}, and can't "
+            f"be loaded with ome-zarr-models {__version__}"
+        )
+    try:
+        payload = zlib.decompress(data[version_end:])
+    except zlib.error as e:
+        raise ValueError("Snapshot is corrupted") from e
+    if hashlib.sha256(payload).digest() != content_hash:
+        raise ValueError("Snapshot is corrupted")
+
+    group = pickle.loads(payload)
+    if not isinstance(group, BaseGroup):
+        raise ValueError("Snapshot does not contain an OME-Zarr group")
+    return group
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickler for OME-Zarr group models.
+
+    Models that are shared between several groups (see
+    `_io.MetadataInterner`) are only stored once.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, type):
+            # Parametrized generic models (e.g., BaseZarrAttrs[ImageAttrs]) can't
+            # be found by name, so are stored as their origin and parameters
+            metadata = getattr(obj, "__pydantic_generic_metadata__", None)
+            if metadata is not None and metadata["origin"] is not None:
+                args = metadata["args"]
+                return _parametrize, (
+                    metadata["origin"],
+                    args[0] if len(args) == 1 else args,
+                )
+        elif isinstance(obj, LazyMembers):
+            # Stored as the members they would be if read straight away
+            return dict, (obj.to_dict(),)
+        return NotImplemented
+
+
+def _parametrize(origin: Any, args: Any) -> Any:
+    """
+    Get a parametrized generic model.
+    """
+    return origin[args]
@@ -5,9 +5,11 @@ from typing import TYPE_CHECKING, Self
 from pydantic import Field, JsonValue, model_validator
 from pydantic_zarr.v2 import AnyArraySpec, AnyGroupSpec, GroupSpec
 
-from ome_zarr_models._utils import _from_zarr_v2
+from ome_zarr_models import _io
+from ome_zarr_models._utils import _from_zarr_v2_async
 from ome_zarr_models.base import BaseAttrsv2
 from ome_zarr_models.common.coordinate_transformations import _build_transforms
+from ome_zarr_models.selection import Selection
 from ome_zarr_models.v04.axes import Axis
 from ome_zarr_models.v04.base import BaseGroupv04
 from ome_zarr_models.v04.labels import Labels
@@ -52,7 +54,13 @@ class Image(BaseGroupv04[ImageAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    def from_zarr(  # type: ignore[override]
+        cls,
+        group: zarr.Group,
+        *,
+        lazy: bool = False,
+        selection: Selection | None = None,
+    ) -> Self:
         """
         Create an OME-Zarr image model from a `zarr.Group`.
 
@@ -60,8 +68,23 @@ class Image(BaseGroupv04[ImageAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
+        lazy :
+            If `True`, the arrays and labels in the group are not read straight away.
+            Instead each one is read the first time it is accessed in `members`.
+            The OME-Zarr metadata of the group is still validated, but
+            checks that the arrays are consistent with the metadata are not run.
+        selection :
+            Labels to read. If `None`, everything is read.
         """
-        return _from_zarr_v2(group, cls, ImageAttrs)
+        return _io.run_sync(
+            cls._from_zarr_async(group._async_group, lazy=lazy), selection=selection
+        )
+
+    @classmethod
+    async def _from_zarr_async(
+        cls, group: zarr.AsyncGroup, *, lazy: bool = False
+    ) -> Self:
+        return await _from_zarr_v2_async(group, cls, ImageAttrs, lazy=lazy)
 
     @classmethod
     def new(
@@ -118,10 +141,9 @@ class Image(BaseGroupv04[ImageAttrs]):
                 f"Length of arrays (got {len(array_specs)=}) must be the same as "
                 f"length of paths (got {len(paths)=})"
             )
-        members_flat: dict[str, AnyArraySpec] = {
-            "/" + key.lstrip("/"): arr
-            for key, arr in zip(paths, array_specs, strict=True)
-        }
+        members = _io.build_members(
+            dict(zip(paths, array_specs, strict=True)), GroupSpec
+        )
 
         if global_scale is None and global_translation is None:
             global_transform = None
@@ -158,11 +180,12 @@ class Image(BaseGroupv04[ImageAttrs]):
             version="0.4",
         )
         return Image(
-            members=GroupSpec.from_flat(members_flat).members,
+            members=members,
             attributes=ImageAttrs(multiscales=(multimeta,)),
         )
 
     @model_validator(mode="after")
+    @_io.requires_arrays
     def _check_arrays_compatible(self) -> Self:
         """
         Check that all the arrays referenced by the `multiscales` metadata meet the
@@ -173,15 +196,16 @@ class Image(BaseGroupv04[ImageAttrs]):
               metadata.
         """
         multimeta = self.attributes.multiscales
-        flat_self = self.to_flat()
 
         for multiscale in multimeta:
             multiscale_ndim = len(multiscale.axes)
             for dataset in multiscale.datasets:
                 try:
-                    maybe_arr: AnyArraySpec | AnyGroupSpec = flat_self[
-                        "/" + dataset.path.lstrip("/")
-                    ]
+                    maybe_arr: AnyArraySpec | AnyGroupSpec | None = _io.get_member_spec(
+                        self.members, dataset.path
+                    )
+                    if maybe_arr is None:
+                        raise KeyError(dataset.path)
                     if isinstance(maybe_arr, GroupSpec):
                         msg = f"The node at {dataset.path} is a group, not an array."
                         raise ValueError(msg)
@@ -223,7 +247,15 @@ class Image(BaseGroupv04[ImageAttrs]):
         if not isinstance(labels_group, GroupSpec):
             raise RuntimeError("Node at 'labels' is not a group")
 
-        return Labels(attributes=labels_group.attributes, members=labels_group.members)
+        with _io.member_checks(self):
+            return _io.member_model(
+                self,
+                "labels",
+                labels_group,
+                lambda: Labels(
+                    attributes=labels_group.attributes, members=labels_group.members
+                ),
+            )
 
     @property
     def datasets(self) -> tuple[tuple[Dataset, ...], ...]:
@@ -3,6 +3,7 @@ from typing import Self
 import zarr
 from pydantic import Field
 
+from ome_zarr_models import _io
 from ome_zarr_models.base import BaseAttrsv2
 from ome_zarr_models.v04.base import BaseGroupv04
 from ome_zarr_models.v04.image import Image
@@ -39,6 +40,13 @@ class ImageLabel(BaseGroupv04[ImageLabelAttrs]):
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image label metadata.
         """
-        # Use Image.from_zarr() to validate multiscale metadata
-        image = Image.from_zarr(group)
-        return cls(attributes=image.attributes.model_dump(), members=image.members)
+        return _io.run_sync(cls._from_zarr_async(group._async_group))
+
+    @classmethod
+    async def _from_zarr_async(cls, group: zarr.AsyncGroup) -> Self:
+        image = await Image._from_zarr_async(group)
+        image_label = cls(
+            attributes=image.attributes.model_dump(), members=image.members
+        )
+        _io.record_read_attributes(image_label, group)
+        return image_label
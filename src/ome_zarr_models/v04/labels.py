@@ -4,13 +4,16 @@ from typing import TYPE_CHECKING, Self
 
 from pydantic import Field
 
-from ome_zarr_models._utils import _from_zarr_v2
+from ome_zarr_models import _io
+from ome_zarr_models._utils import _from_zarr_v2_async
 from ome_zarr_models.base import BaseAttrsv2
 from ome_zarr_models.v04.base import BaseGroupv04
 
 if TYPE_CHECKING:
     import zarr
 
+    from ome_zarr_models.selection import Selection
+
 __all__ = ["Labels", "LabelsAttrs"]
 
 
@@ -30,7 +33,13 @@ class Labels(BaseGroupv04[LabelsAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    def from_zarr(  # type: ignore[override]
+        cls,
+        group: zarr.Group,
+        *,
+        lazy: bool = False,
+        selection: Selection | None = None,
+    ) -> Self:
         """
         Create an OME-Zarr labels model from a `zarr.Group`.
 
@@ -38,5 +47,21 @@ class Labels(BaseGroupv04[LabelsAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr labels metadata.
+        lazy :
+            If `True`, the label images in the group are not read straight away.
+            Instead each one is read the first time it is accessed in `members`.
+            The OME-Zarr metadata of the group is still validated, but
+            checks on the label images (e.g., their data types) are not run.
+        selection :
+            Parts of the label images to read (e.g., `include_arrays=False` to not
+            read any array metadata). If `None`, everything is read.
         """
-        return _from_zarr_v2(group, cls, LabelsAttrs)
+        return _io.run_sync(
+            cls._from_zarr_async(group._async_group, lazy=lazy), selection=selection
+        )
+
+    @classmethod
+    async def _from_zarr_async(
+        cls, group: zarr.AsyncGroup, *, lazy: bool = False
+    ) -> Self:
+        return await _from_zarr_v2_async(group, cls, LabelsAttrs, lazy=lazy)
@@ -8,8 +8,10 @@ from typing import Self
 import zarr
 from pydantic_zarr.v2 import AnyGroupSpec
 
-from ome_zarr_models._utils import _from_zarr_v2
+from ome_zarr_models import _io
+from ome_zarr_models._utils import _from_zarr_v2_async
 from ome_zarr_models.base import BaseAttrsv2
+from ome_zarr_models.selection import Selection
 from ome_zarr_models.v04.base import BaseGroupv04
 from ome_zarr_models.v04.image import Image
 from ome_zarr_models.v04.well_types import WellMeta
@@ -34,7 +36,9 @@ class Well(BaseGroupv04[WellAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, selection: Selection | None = None
+    ) -> Self:
         """
         Create an OME-Zarr well model from a `zarr.Group`.
 
@@ -42,8 +46,16 @@ class Well(BaseGroupv04[WellAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr well metadata.
+        selection :
+            Images and labels to read. If `None`, everything is read.
         """
-        return _from_zarr_v2(group, cls, WellAttrs)
+        return _io.run_sync(
+            cls._from_zarr_async(group._async_group), selection=selection
+        )
+
+    @classmethod
+    async def _from_zarr_async(cls, group: zarr.AsyncGroup) -> Self:
+        return await _from_zarr_v2_async(group, cls, WellAttrs)
 
     def get_image(self, i: int) -> Image:
         """
@@ -58,7 +70,13 @@ class Well(BaseGroupv04[WellAttrs]):
                 raise RuntimeError(f"{group.members=}")
             group = group.members[part]
 
-        return Image(attributes=group.attributes, members=group.members)
+        with _io.member_checks(self):
+            return _io.member_model(
+                self,
+                image_path,
+                group,
+                lambda: Image(attributes=group.attributes, members=group.members),
+            )
 
     @property
     def n_images(self) -> int:
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, Literal, Self, TypeVar, Union
+import asyncio
+from typing import TYPE_CHECKING, Any, Generic, Literal, Self, TypeVar, Union
 
 import pydantic_zarr
 import pydantic_zarr.v3
-from pydantic import BaseModel
-
+import zarr
+from pydantic import (
+    BaseModel,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+)
+
+from ome_zarr_models import _io
+from ome_zarr_models._utils import _write_consolidated_metadata
 from ome_zarr_models.base import BaseAttrsv3, BaseGroup
+from ome_zarr_models.cache import _invalidate_metadata_cache
 
 if TYPE_CHECKING:
-    import zarr
+    from zarr.abc.store import Store
+
+    from ome_zarr_models.selection import Selection
 
 
 class BaseOMEAttrs(BaseAttrsv3):
@@ -43,6 +55,18 @@ class BaseGroupv05(
     Base class for all v0.5 OME-Zarr groups.
     """
 
+    _skipped_checks: tuple[str, ...] = PrivateAttr(default=())
+    _array_checks_run: bool = PrivateAttr(default_factory=_io.array_checks_run)
+
+    @field_serializer("members", mode="wrap")
+    def _serialize_members(
+        self, members: Any, handler: SerializerFunctionWrapHandler
+    ) -> Any:
+        # Members of groups loaded with lazy=True are read before serializing
+        if isinstance(members, _io.LazyMembers):
+            members = members.to_dict()
+        return handler(members)
+
     @classmethod
     def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
         """
@@ -55,6 +79,86 @@ class BaseGroupv05(
         """
         return super().from_zarr(group)
 
+    @classmethod
+    async def from_zarr_async(
+        cls,
+        group: zarr.Group | zarr.AsyncGroup,
+        *,
+        max_concurrency: int | None = None,
+        selection: Selection | None = None,
+    ) -> Self:
+        """
+        Asynchronously create an OME-Zarr model from a Zarr group.
+
+        Metadata for members of the group that do not depend on each other
+        (e.g., the arrays in an image, or the wells in a plate) is read
+        concurrently.
+
+        Parameters
+        ----------
+        group : zarr.Group | zarr.AsyncGroup
+            A Zarr group that has valid OME-Zarr metadata.
+        max_concurrency :
+            Maximum number of metadata documents to read at the same time.
+            If not given, the `async.concurrency` setting from the Zarr
+            config is used.
+        selection :
+            Parts of the hierarchy to read. If `None`, everything is read.
+        """
+        if isinstance(group, zarr.Group):
+            group = group._async_group
+        async with _io.read_session(
+            max_concurrency=max_concurrency, selection=selection
+        ) as session:
+            return session.finish_load(await cls._from_zarr_async(group))
+
+    @classmethod
+    async def _from_zarr_async(cls, group: zarr.AsyncGroup) -> Self:
+        """
+        Create an OME-Zarr model from an asynchronous Zarr group.
+
+        Subclasses should override this to read their members concurrently.
+        """
+        return await asyncio.to_thread(cls.from_zarr, zarr.Group(group))
+
+    def to_zarr(
+        self,
+        store: Store,
+        path: str,
+        *,
+        overwrite: bool = False,
+        consolidate: bool = False,
+        **kwargs: Any,
+    ) -> zarr.Group:
+        """
+        Write this OME-Zarr group to a Zarr store.
+
+        This writes metadata for the group and all its members, but does not
+        write any array data.
+
+        Parameters
+        ----------
+        store :
+            Store to write to.
+        path :
+            Path to the group within the store.
+        overwrite :
+            Whether to overwrite existing groups and arrays.
+        consolidate :
+            If `True`, also write consolidated metadata for the whole hierarchy
+            to the group. This allows the hierarchy to be read from a single
+            metadata document. The consolidated metadata is created from this
+            model, so only groups and arrays that are part of this OME-Zarr
+            group are included.
+        **kwargs :
+            Passed to `to_zarr()` for all the members of this group.
+        """
+        group = super().to_zarr(store, path, overwrite=overwrite, **kwargs)
+        _invalidate_metadata_cache(store, path)
+        if consolidate:
+            group = _write_consolidated_metadata(self, group)
+        return group
+
     @property
     def ome_zarr_version(self) -> Literal["0.5"]:
         """
@@ -8,8 +8,10 @@ import zarr.errors
 from pydantic import Field, JsonValue, model_validator
 from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, GroupSpec
 
-from ome_zarr_models._utils import _from_zarr_v3
+from ome_zarr_models import _io
+from ome_zarr_models._utils import _from_zarr_v3_async
 from ome_zarr_models.common.coordinate_transformations import _build_transforms
+from ome_zarr_models.selection import Selection
 from ome_zarr_models.v05.axes import Axis
 from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs, BaseZarrAttrs
 from ome_zarr_models.v05.labels import Labels
@@ -109,7 +111,13 @@ class Image(BaseGroupv05[ImageAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    def from_zarr(  # type: ignore[override]
+        cls,
+        group: zarr.Group,
+        *,
+        lazy: bool = False,
+        selection: Selection | None = None,
+    ) -> Self:
         """
         Create an OME-Zarr image model from a `zarr.Group`.
 
@@ -117,8 +125,23 @@ class Image(BaseGroupv05[ImageAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
+        lazy :
+            If `True`, the arrays and labels in the group are not read straight away.
+            Instead each one is read the first time it is accessed in `members`.
+            The OME-Zarr metadata of the group is still validated, but
+            checks that the arrays are consistent with the metadata are not run.
+        selection :
+            Labels to read. If `None`, everything is read.
         """
-        return _from_zarr_v3(group, cls, ImageAttrs)
+        return _io.run_sync(
+            cls._from_zarr_async(group._async_group, lazy=lazy), selection=selection
+        )
+
+    @classmethod
+    async def _from_zarr_async(
+        cls, group: zarr.AsyncGroup, *, lazy: bool = False
+    ) -> Self:
+        return await _from_zarr_v3_async(group, cls, ImageAttrs, lazy=lazy)
 
     @classmethod
     def new(
@@ -175,10 +198,9 @@ class Image(BaseGroupv05[ImageAttrs]):
                 f"Length of arrays (got {len(array_specs)=}) must be the same as "
                 f"length of paths (got {len(paths)=})"
             )
-        members_flat = {
-            "/" + key.lstrip("/"): arr
-            for key, arr in zip(paths, array_specs, strict=True)
-        }
+        members = _io.build_members(
+            dict(zip(paths, array_specs, strict=True)), GroupSpec
+        )
 
         if global_scale is None and global_translation is None:
             global_transform = None
@@ -214,7 +236,7 @@ class Image(BaseGroupv05[ImageAttrs]):
             type=multiscale_type,
         )
         return Image(
-            members=GroupSpec.from_flat(members_flat).members,
+            members=members,
             attributes=BaseZarrAttrs(
                 ome=ImageAttrs(
                     multiscales=[
@@ -226,6 +248,7 @@ class Image(BaseGroupv05[ImageAttrs]):
         )
 
     @model_validator(mode="after")
+    @_io.requires_arrays
     def _check_arrays_compatible(self) -> Self:
         """
         Check that all the arrays referenced by the `multiscales` metadata meet the
@@ -236,16 +259,17 @@ class Image(BaseGroupv05[ImageAttrs]):
               metadata.
         """
         multimeta = self.ome_attributes.multiscales
-        flat_self = self.to_flat()
 
         for multiscale in multimeta:
             multiscale_ndim = len(multiscale.axes)
             multiscale_dim_names = tuple(a.name for a in multiscale.axes)
             for dataset in multiscale.datasets:
                 try:
-                    maybe_arr: AnyArraySpec | AnyGroupSpec = flat_self[
-                        "/" + dataset.path.lstrip("/")
-                    ]
+                    maybe_arr: AnyArraySpec | AnyGroupSpec | None = _io.get_member_spec(
+                        self.members, dataset.path
+                    )
+                    if maybe_arr is None:
+                        raise KeyError(dataset.path)
                 except KeyError as e:
                     msg = (
                         f"The multiscale metadata references an array that does not "
@@ -289,6 +313,7 @@ class Image(BaseGroupv05[ImageAttrs]):
         return self
 
     @model_validator(mode="after")
+    @_io.requires_selected_members
     def _check_label_multiscales(self) -> Self:
         """
         Check that the number of multiscale levels in any labels are the same as
@@ -337,7 +362,15 @@ class Image(BaseGroupv05[ImageAttrs]):
         if not isinstance(labels_group, GroupSpec):
             raise ValueError("Node at path 'labels' is not a group")
 
-        return Labels(attributes=labels_group.attributes, members=labels_group.members)
+        with _io.member_checks(self):
+            return _io.member_model(
+                self,
+                "labels",
+                labels_group,
+                lambda: Labels(
+                    attributes=labels_group.attributes, members=labels_group.members
+                ),
+            )
 
     @property
     def datasets(self) -> tuple[tuple[Dataset, ...], ...]:
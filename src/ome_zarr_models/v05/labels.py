@@ -1,3 +1,4 @@
+from functools import partial
 from typing import TYPE_CHECKING, Any, Self
 
 import numpy as np
@@ -5,11 +6,20 @@ import numpy as np
 # Import needed for pydantic type resolution
 import pydantic_zarr  # noqa: F401
 import zarr
-import zarr.errors
 from pydantic import Field, ValidationError, model_validator
-from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, GroupSpec
-
-from ome_zarr_models.common.validation import check_array_spec, check_group_spec
+from pydantic_zarr.v3 import GroupSpec
+
+from ome_zarr_models import _io
+from ome_zarr_models._utils import (
+    _construct_lazy,
+    _group_from_zarr_async,
+    _read_members_async,
+)
+from ome_zarr_models.common.validation import (
+    check_array_spec,
+    check_group_spec,
+)
+from ome_zarr_models.selection import Selection
 from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs
 
 if TYPE_CHECKING:
@@ -34,23 +44,28 @@ VALID_DTYPES: list[np.dtype[Any]] = [
 ]
 
 
-def _check_valid_dtypes(labels: "Labels") -> "Labels":
+def _check_label_paths(labels: "Labels") -> "Labels":
     """
-    Check that all multiscales levels of a labels image are valid Label data types.
+    Check that all the label paths in the metadata are groups in the labels group.
     """
-    from ome_zarr_models.v05.image_label import ImageLabel
-
     if labels.members is None:
         raise RuntimeError(f"{labels.members=}")
 
     for label_path in labels.attributes.ome.labels:
         if label_path not in labels.members:
             raise ValueError(f"Label path '{label_path}' not found in zarr group")
-        label_spec = check_group_spec(labels, label_path)  # type: ignore[arg-type]
+        check_group_spec(labels, label_path)  # type: ignore[arg-type]
+
+    return labels
+
+
+def _check_valid_dtypes(labels: "Labels") -> "Labels":
+    """
+    Check that all multiscales levels of a labels image are valid Label data types.
+    """
+    for label_path in labels.attributes.ome.labels:
         try:
-            image_spec = ImageLabel(
-                attributes=label_spec.attributes, members=label_spec.members
-            )
+            image_spec = labels.get_image_labels_group(label_path)
         except ValidationError as e:
             raise RuntimeError(
                 f"Error validating multiscale image at path '{label_path}'. "
@@ -93,7 +108,13 @@ class Labels(
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    def from_zarr(  # type: ignore[override]
+        cls,
+        group: zarr.Group,
+        *,
+        lazy: bool = False,
+        selection: Selection | None = None,
+    ) -> Self:
         """
         Create an OME-Zarr labels model from a `zarr.Group`.
 
@@ -101,41 +122,78 @@ class Labels(
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr label metadata.
+        lazy :
+            If `True`, the label images in the group are not read straight away.
+            Instead each one is read the first time it is accessed in `members`.
+            The OME-Zarr metadata of the group is still validated, but
+            checks on the label images (e.g., their data types) are not run.
+        selection :
+            Parts of the label images to read (e.g., `include_arrays=False` to not
+            read any array metadata). If `None`, everything is read.
         """
+        return _io.run_sync(
+            cls._from_zarr_async(group._async_group, lazy=lazy), selection=selection
+        )
+
+    @classmethod
+    async def _from_zarr_async(
+        cls, group: zarr.AsyncGroup, *, lazy: bool = False
+    ) -> Self:
         from ome_zarr_models.v05.image_label import ImageLabel
 
-        attrs_dict = group.attrs.asdict()
-        label_attrs = LabelsAttrs.model_validate(group.attrs.asdict()["ome"])
+        attrs_dict = dict(group.attrs)
+        label_attrs = LabelsAttrs.model_validate(attrs_dict["ome"])
+        depth = _io.get_depth()
 
-        # Extract Zarr Image paths from multiscale metadata
-        members_tree_flat: dict[str, AnyGroupSpec | AnyArraySpec] = {}
-        for label_path in label_attrs.labels:
+        async def read_label(label_path: str) -> ImageLabel:
             try:
-                image_group = zarr.open_group(
-                    store=group.store_path,
-                    path=label_path,
-                    mode="r",
-                    zarr_format=3,
+                image_group = await _io.open_group_path(
+                    group, label_path, expected_zarr_version=3
                 )
-            except zarr.errors.GroupNotFoundError as err:
+            except FileNotFoundError as err:
                 raise ValueError(
                     f"Label path '{label_path}' not found in zarr group"
                 ) from err
             try:
-                image_model = ImageLabel.from_zarr(image_group).to_flat()
+                with _io.at_depth(depth + _io.path_depth(label_path)):
+                    label: ImageLabel = await _group_from_zarr_async(
+                        ImageLabel, image_group
+                    )
+                    return label
             except Exception as err:
                 msg = (
                     f"Error validating the label path '{label_path}' "
                     "as a OME-Zarr multiscales group."
                 )
                 raise RuntimeError(msg) from err
-            for path in image_model:
-                members_tree_flat["/" + label_path + path] = image_model[path]
 
-        members_normalized: AnyGroupSpec = GroupSpec.from_flat(members_tree_flat)
-        return cls(attributes=attrs_dict, members=members_normalized.members)
+        readers: dict[str, _io.MemberReader] = {
+            label_path: partial(read_label, label_path)
+            for label_path in label_attrs.labels
+        }
+        if lazy:
+            labels = _construct_lazy(
+                cls, attrs_dict, _io.LazyMembers(readers, GroupSpec)
+            )
+        else:
+            members_read, member_models = await _read_members_async(readers)
+            members = _io.build_members(members_read, GroupSpec)
+            labels = _io.construct_with_members(
+                partial(
+                    cls,
+                    attributes={**attrs_dict, "ome": label_attrs},
+                    members=members,
+                ),
+                members,
+                member_models,
+            )
+        _io.record_read_attributes(labels, group)
+        return labels
 
-    _check_valid_dtypes = model_validator(mode="after")(_check_valid_dtypes)
+    _check_label_paths = model_validator(mode="after")(_check_label_paths)
+    _check_valid_dtypes = model_validator(mode="after")(
+        _io.requires_arrays(_check_valid_dtypes)
+    )
 
     @property
     def label_paths(self) -> list[str]:
@@ -156,4 +214,10 @@ class Labels(
         if not isinstance(spec, GroupSpec):
             raise RuntimeError(f"Node at {path} is not a group")
 
-        return ImageLabel(attributes=spec.attributes, members=spec.members)
+        with _io.member_checks(self):
+            return _io.member_model(
+                self,
+                path,
+                spec,
+                lambda: ImageLabel(attributes=spec.attributes, members=spec.members),
+            )
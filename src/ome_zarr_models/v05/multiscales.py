@@ -5,7 +5,6 @@ from collections import Counter
 from typing import TYPE_CHECKING, Any, Literal, Self, overload
 
 from pydantic import (
-    BaseModel,
     Field,
     JsonValue,
     SerializerFunctionWrapHandler,
@@ -16,13 +15,13 @@ from pydantic import (
 
 from ome_zarr_models.base import BaseAttrs
 from ome_zarr_models.common.coordinate_transformations import (
-    Transform,
     ValidTransform,
     VectorScale,
     VectorTransform,
     VectorTranslation,
     _build_transforms,
     _ndim,
+    _validate_transforms,
 )
 from ome_zarr_models.common.validation import (
     check_length,
@@ -362,10 +361,7 @@ class Dataset(BaseAttrs):
         # This is a bit convoluted, but we do it because the default pydantic error
         # messages are a mess otherwise
 
-        class Transforms(BaseModel):
-            transforms: list[Transform]
-
-        transforms = Transforms(transforms=transforms_obj).transforms
+        transforms = _validate_transforms(transforms_obj)
         check_length(transforms, valid_lengths=[1, 2], variable_name="transforms")
 
         transform_types = tuple(t.type for t in transforms)
@@ -4,7 +4,9 @@ from typing import Self
 import pydantic_zarr  # noqa: F401
 import zarr
 
-from ome_zarr_models._utils import _from_zarr_v3
+from ome_zarr_models import _io
+from ome_zarr_models._utils import _from_zarr_v3_async
+from ome_zarr_models.selection import Selection
 from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs
 from ome_zarr_models.v05.image import Image
 from ome_zarr_models.v05.well_types import WellMeta
@@ -29,7 +31,9 @@ class Well(BaseGroupv05[WellAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, selection: Selection | None = None
+    ) -> Self:
         """
         Create an OME-Zarr well model from a `zarr.Group`.
 
@@ -37,5 +41,13 @@ class Well(BaseGroupv05[WellAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr well metadata.
+        selection :
+            Images and labels to read. If `None`, everything is read.
         """
-        return _from_zarr_v3(group, cls, WellAttrs)
+        return _io.run_sync(
+            cls._from_zarr_async(group._async_group), selection=selection
+        )
+
+    @classmethod
+    async def _from_zarr_async(cls, group: zarr.AsyncGroup) -> Self:
+        return await _from_zarr_v3_async(group, cls, WellAttrs)
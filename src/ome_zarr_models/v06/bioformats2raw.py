@@ -1,14 +1,20 @@
-from typing import Literal, Self
+import functools
+import itertools
+from typing import TYPE_CHECKING, Literal, Self
 
 import pydantic_zarr.v3
 import zarr
 from pydantic import Field, JsonValue
 
-from ome_zarr_models._utils import check_group_path  # type: ignore[attr-defined]
+from ome_zarr_models import _io
+from ome_zarr_models._utils import _group_from_zarr_async
 from ome_zarr_models.v06.base import BaseGroupv06, BaseOMEAttrs
 from ome_zarr_models.v06.image import Image
 from ome_zarr_models.v06.plate import Plate
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 class BioFormats2RawAttrs(BaseOMEAttrs):
     """
@@ -55,52 +61,59 @@ class BioFormats2Raw(
         group : zarr.Group
             A Zarr group that has valid OME-Zarr bioformats2raw metadata.
         """
-        # on unlistable storage backends, the members of this group will be {}
-        group_spec_in: pydantic_zarr.v3.AnyGroupSpec
-        group_spec_in = pydantic_zarr.v3.GroupSpec.from_zarr(group, depth=0)
-
-        members_tree_flat: dict[
-            str, pydantic_zarr.v3.AnyGroupSpec | pydantic_zarr.v3.AnyArraySpec
-        ] = {}
-
-        # Possible image paths
-        image_index = 0
-        while True:
-            image_path = str(image_index)
-            try:
-                check_group_path(group, str(image_path), expected_zarr_version=3)
-            except FileNotFoundError:
-                break
-
-            group_flat = Image.from_zarr(group[image_path]).to_flat()  # type: ignore[arg-type]
-            for path in group_flat:
-                members_tree_flat["/" + image_path + path] = group_flat[path]
-            image_index += 1
-
-        members_normalized: pydantic_zarr.v3.AnyGroupSpec = (
-            pydantic_zarr.v3.GroupSpec.from_flat(members_tree_flat)
+        return _io.run_sync(cls._from_zarr_async(group._async_group))
+
+    @classmethod
+    async def _from_zarr_async(cls, group: zarr.AsyncGroup) -> Self:
+        attributes = dict(group.attrs)
+
+        ome_attributes = attributes.get("ome")
+        series = (
+            ome_attributes.get("series") if isinstance(ome_attributes, dict) else None
+        )
+        # If the image paths aren't listed in the metadata, images are at
+        # paths "0", "1", "2"...
+        image_groups = await _io.open_numbered_groups(
+            group,
+            expected_zarr_version=3,
+            paths=_series_paths(series),
+        )
+        # The images are one level below this group
+        with _io.at_depth(_io.get_depth() + 1):
+            images = await _io.gather_in_order(
+                *(
+                    _group_from_zarr_async(Image, image_group)
+                    for image_group in image_groups.values()
+                )
+            )
+
+        members = _io.build_members(
+            dict(zip(image_groups, images, strict=True)), pydantic_zarr.v3.GroupSpec
         )
-        return cls(
-            members=members_normalized.members, attributes=group_spec_in.attributes
+        model = _io.construct_with_members(
+            functools.partial(cls, members=members, attributes=attributes),
+            members,
+            dict(zip(image_groups, images, strict=True)),
         )
+        _io.record_read_attributes(model, group)
+        return model
 
-    @property
+    @functools.cached_property
     def image_paths(self) -> list[str]:
         """
         All paths to OME-Zarr images in this group.
         """
-        image_index = 0
-        image_paths = []
         if self.members is None:
             raise RuntimeError("Did not find any members in this group")
-        while True:
-            if str(image_index) in self.members:
-                image_paths.append(str(image_index))
-                image_index += 1
-            else:
-                break
-
-        return image_paths
+        series_paths = _series_paths(self.ome_attributes.series)
+        paths: Iterable[str] = (
+            (str(index) for index in itertools.count())
+            if series_paths is None
+            else series_paths
+        )
+        return list(
+            itertools.takewhile(lambda path: path in self.members, paths)  # type: ignore[operator]
+        )
 
     @property
     def images(self) -> dict[str, Image]:
@@ -112,7 +125,27 @@ class BioFormats2Raw(
         images
             Mapping from image path to Image object.
         """
-        return {
-            path: Image.model_validate(self.members[path].model_dump())  # type: ignore[index]
-            for path in self.image_paths
-        }
+        images = {}
+        with _io.member_checks(self):
+            for path in self.image_paths:
+                spec = self.members[path]  # type: ignore[index]
+                images[path] = _io.member_model(
+                    self,
+                    path,
+                    spec,
+                    functools.partial(
+                        Image,
+                        attributes=spec.attributes,
+                        members=spec.members,  # type: ignore[union-attr]
+                    ),
+                )
+        return images
+
+
+def _series_paths(series: JsonValue | None) -> list[str] | None:
+    """
+    Get the image paths listed in the series metadata, if there are any.
+    """
+    if isinstance(series, list) and all(isinstance(path, str) for path in series):
+        return series  # type: ignore[return-value]
+    return None
@@ -1,20 +1,22 @@
-from collections.abc import Generator, Mapping
-from typing import TYPE_CHECKING, Self
+from collections.abc import Generator, Iterator, Mapping
+from functools import partial
+from typing import Self
 
 # Import needed for pydantic type resolution
 import pydantic_zarr  # noqa: F401
 import zarr
 from pydantic import model_validator
 from pydantic_zarr.v3 import GroupSpec
+from zarr.abc.store import Store
 
-from ome_zarr_models._utils import _from_zarr_v3
+from ome_zarr_models import _io
+from ome_zarr_models._utils import _from_zarr_v3_async, _write_changed_metadata
 from ome_zarr_models.common.well import WellGroupNotFoundError
+from ome_zarr_models.selection import Selection
 from ome_zarr_models.v06.base import BaseGroupv06, BaseOMEAttrs
+from ome_zarr_models.v06.image import Image
 from ome_zarr_models.v06.plate import Plate
-from ome_zarr_models.v06.well import Well
-
-if TYPE_CHECKING:
-    from pydantic_zarr.v3 import AnyGroupSpec
+from ome_zarr_models.v06.well import Well, WellAttrs
 
 __all__ = ["HCS", "HCSAttrs"]
 
@@ -36,7 +38,13 @@ class HCS(BaseGroupv06[HCSAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    def from_zarr(  # type: ignore[override]
+        cls,
+        group: zarr.Group,
+        *,
+        lazy: bool = False,
+        selection: Selection | None = None,
+    ) -> Self:
         """
         Create an OME-Zarr image model from a `zarr.Group`.
 
@@ -44,21 +52,168 @@ class HCS(BaseGroupv06[HCSAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
+        lazy :
+            If `True`, the wells in the group are not read straight away.
+            Instead each one is read the first time it is accessed in `members`.
+            The OME-Zarr metadata of the group is still validated, but
+            checks that the wells are consistent with the plate metadata are not run.
+        selection :
+            Wells, images and labels to read. If `None`, everything is read.
         """
-        hcs = _from_zarr_v3(group, cls, HCSAttrs)
-        # Traverse all the Well groups, which themselves contain Image groups
-        hcs_flat = hcs.to_flat()
-        for well in hcs.ome_attributes.plate.wells:
-            if well.path in group:
-                well_group = group[well.path]
-                well_group_flat = Well.from_zarr(well_group).to_flat()  # type: ignore[arg-type]
-                for path in well_group_flat:
-                    hcs_flat["/" + well.path + path] = well_group_flat[path]
+        return _io.run_sync(
+            cls._from_zarr_async(group._async_group, lazy=lazy), selection=selection
+        )
+
+    @classmethod
+    async def _from_zarr_async(
+        cls, group: zarr.AsyncGroup, *, lazy: bool = False
+    ) -> Self:
+        # Wells are optional group paths of HCSAttrs, so they are read along
+        # with the other members of the group
+        return await _from_zarr_v3_async(group, cls, HCSAttrs, lazy=lazy)
+
+    @classmethod
+    def iter_wells(
+        cls,
+        group: zarr.Group,
+        *,
+        read_ahead: int = 8,
+        selection: Selection | None = None,
+    ) -> Iterator[tuple[str, Well]]:
+        """
+        Read the wells of a plate one at a time.
+
+        Unlike `HCS.from_zarr(group).well_groups`, this does not read the
+        whole plate before returning the first well. Wells are yielded in
+        the order they are listed in the plate metadata, as soon as they have
+        been read and validated. Only *read_ahead* wells are read in advance,
+        so memory use does not grow with the size of the plate.
 
-        hcs_unflat: AnyGroupSpec = GroupSpec.from_flat(hcs_flat)
-        return cls(attributes=hcs_unflat.attributes, members=hcs_unflat.members)
+        Wells that are listed in the plate metadata but do not exist are skipped.
+
+        Parameters
+        ----------
+        group : zarr.Group
+            A Zarr group that has valid OME-Zarr plate metadata.
+        read_ahead :
+            Number of wells to read ahead of the well that is being processed.
+        selection :
+            Wells, images and labels to read. If `None`, everything is read.
+
+        Yields
+        ------
+        path :
+            Path of the well within the plate.
+        well :
+            Well model.
+        """
+        async_group = group._async_group
+
+        async def read_well(well_path: str) -> tuple[str, Well] | None:
+            if not _io.is_selected(well_path, Well):
+                return None
+            try:
+                well_group = await _io.open_group_path(
+                    async_group, well_path, expected_zarr_version=3
+                )
+            except FileNotFoundError:
+                return None
+            with _io.at_depth(_io.path_depth(well_path)):
+                return well_path, await Well._from_zarr_async(well_group)
+
+        for well in _io.iter_sync(
+            (
+                partial(read_well, well.path)
+                for well in _get_plate_attrs(group).plate.wells
+            ),
+            read_ahead=read_ahead,
+            selection=selection,
+        ):
+            if well is not None:
+                yield well
+
+    @classmethod
+    def iter_images(
+        cls,
+        group: zarr.Group,
+        *,
+        read_ahead: int = 8,
+        selection: Selection | None = None,
+    ) -> Iterator[tuple[str, Image]]:
+        """
+        Read the images in all the wells of a plate one at a time.
+
+        This is the same as [iter_wells][ome_zarr_models.v06.hcs.HCS.iter_wells],
+        but yields each image in each well. The images in a well are read
+        together, and *read_ahead* is the number of wells read in advance.
+        Images that are listed in the well metadata but do not exist are skipped.
+
+        Parameters
+        ----------
+        group : zarr.Group
+            A Zarr group that has valid OME-Zarr plate metadata.
+        read_ahead :
+            Number of wells to read ahead of the well that is being processed.
+        selection :
+            Wells, images and labels to read. If `None`, everything is read.
+
+        Yields
+        ------
+        path :
+            Path of the image within the plate.
+        image :
+            Image model.
+        """
+        async_group = group._async_group
+
+        async def read_image(
+            well_group: zarr.AsyncGroup, image_path: str
+        ) -> tuple[str, Image] | None:
+            if not _io.is_selected(image_path, Image):
+                return None
+            try:
+                image_group = await _io.open_group_path(
+                    well_group, image_path, expected_zarr_version=3
+                )
+            except FileNotFoundError:
+                return None
+            with _io.at_depth(_io.get_depth() + _io.path_depth(image_path)):
+                return image_path, await Image._from_zarr_async(image_group)
+
+        async def read_well_images(well_path: str) -> list[tuple[str, Image]]:
+            if not _io.is_selected(well_path, Well):
+                return []
+            try:
+                well_group = await _io.open_group_path(
+                    async_group, well_path, expected_zarr_version=3
+                )
+            except FileNotFoundError:
+                return []
+            well_attrs = WellAttrs.model_validate(dict(well_group.attrs)["ome"])
+            with _io.at_depth(_io.path_depth(well_path)):
+                images = await _io.gather_in_order(
+                    *(
+                        read_image(well_group, image.path)
+                        for image in well_attrs.well.images
+                    )
+                )
+            return [
+                (f"{well_path}/{image_path}", image)
+                for image_path, image in filter(None, images)
+            ]
+
+        for images in _io.iter_sync(
+            (
+                partial(read_well_images, well.path)
+                for well in _get_plate_attrs(group).plate.wells
+            ),
+            read_ahead=read_ahead,
+            selection=selection,
+        ):
+            yield from images
 
     @model_validator(mode="after")
+    @_io.requires_selected_members
     def _check_valid_acquisitions(self) -> Self:
         """
         Check well acquisition IDs are in list of plate acquisition ids.
@@ -68,12 +223,13 @@ class HCS(BaseGroupv06[HCSAttrs]):
             return self
 
         valid_aq_ids = [aq.id for aq in acquisitions]
+        valid_aq_ids_set = set(valid_aq_ids)
 
         for well_i, well_group in enumerate(self.well_groups):
             for image_i, well_image in enumerate(well_group.ome_attributes.well.images):
                 if well_image.acquisition is None:
                     continue
-                elif well_image.acquisition not in valid_aq_ids:
+                elif well_image.acquisition not in valid_aq_ids_set:
                     msg = (
                         f"Acquisition ID '{well_image.acquisition} "
                         f"(found in well {well_i}, {image_i}) "
@@ -143,4 +299,93 @@ class HCS(BaseGroupv06[HCSAttrs]):
                 f"Column '{col}' not found in row group members: {self.members[row]}"
             )
         group = row_group.members[col]
-        return Well(attributes=group.attributes, members=group.members)
+        with _io.member_checks(self):
+            return _io.member_model(
+                self,
+                well_path,
+                group,
+                lambda: Well(attributes=group.attributes, members=group.members),
+            )
+
+    def replace_well(
+        self, store: Store, well_path: str, well: Well, *, path: str = ""
+    ) -> Self:
+        """
+        Replace a well in this plate, and write the changes to a Zarr store.
+
+        The whole plate is validated with the new well before anything is
+        written. Only the metadata documents of the new well, and of its
+        images, labels and arrays, that are different from the existing ones are
+        written. As with
+        [update_attributes][ome_zarr_models.base.BaseGroup.update_attributes],
+        writes are conditional on the documents in the store not having
+        changed since this plate was read.
+
+        Nothing is deleted: images or labels of the existing well that are not
+        in the new well are left in the store, but are no longer listed in the
+        well metadata.
+
+        Parameters
+        ----------
+        store :
+            Store that this plate was read from.
+        well_path :
+            Path of the well in the plate metadata (e.g., `"A/1"`).
+        well :
+            New well.
+        path :
+            Path to this plate within the store.
+
+        Returns
+        -------
+        plate :
+            The updated plate.
+
+        Raises
+        ------
+        MetadataConflictError
+            If a document that needs to be written has changed in the store
+            since this plate was read.
+        ValueError
+            If *well_path* is not in the plate metadata.
+        """
+        if well_path not in {
+            plate_well.path for plate_well in self.ome_attributes.plate.wells
+        }:
+            raise ValueError(f"Well '{well_path}' is not in the plate metadata")
+        row, col = well_path.split("/")
+        members = dict(self.members or {})
+        row_group = members.get(row)
+        if isinstance(row_group, GroupSpec):
+            row_attributes, row_members = row_group.attributes, row_group.members
+        else:
+            row_attributes, row_members = {}, {}
+        # Made from the current fields of the well, rather than re-using a
+        # specification stored on the model
+        well_spec = _io.as_plain_group_spec(well, GroupSpec)
+        members[row] = GroupSpec(
+            attributes=row_attributes,
+            members={**(row_members or {}), col: well_spec},
+        )
+        models = {
+            member_path: model
+            for member_path, (_, model) in self._member_models.items()
+            if member_path != well_path
+        }
+        updated = _io.construct_with_members(
+            partial(type(self), attributes=self.attributes, members=members),
+            members,
+            {**models, well_path: well},
+        )
+        _write_changed_metadata(self, updated, store, path)
+        return updated
+
+
+def _get_plate_attrs(group: zarr.Group) -> HCSAttrs:
+    """
+    Get and validate the plate attributes of a Zarr group.
+    """
+    attrs_dict = group.attrs.asdict()
+    if "ome" not in attrs_dict:
+        raise ValueError("Zarr group attributes does not contain an 'ome' key")
+    return HCSAttrs.model_validate(attrs_dict["ome"])
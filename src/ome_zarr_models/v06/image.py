@@ -7,7 +7,9 @@ import zarr
 from pydantic import Field, JsonValue, model_validator
 from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, GroupSpec
 
-from ome_zarr_models._utils import TransformGraph, _from_zarr_v3
+from ome_zarr_models import _io
+from ome_zarr_models._utils import TransformGraph, _from_zarr_v3_async
+from ome_zarr_models.selection import Selection
 from ome_zarr_models.v06.base import BaseGroupv06, BaseOMEAttrs, BaseZarrAttrs
 from ome_zarr_models.v06.coordinate_transforms import (
     AnyTransform,
@@ -70,7 +72,13 @@ class Image(BaseGroupv06[ImageAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    def from_zarr(  # type: ignore[override]
+        cls,
+        group: zarr.Group,
+        *,
+        lazy: bool = False,
+        selection: Selection | None = None,
+    ) -> Self:
         """
         Create an OME-Zarr image model from a `zarr.Group`.
 
@@ -78,8 +86,23 @@ class Image(BaseGroupv06[ImageAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
+        lazy :
+            If `True`, the arrays and labels in the group are not read straight away.
+            Instead each one is read the first time it is accessed in `members`.
+            The OME-Zarr metadata of the group is still validated, but
+            checks that the arrays are consistent with the metadata are not run.
+        selection :
+            Labels to read. If `None`, everything is read.
         """
-        return _from_zarr_v3(group, cls, ImageAttrs)
+        return _io.run_sync(
+            cls._from_zarr_async(group._async_group, lazy=lazy), selection=selection
+        )
+
+    @classmethod
+    async def _from_zarr_async(
+        cls, group: zarr.AsyncGroup, *, lazy: bool = False
+    ) -> Self:
+        return await _from_zarr_v3_async(group, cls, ImageAttrs, lazy=lazy)
 
     @classmethod
     def new(
@@ -137,10 +160,9 @@ class Image(BaseGroupv06[ImageAttrs]):
                 f"Length of arrays (got {len(array_specs)=}) must be the same as "
                 f"length of paths (got {len(paths)=})"
             )
-        members_flat = {
-            "/" + key.lstrip("/"): arr
-            for key, arr in zip(paths, array_specs, strict=True)
-        }
+        members = _io.build_members(
+            dict(zip(paths, array_specs, strict=True)), GroupSpec
+        )
 
         if len(scales) != len(paths):
             raise ValueError(
@@ -175,7 +197,7 @@ class Image(BaseGroupv06[ImageAttrs]):
             type=multiscale_type,
         )
         return Image(
-            members=GroupSpec.from_flat(members_flat).members,
+            members=members,
             attributes=BaseZarrAttrs(
                 ome=ImageAttrs(
                     multiscales=[
@@ -187,6 +209,7 @@ class Image(BaseGroupv06[ImageAttrs]):
         )
 
     @model_validator(mode="after")
+    @_io.requires_arrays
     def _check_arrays_compatible(self) -> Self:
         """
         Check that all the arrays referenced by the `multiscales` metadata meet the
@@ -197,15 +220,16 @@ class Image(BaseGroupv06[ImageAttrs]):
               metadata.
         """
         multimeta = self.ome_attributes.multiscales
-        flat_self = self.to_flat()
 
         for multiscale in multimeta:
             multiscale_ndim = multiscale.ndim
             for dataset in multiscale.datasets:
                 try:
-                    maybe_arr: AnyArraySpec | AnyGroupSpec = flat_self[
-                        "/" + dataset.path.lstrip("/")
-                    ]
+                    maybe_arr: AnyArraySpec | AnyGroupSpec | None = _io.get_member_spec(
+                        self.members, dataset.path
+                    )
+                    if maybe_arr is None:
+                        raise KeyError(dataset.path)
                 except KeyError as e:
                     msg = (
                         f"The multiscale metadata references an array that does not "
@@ -231,6 +255,7 @@ class Image(BaseGroupv06[ImageAttrs]):
         return self
 
     @model_validator(mode="after")
+    @_io.requires_selected_members
     def _check_label_multiscales(self) -> Self:
         """
         Check that the number of multiscale levels in any labels are the same as
@@ -279,7 +304,15 @@ class Image(BaseGroupv06[ImageAttrs]):
         if not isinstance(labels_group, GroupSpec):
             raise ValueError("Node at path 'labels' is not a group")
 
-        return Labels(attributes=labels_group.attributes, members=labels_group.members)
+        with _io.member_checks(self):
+            return _io.member_model(
+                self,
+                "labels",
+                labels_group,
+                lambda: Labels(
+                    attributes=labels_group.attributes, members=labels_group.members
+                ),
+            )
 
     @property
     def datasets(self) -> tuple[tuple[Dataset, ...], ...]:
@@ -1,12 +1,14 @@
 import warnings
 from collections.abc import Sequence
+from functools import partial
 from typing import Self
 
 import zarr
 from pydantic import BaseModel, Field
 from pydantic_zarr.v3 import GroupSpec
 
-from ome_zarr_models._utils import TransformGraph, _from_zarr_v3
+from ome_zarr_models import _io
+from ome_zarr_models._utils import TransformGraph, _from_zarr_v3_async
 from ome_zarr_models.v06.base import BaseGroupv06, BaseOMEAttrs, BaseZarrAttrs
 from ome_zarr_models.v06.coordinate_transforms import (
     AnyTransform,
@@ -62,7 +64,11 @@ class Scene(BaseGroupv06[BaseSceneAttrs]):
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
         """
-        return _from_zarr_v3(group, cls, BaseSceneAttrs)
+        return _io.run_sync(cls._from_zarr_async(group._async_group))
+
+    @classmethod
+    async def _from_zarr_async(cls, group: zarr.AsyncGroup) -> Self:
+        return await _from_zarr_v3_async(group, cls, BaseSceneAttrs)
 
     @classmethod
     def new(
@@ -91,16 +97,8 @@ class Scene(BaseGroupv06[BaseSceneAttrs]):
         first write this class to a Zarr store, and then write data to the Zarr
         arrays in that store.
         """
-        members_flat = {}
-        for name, image in images.items():
-            base_path = "/" + name.lstrip("/")
-            # Get the flattened representation of the image
-            image_flat = image.to_flat(root_path=base_path)
-            # Merge into the scene's flat dict
-            members_flat.update(image_flat)
-
         return Scene(
-            members=GroupSpec.from_flat(members_flat).members,
+            members=_io.build_members(images, GroupSpec),
             attributes=BaseZarrAttrs(
                 ome=BaseSceneAttrs(
                     scene=SceneAttrs(
@@ -128,8 +126,11 @@ class Scene(BaseGroupv06[BaseSceneAttrs]):
                     stacklevel=2,
                 )
                 continue
-            images[member_name] = Image(
-                attributes=member.attributes, members=member.members
+            images[member_name] = _io.member_model(
+                self,
+                member_name,
+                member,
+                partial(Image, attributes=member.attributes, members=member.members),
             )
         return images
 
@@ -147,8 +148,7 @@ class Scene(BaseGroupv06[BaseSceneAttrs]):
         for transform in self.ome_attributes.scene.coordinateTransformations:
             graph.add_transform(transform)
 
-        images = self.images
-        for image_path in self.images:
-            graph.add_subgraph(image_path, images[image_path].transform_graph())
+        for image_path, image in self.images.items():
+            graph.add_subgraph(image_path, image.transform_graph())
 
         return graph
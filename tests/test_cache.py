@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import zarr
+from zarr.storage import LocalStore, MemoryStore
+
+from ome_zarr_models import cache as cache_module
+from ome_zarr_models.cache import (
+    DiskMetadataCacheStore,
+    ListingIndexStore,
+    LRUMetadataCache,
+    _write_atomic,
+    get_metadata_cache,
+    set_metadata_cache,
+)
+from ome_zarr_models.v05.image import Image
+from tests.v05.test_image import make_valid_image_group
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+    from pathlib import Path
+
+    from zarr.abc.store import ByteRequest
+    from zarr.core.buffer import Buffer, BufferPrototype
+
+
+@pytest.fixture
+def cache() -> Iterator[LRUMetadataCache]:
+    cache = LRUMetadataCache()
+    set_metadata_cache(cache)
+    yield cache
+    set_metadata_cache(None)
+
+
+def test_no_cache_by_default() -> None:
+    assert get_metadata_cache() is None
+
+
+def test_lru_eviction() -> None:
+    group_metadata = zarr.create_group(MemoryStore()).metadata
+    cache = LRUMetadataCache(maxsize=2)
+    cache.set(("store", "a"), group_metadata)
+    cache.set(("store", "b"), group_metadata)
+    # Use 'a', so 'b' is the least recently used
+    assert cache.get(("store", "a")) is group_metadata
+    cache.set(("store", "c"), group_metadata)
+
+    assert len(cache) == 2
+    assert cache.get(("store", "b")) is None
+    assert cache.get(("store", "a")) is group_metadata
+    assert cache.get(("store", "c")) is group_metadata
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    group_metadata = zarr.create_group(MemoryStore()).metadata
+    cache = LRUMetadataCache(ttl=10)
+    monkeypatch.setattr("time.monotonic", lambda: 100)
+    cache.set(("store", "a"), group_metadata)
+    monkeypatch.setattr("time.monotonic", lambda: 105)
+    assert cache.get(("store", "a")) is group_metadata
+    monkeypatch.setattr("time.monotonic", lambda: 111)
+    assert cache.get(("store", "a")) is None
+    assert len(cache) == 0
+
+
+def test_invalidate() -> None:
+    group_metadata = zarr.create_group(MemoryStore()).metadata
+    cache = LRUMetadataCache()
+    for key in [("store", "a"), ("store", "a/b"), ("store", "ab"), ("other", "a")]:
+        cache.set(key, group_metadata)
+
+    cache.invalidate("store", "a")
+    assert cache.get(("store", "a")) is None
+    assert cache.get(("store", "a/b")) is None
+    assert cache.get(("store", "ab")) is group_metadata
+    assert cache.get(("other", "a")) is group_metadata
+
+    cache.invalidate("store")
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"ttl": 0}], ids=["maxsize", "ttl"])
+def test_invalid_args(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError):
+        LRUMetadataCache(**kwargs)  # type: ignore[arg-type]
+
+
+def test_from_zarr_uses_cache(cache: LRUMetadataCache, tmp_path: Path) -> None:
+    data_path = tmp_path / "image.ome.zarr"
+    group = make_valid_image_group(LocalStore(data_path))
+    image = Image.from_zarr(group)
+    assert cache.hits == 0
+    assert len(cache) == 3
+
+    # Delete the array metadata, to check it isn't read from the store
+    for array_path in ["0", "1", "2"]:
+        (data_path / array_path / "zarr.json").unlink()
+    assert Image.from_zarr(group) == image
+    assert cache.hits == 3
+
+
+def test_to_zarr_invalidates_cache(cache: LRUMetadataCache, tmp_path: Path) -> None:
+    store = LocalStore(tmp_path / "image.ome.zarr")
+    group = make_valid_image_group(store)
+    image = Image.from_zarr(group)
+    assert len(cache) == 3
+
+    image.to_zarr(store, path="", overwrite=True)
+    assert len(cache) == 0
+
+
+def test_memory_store_not_cached(cache: LRUMetadataCache) -> None:
+    # The identity of an in-memory store can be re-used by a new store after
+    # the old one has been garbage collected
+    store_dict: dict[str, Buffer] = {}
+    group = make_valid_image_group(MemoryStore(store_dict=store_dict))
+    image = Image.from_zarr(group)
+    assert len(cache) == 0
+
+    del store_dict["0/zarr.json"]
+    with pytest.raises(ValueError, match="Expected to find an array at 0"):
+        Image.from_zarr(group)
+    assert Image.from_zarr(make_valid_image_group(MemoryStore())) == image
+    assert len(cache) == 0
+
+
+def test_disk_cache(tmp_path: Path) -> None:
+    data_path = tmp_path / "image.ome.zarr"
+    image = Image.from_zarr(make_valid_image_group(LocalStore(data_path)))
+
+    store = DiskMetadataCacheStore(
+        LocalStore(data_path, read_only=True), tmp_path / "cache", max_age=3600
+    )
+    assert Image.from_zarr(zarr.open_group(store, mode="r")) == image
+    cached_files = {
+        path.name for path in (tmp_path / "cache").glob("*/**/*") if path.is_file()
+    }
+    assert {name for name in cached_files if not name.endswith(".info.json")} == {
+        "zarr.json"
+    }
+    # Documents that don't exist are cached without any data
+    assert {"zarr.json.info.json", ".zattrs.info.json"} <= cached_files
+
+    # Cached documents are used without checking the source
+    (data_path / "0" / "zarr.json").unlink()
+    assert Image.from_zarr(zarr.open_group(store, mode="r")) == image
+
+
+def test_disk_cache_revalidate(tmp_path: Path) -> None:
+    data_path = tmp_path / "image.ome.zarr"
+    make_valid_image_group(LocalStore(data_path))
+    store = DiskMetadataCacheStore(
+        LocalStore(data_path, read_only=True), tmp_path / "cache"
+    )
+    assert zarr.open_group(store, mode="r").attrs["ome"]["version"] == "0.5"
+
+    metadata_path = data_path / "zarr.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata["attributes"]["new_key"] = 1
+    metadata_path.write_text(json.dumps(metadata))
+    assert zarr.open_group(store, mode="r").attrs["new_key"] == 1
+
+    # Documents that have been deleted from the source are removed from the cache
+    metadata_path.unlink()
+    with pytest.raises(FileNotFoundError):
+        zarr.open_group(store, mode="r")
+    assert not any((tmp_path / "cache").glob("*/zarr.json"))
+    # Documents that are created again are downloaded
+    metadata_path.write_text(json.dumps(metadata))
+    assert zarr.open_group(store, mode="r").attrs["new_key"] == 1
+
+
+def test_disk_cache_not_in_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    in_event_loop: list[bool] = []
+    for name in ["_read_cached", "_write_cached"]:
+        func = getattr(cache_module, name)
+
+        def recording(*args: Any, _func: Any = func) -> Any:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                in_event_loop.append(False)
+            else:
+                in_event_loop.append(True)
+            return _func(*args)
+
+        monkeypatch.setattr(cache_module, name, recording)
+
+    data_path = tmp_path / "image.ome.zarr"
+    make_valid_image_group(LocalStore(data_path))
+    store = DiskMetadataCacheStore(
+        LocalStore(data_path, read_only=True), tmp_path / "cache", max_age=3600
+    )
+    for _ in range(2):
+        Image.from_zarr(zarr.open_group(store, mode="r"))
+    # Cached files are read and written in other threads
+    assert in_event_loop
+    assert not any(in_event_loop)
+
+
+class ChangingLocalStore(LocalStore):
+    """
+    A local store that changes a document just after it is first read.
+    """
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        value = await super().get(key, prototype, byte_range)
+        if key == "zarr.json" and value is not None:
+            metadata_path = self.root / key
+            metadata = json.loads(metadata_path.read_text())
+            if "new_key" not in metadata["attributes"]:
+                metadata["attributes"]["new_key"] = 1
+                metadata_path.write_text(json.dumps(metadata))
+        return value
+
+
+def test_disk_cache_changed_while_reading(tmp_path: Path) -> None:
+    data_path = tmp_path / "image.ome.zarr"
+    make_valid_image_group(LocalStore(data_path))
+    store = DiskMetadataCacheStore(
+        ChangingLocalStore(data_path, read_only=True), tmp_path / "cache"
+    )
+    assert "new_key" not in zarr.open_group(store, mode="r").attrs
+    # The cached document is older than the revalidation information
+    # describes, so it is downloaded again
+    assert zarr.open_group(store, mode="r").attrs["new_key"] == 1
+
+
+def test_disk_cache_concurrent_writes(tmp_path: Path) -> None:
+    path = tmp_path / "zarr.json"
+    values = [str(i).encode() * 1000 for i in range(8)]
+
+    def write(value: bytes) -> None:
+        for _ in range(50):
+            _write_atomic(path, value)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(values)) as executor:
+        list(executor.map(write, values))
+    assert path.read_bytes() in values
+    assert list(tmp_path.iterdir()) == [path]
+
+
+class RecordingMemoryStore(MemoryStore):
+    """
+    A memory store that records the keys that are read, and the prefixes listed.
+    """
+
+    def __init__(
+        self, store_dict: dict[str, Buffer], *, read_only: bool = False
+    ) -> None:
+        super().__init__(store_dict=store_dict, read_only=read_only)
+        self.keys: list[str] = []
+        self.prefixes: list[str] = []
+
+    def with_read_only(self, read_only: bool = False) -> RecordingMemoryStore:
+        store = RecordingMemoryStore(self._store_dict, read_only=read_only)
+        store.keys = self.keys
+        store.prefixes = self.prefixes
+        return store
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        self.keys.append(key)
+        return await super().get(key, prototype, byte_range)
+
+    async def list_prefix(self, prefix: str) -> AsyncIterator[str]:
+        self.prefixes.append(prefix)
+        async for key in super().list_prefix(prefix):
+            yield key
+
+
+def test_listing_index_store() -> None:
+    store_dict: dict[str, Buffer] = {}
+    make_valid_image_group(MemoryStore(store_dict=store_dict))
+    expected = Image.from_zarr(zarr.open_group(store_dict, mode="r"))
+    store = RecordingMemoryStore(store_dict)
+    group = zarr.open_group(ListingIndexStore(store), mode="r")
+    assert Image.from_zarr(group) == expected
+    # The store is only listed once, and the labels group that doesn't exist
+    # is never requested
+    assert store.prefixes == [""]
+    assert not any(key.startswith("labels") for key in store.keys)
+
+
+def test_listing_index_store_prefix() -> None:
+    image_dict: dict[str, Buffer] = {}
+    make_valid_image_group(MemoryStore(store_dict=image_dict))
+    store = RecordingMemoryStore(
+        {f"image/{key}": value for key, value in image_dict.items()}
+    )
+    index_store = ListingIndexStore(store, prefix="image/")
+    Image.from_zarr(zarr.open_group(index_store, path="image", mode="r"))
+    assert store.prefixes == ["image/"]
+    assert asyncio.run(index_store.contains_node("image/labels")) is False
+    assert asyncio.run(index_store.contains_node("image/0")) is True
+    assert asyncio.run(index_store.contains_node("other")) is None
+
+
+def test_listing_index_store_not_listable() -> None:
+    store = MemoryStore()
+    store.supports_listing = False  # type: ignore[misc]
+    with pytest.raises(ValueError, match="does not support listing"):
+        ListingIndexStore(store)
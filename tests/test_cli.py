@@ -7,6 +7,7 @@ import zarr
 from zarr.storage import LocalStore
 
 from ome_zarr_models._cli import main
+from ome_zarr_models.cache import DiskMetadataCacheStore
 
 from .conftest import Version, json_to_zarr_group
 
@@ -94,6 +95,90 @@ def test_cli_validate(
         assert "Valid OME-Zarr" in capsys.readouterr().out
 
 
+@pytest.mark.parametrize("cmd", ["validate", "info"])
+def test_cli_cache_dir(
+    cmd: str,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    data_path = tmp_path / "image.ome.zarr"
+    cache_path = tmp_path / "cache"
+    zarr_group = json_to_zarr_group(
+        version="0.5", json_fname="image_example.json", store=LocalStore(data_path)
+    )
+    populate_fake_data(zarr_group)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["ome-zarr-models", cmd, str(data_path), "--cache-dir", str(cache_path)],
+    )
+    main()
+    if cmd == "validate":
+        assert "Valid OME-Zarr" in capsys.readouterr().out
+    assert len(list(cache_path.glob("*/**/zarr.json"))) == 4
+
+
+def test_cli_cache_max_age(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    data_path = tmp_path / "image.ome.zarr"
+    cache_path = tmp_path / "cache"
+    zarr_group = json_to_zarr_group(
+        version="0.5", json_fname="image_example.json", store=LocalStore(data_path)
+    )
+    populate_fake_data(zarr_group)
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "ome-zarr-models",
+            "validate",
+            str(data_path),
+            "--cache-dir",
+            str(cache_path),
+            "--cache-max-age",
+            "3600",
+        ],
+    )
+    main()
+
+    # With a warm cache, nothing is read from the store, or checked for changes
+    requests: list[str] = []
+    local_get = LocalStore.get
+
+    async def get(self: LocalStore, key: str, *args: Any, **kwargs: Any) -> Any:
+        requests.append(key)
+        return await local_get(self, key, *args, **kwargs)
+
+    async def get_validators(self: DiskMetadataCacheStore, key: str) -> Any:
+        requests.append(key)
+
+    monkeypatch.setattr(LocalStore, "get", get)
+    monkeypatch.setattr(DiskMetadataCacheStore, "_get_validators", get_validators)
+    main()
+    assert "Valid OME-Zarr" in capsys.readouterr().out
+    assert requests == []
+
+
+def test_cli_validate_attrs_only(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # No arrays are created, so only the attributes are valid
+    json_to_zarr_group(
+        version="0.5", json_fname="image_example.json", store=LocalStore(tmp_path)
+    )
+    monkeypatch.setattr(
+        "sys.argv", ["ome-zarr-models", "validate", "--attrs-only", str(tmp_path)]
+    )
+    main()
+    out = capsys.readouterr().out
+    assert "Valid OME-Zarr attributes" in out
+    assert "- Image._check_arrays_compatible" in out
+
+
 @pytest.mark.parametrize("cmd", ["validate", "info"])
 def test_cli_invalid(
     tmp_path: Path,
@@ -108,3 +193,24 @@ def test_cli_invalid(
         main()
     assert excinfo.value.code == 1
     assert "Invalid OME-Zarr" in capsys.readouterr().out
+
+
+def test_cli_consolidate(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    zarr_group = json_to_zarr_group(
+        version="0.4",
+        json_fname="multiscales_example.json",
+        store=LocalStore(root=tmp_path),
+    )
+    populate_fake_data(zarr_group)
+    assert zarr.open_group(tmp_path).metadata.consolidated_metadata is None
+
+    monkeypatch.setattr("sys.argv", ["ome-zarr-models", "consolidate", str(tmp_path)])
+    main()
+    assert "Wrote consolidated metadata" in capsys.readouterr().out
+    consolidated = zarr.open_group(tmp_path).metadata.consolidated_metadata
+    assert consolidated is not None
+    assert set(consolidated.flattened_metadata) == {"0", "1"}
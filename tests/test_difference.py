@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import zarr
+from zarr.storage import LocalStore, MemoryStore
+
+import ome_zarr_models.difference
+from ome_zarr_models import diff, open_ome_zarr
+from ome_zarr_models._cli import main
+from ome_zarr_models.difference import Difference
+from tests.v05.test_hcs import make_plate_group
+from tests.v05.test_image import make_valid_image_with_labels_group
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from zarr.abc.store import Store
+
+
+def make_changed_plate_group(store: Store) -> zarr.Group:
+    """
+    Make a plate with one more well than `make_plate_group(store, 3)`, and a
+    different scale for one image.
+    """
+    group = make_plate_group(store, 4)
+    image_group = zarr.open_group(store, path="A/2/0", mode="r+")
+    ome = image_group.attrs["ome"]
+    ome["multiscales"][0]["datasets"][2]["coordinateTransformations"][0]["scale"][4] = 4  # type: ignore[call-overload, index]
+    image_group.attrs["ome"] = ome
+    return group
+
+
+def test_diff() -> None:
+    a = make_plate_group(MemoryStore(), 3)
+    b = make_changed_plate_group(MemoryStore())
+
+    assert diff(a, b) == [
+        Difference(
+            path="",
+            change="changed",
+            keys=("attributes.ome.plate.columns[3]", "attributes.ome.plate.wells[3]"),
+        ),
+        # The row only has a different member
+        Difference(path="A", change="changed"),
+        Difference(
+            path="A/2/0",
+            change="changed",
+            keys=(
+                "attributes.ome.multiscales[0].datasets[2]"
+                ".coordinateTransformations[0].scale[4]",
+            ),
+        ),
+        Difference(path="A/4", change="added"),
+    ]
+    assert diff(b, a)[-1] == Difference(path="A/4", change="removed")
+    assert diff(a, open_ome_zarr(a)) == []
+
+
+def test_diff_aliases() -> None:
+    a = make_valid_image_with_labels_group(MemoryStore())
+    b = make_valid_image_with_labels_group(MemoryStore())
+    label_group = b["labels/cell_space_segmentation"]
+    ome = label_group.attrs["ome"]
+    ome["image-label"]["colors"][1]["rgba"][3] = 255  # type: ignore[call-overload, index]
+    label_group.attrs["ome"] = ome
+
+    # Keys are the same as in the metadata, not the names of the model fields
+    assert diff(a, b) == [
+        Difference(
+            path="labels/cell_space_segmentation",
+            change="changed",
+            keys=("attributes.ome.image-label.colors[1].rgba[3]",),
+        )
+    ]
+
+
+def test_diff_only_compares_changed_nodes(monkeypatch: pytest.MonkeyPatch) -> None:
+    a = open_ome_zarr(make_plate_group(MemoryStore(), 3))
+    b = open_ome_zarr(make_changed_plate_group(MemoryStore()))
+    compared: list[Any] = []
+    node_document = ome_zarr_models.difference._node_document
+
+    def recording_node_document(node: Any) -> dict[str, Any]:
+        compared.append(node)
+        return node_document(node)
+
+    monkeypatch.setattr(
+        ome_zarr_models.difference, "_node_document", recording_node_document
+    )
+    diff(a, b)
+    # The plate, the row, and the changed well and image, in both plates
+    assert len(compared) == 8
+
+
+def test_cli_diff(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    make_plate_group(LocalStore(tmp_path / "a.zarr"), 3)
+    make_changed_plate_group(LocalStore(tmp_path / "b.zarr"))
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["ome-zarr-models", "diff", str(tmp_path / "a.zarr"), str(tmp_path / "a.zarr")],
+    )
+    main()
+    assert "No differences" in capsys.readouterr().out
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["ome-zarr-models", "diff", str(tmp_path / "a.zarr"), str(tmp_path / "b.zarr")],
+    )
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 1
+    out = capsys.readouterr().out
+    assert "~ /A/2/0\n    attributes.ome.multiscales[0]" in out
+    assert "+ /A/4\n" in out
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import zarr
+from pydantic_zarr.v3 import GroupSpec
+from zarr.storage import MemoryStore
+
+from ome_zarr_models._hash import TreeHasher
+from ome_zarr_models.v04.hcs import HCS
+from ome_zarr_models.v05.hcs import HCS as HCSv05
+from ome_zarr_models.v05.image import Image
+from ome_zarr_models.v05.well import Well
+from tests.test_selection import open_example_hcs
+from tests.v05.test_hcs import make_plate_group
+from tests.v05.test_image import (
+    make_valid_image_group,
+    make_valid_image_with_labels_group,
+)
+
+
+def test_content_hash_deterministic() -> None:
+    hcs = HCS.from_zarr(open_example_hcs())
+    content_hash = hcs.content_hash()
+    assert len(content_hash) == 64
+    assert HCS.from_zarr(open_example_hcs()).content_hash() == content_hash
+
+
+def test_content_hash_merkle() -> None:
+    group = make_plate_group(MemoryStore(), 3)
+    hcs = HCSv05.from_zarr(group)
+    # The hash of a well is the same when it is loaded on its own
+    well = Well.from_zarr(zarr.open_group(group.store, path="A/2", mode="r"))
+    assert hcs.get_well_group(1).content_hash() == well.content_hash()
+
+    # Changing one array changes the hash of the image, well and plate,
+    # but not of the other wells
+    zarr.create_array(
+        group.store,
+        name="A/2/0/2",
+        shape=(1, 1, 1, 1, 2),
+        dtype="uint8",
+        dimension_names=["t", "c", "z", "y", "x"],
+        overwrite=True,
+    )
+    changed = HCSv05.from_zarr(zarr.open_group(group.store, mode="r"))
+    assert changed.content_hash() != hcs.content_hash()
+    assert (
+        changed.get_well_group(1).content_hash() != hcs.get_well_group(1).content_hash()
+    )
+    for i in [0, 2]:
+        assert (
+            changed.get_well_group(i).content_hash()
+            == hcs.get_well_group(i).content_hash()
+        )
+
+
+def test_content_hash_key_order() -> None:
+    store_dict: dict[str, Any] = {}
+    group = make_valid_image_group(MemoryStore(store_dict=store_dict))
+    image = Image.from_zarr(group)
+
+    # Write the same metadata, with the keys in reverse order
+    for key in ["zarr.json", "0/zarr.json"]:
+        document = json.loads(store_dict[key].to_bytes())
+        store_dict[key] = type(store_dict[key]).from_bytes(
+            json.dumps(_reverse_keys(document)).encode()
+        )
+    reordered = Image.from_zarr(zarr.open_group(store_dict, mode="r"))
+    assert reordered.content_hash() == image.content_hash()
+
+
+def test_content_hash_model_and_raw_metadata() -> None:
+    # The labels have keys that are not valid field names (e.g., "image-label"),
+    # and optional keys that are missing
+    group = make_valid_image_with_labels_group(MemoryStore())
+    assert (
+        Image.from_zarr(group).content_hash()
+        == TreeHasher().hash(GroupSpec.from_zarr(group)).hex()
+    )
+
+
+def test_content_hash_lazy() -> None:
+    group = make_valid_image_group(MemoryStore())
+    assert (
+        Image.from_zarr(group, lazy=True).content_hash()
+        == Image.from_zarr(group).content_hash()
+    )
+
+
+def _reverse_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _reverse_keys(value[key]) for key in reversed(value)}
+    if isinstance(value, list):
+        return [_reverse_keys(item) for item in value]
+    return value
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import zarr
+from pydantic_zarr.v3 import GroupSpec
+from zarr.storage import LocalStore
+
+from ome_zarr_models import _io, open_ome_zarr
+from ome_zarr_models._cli import main
+from ome_zarr_models.incremental import IncrementalValidator
+from ome_zarr_models.v05.hcs import HCS
+from ome_zarr_models.v05.image import Image
+from ome_zarr_models.v05.well import Well
+from tests.v05.test_hcs import make_plate_group
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def count_validations(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    n_validated = {"Well": 0, "Image": 0}
+    for cls in [Well, Image]:
+
+        def counting_init(
+            self: Any, _cls: type[Any] = cls, _init: Any = cls.__init__, **data: Any
+        ) -> None:
+            n_validated[_cls.__name__] += 1
+            _init(self, **data)
+
+        monkeypatch.setattr(cls, "__init__", counting_init)
+    return n_validated
+
+
+def update_ome_attributes(path: Path, group_path: str, **ome: Any) -> None:
+    group = zarr.open_group(LocalStore(path), path=group_path, mode="r+")
+    group.attrs["ome"] = {**group.attrs["ome"], **ome}  # type: ignore[dict-item]
+
+
+def test_incremental_validate(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "plate.zarr"
+    make_plate_group(LocalStore(path), 3)
+    validator = IncrementalValidator(path)
+    hcs = validator.validate()
+    assert isinstance(hcs, HCS)
+    assert validator.changed_paths == ()
+    assert not validator.has_changed()
+    assert validator.validate() is hcs
+
+    n_validated = count_validations(monkeypatch)
+    update_ome_attributes(path, "A/2", well={"images": [{"path": "0"}]})
+    assert validator.has_changed()
+    changed = validator.validate()
+    assert validator.changed_paths == ("A/2",)
+    # Only the changed well is validated again, and its image is re-used
+    assert n_validated == {"Well": 1, "Image": 0}
+    assert isinstance(changed, HCS)
+    assert changed.get_well_group(0) is hcs.get_well_group(0)
+    assert changed == open_ome_zarr(LocalStore(path))
+
+
+def test_incremental_validate_new_well(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "plate.zarr"
+    make_plate_group(LocalStore(path), 3)
+    validator = IncrementalValidator(path)
+    validator.validate()
+
+    n_validated = count_validations(monkeypatch)
+    # Add a well, as an acquisition rig would
+    new_plate = make_plate_group(LocalStore(tmp_path / "new_plate.zarr"), 4)
+    new_well = new_plate["A/4"]
+    zarr.create_group(
+        LocalStore(path), path="A/4", attributes=new_well.attrs.asdict()
+    ).create_group("0", attributes=new_well["0"].attrs.asdict())
+    for array_path in ["0", "1", "2"]:
+        zarr.create_array(
+            LocalStore(path),
+            name=f"A/4/0/{array_path}",
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+    update_ome_attributes(path, "", plate=new_plate.attrs["ome"]["plate"])  # type: ignore[index, call-overload]
+
+    hcs = validator.validate()
+    assert isinstance(hcs, HCS)
+    assert len(list(hcs.well_groups)) == 4
+    assert n_validated == {"Well": 1, "Image": 1}
+
+
+def test_incremental_validate_cross_node_checks(tmp_path: Path) -> None:
+    path = tmp_path / "plate.zarr"
+    make_plate_group(LocalStore(path), 3)
+    plate = zarr.open_group(LocalStore(path), mode="r").attrs["ome"]["plate"]  # type: ignore[index, call-overload]
+    update_ome_attributes(path, "", plate={**plate, "acquisitions": [{"id": 0}]})
+    validator = IncrementalValidator(path)
+    hcs = validator.validate()
+
+    # The plate metadata has not changed, but the acquisitions of its wells
+    # are still checked against it
+    update_ome_attributes(
+        path, "A/2", well={"images": [{"path": "0", "acquisition": 1}]}
+    )
+    with pytest.raises(RuntimeError):
+        validator.validate()
+    assert validator.group is hcs
+    assert not validator.has_changed()
+
+    update_ome_attributes(
+        path, "A/2", well={"images": [{"path": "0", "acquisition": 0}]}
+    )
+    assert validator.has_changed()
+    assert validator.validate() == open_ome_zarr(LocalStore(path))
+    assert validator.changed_paths == ("A/2",)
+
+
+def test_group_spec_of_copied_model(tmp_path: Path) -> None:
+    path = tmp_path / "plate.zarr"
+    make_plate_group(LocalStore(path), 1)
+    well = Well.from_zarr(zarr.open_group(LocalStore(path), path="A/1", mode="r"))
+    spec = _io.as_group_spec(well, GroupSpec)
+    assert _io.as_group_spec(well, GroupSpec) is spec
+
+    attributes = type(well.attributes).model_validate(
+        {
+            "ome": {
+                "version": "0.5",
+                "well": {"images": [{"path": "0", "acquisition": 0}]},
+            }
+        }
+    )
+    edited = well.model_copy(update={"attributes": attributes})
+    edited_spec = _io.as_group_spec(edited, GroupSpec)
+    assert edited_spec is not spec
+    assert edited_spec.attributes["ome"]["well"]["images"] == [
+        {"path": "0", "acquisition": 0}
+    ]
+    assert _io.as_group_spec(well, GroupSpec) is spec
+
+
+def test_incremental_validator_not_directory(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="is not a local directory"):
+        IncrementalValidator(tmp_path / "missing.zarr")
+
+
+def test_cli_validate_watch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    path = tmp_path / "plate.zarr"
+    make_plate_group(LocalStore(path), 3)
+    changes = [
+        # Make a well invalid, by listing the same image twice
+        lambda: update_ome_attributes(
+            path, "A/2", well={"images": [{"path": "0"}, {"path": "0"}]}
+        ),
+        # Fix it
+        lambda: update_ome_attributes(path, "A/2", well={"images": [{"path": "0"}]}),
+    ]
+
+    def sleep(seconds: float) -> None:
+        if not changes:
+            raise KeyboardInterrupt
+        changes.pop(0)()
+
+    monkeypatch.setattr("ome_zarr_models._cli.time.sleep", sleep)
+    monkeypatch.setattr(
+        "sys.argv", ["ome-zarr-models", "validate", "--watch", str(path)]
+    )
+    main()
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == f"Watching {path} for changes (press Ctrl+C to stop)"
+    assert out[1] == "✅ Valid OME-Zarr"
+    assert out[-2] == f"❌ Invalid OME-Zarr: {path}"
+    assert out[-1] == "✅ Valid OME-Zarr (1 changed groups or arrays)"
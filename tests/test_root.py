@@ -1,16 +1,42 @@
+import asyncio
 import re
+from collections import Counter
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
 import pytest
 import zarr
+from pydantic_zarr.v2 import ArraySpec as ArraySpecv2
+from pydantic_zarr.v3 import ArraySpec as ArraySpecv3
+from pydantic_zarr.v3 import GroupSpec as GroupSpecv3
 from zarr.abc.store import Store
+from zarr.storage import MemoryStore
 
 import ome_zarr_models.v04
 import ome_zarr_models.v05
-from ome_zarr_models import open_ome_zarr
-from tests.conftest import get_examples_path
+from ome_zarr_models import (
+    _V05_groups,
+    _V06_groups,
+    open_ome_zarr,
+    open_ome_zarr_async,
+)
+from ome_zarr_models._io import MetadataInterner, build_members
+from ome_zarr_models.common.coordinate_transformations import VectorScale
+from ome_zarr_models.common.plate import Column
+from ome_zarr_models.common.validation import (
+    _array_spec_from_metadata,
+    duplicate_items,
+)
+from tests.conftest import get_examples_path, json_to_zarr_group
+from tests.test_cache import RecordingMemoryStore
+from tests.test_cli import populate_fake_data
+from tests.test_selection import open_example_hcs
 from tests.v05.test_image import make_valid_image_group
 
+if TYPE_CHECKING:
+    from zarr.core.buffer import Buffer
+
 
 def test_load_ome_zarr_group() -> None:
     hcs_group = zarr.open_group(
@@ -24,6 +50,31 @@ def test_load_ome_zarr_group() -> None:
     assert ome_zarr_group.ome_zarr_version == "0.4"
 
 
+def test_load_ome_zarr_group_only_tries_matching_class(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Loading a HCS group should never try to load it as any other group type
+    def fail(cls: type, group: zarr.Group) -> None:
+        raise AssertionError(f"Tried to load as {cls}")
+
+    # Image and Well are excluded, because they are used to load the HCS members
+    for group_cls in [
+        *_V06_groups,
+        *_V05_groups,
+        ome_zarr_models.v04.ImageLabel,
+        ome_zarr_models.v04.Labels,
+        ome_zarr_models.v04.BioFormats2Raw,
+    ]:
+        monkeypatch.setattr(group_cls, "from_zarr", classmethod(fail))
+
+    hcs_group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr",
+        mode="r",
+        zarr_format=2,
+    )
+    assert isinstance(open_ome_zarr(hcs_group), ome_zarr_models.v04.HCS)
+
+
 def test_load_ome_zarr_group_v05_image_label(store: Store) -> None:
     # Check that images and image-labels are distinguished correctly
     image_group = make_valid_image_group(store)
@@ -39,6 +90,112 @@ def test_load_ome_zarr_group_v05_image_label(store: Store) -> None:
     assert isinstance(ome_zarr_group, ome_zarr_models.v05.ImageLabel)
 
 
+def test_load_ome_zarr_group_reads_nodes_once() -> None:
+    # Loading as an ImageLabel fails after reading the arrays, because the
+    # image-label metadata is inconsistent. The arrays are then re-used when
+    # loading as an Image.
+    store_dict: dict[str, Buffer] = {}
+    group = json_to_zarr_group(
+        version="0.4",
+        json_fname="image_label_example.json",
+        store=MemoryStore(store_dict=store_dict),
+    )
+    populate_fake_data(group)
+    attrs = group.attrs.asdict()
+    attrs["image-label"]["properties"][1]["label-value"] = 5  # type: ignore[call-overload,index]
+    group.attrs.put(attrs)
+
+    store = RecordingMemoryStore(store_dict)
+    ome_zarr_group = open_ome_zarr(zarr.open_group(store, mode="r"))
+    assert type(ome_zarr_group) is ome_zarr_models.v04.Image
+    reads = Counter(store.keys)
+    assert reads["0/.zarray"] == 1
+    assert set(reads.values()) == {1}
+
+    store.keys.clear()
+    asyncio.run(open_ome_zarr_async(zarr.open_group(store, mode="r")))
+    assert set(Counter(store.keys).values()) == {1}
+
+
+def test_sub_group_consolidated_metadata_not_read() -> None:
+    group = open_example_hcs()
+    ome_zarr_models.v04.HCS.from_zarr(group)
+    keys = group.store.keys  # type: ignore[attr-defined]
+    # Only the group that is opened by the user is checked for consolidated
+    # metadata
+    assert ".zmetadata" in keys
+    assert not any(key.endswith("/.zmetadata") for key in keys)
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3])
+def test_array_spec_from_metadata(zarr_format: Literal[2, 3]) -> None:
+    array = zarr.create_array(
+        MemoryStore(),
+        shape=(3, 4),
+        chunks=(2, 2),
+        dtype="uint16",
+        attributes={"key": [1, 2]},
+        zarr_format=zarr_format,
+    )
+    array_spec_cls = ArraySpecv2 if zarr_format == 2 else ArraySpecv3
+    assert _array_spec_from_metadata(array.metadata) == array_spec_cls.from_zarr(array)
+
+
+@pytest.mark.parametrize(
+    ("values", "dupes"),
+    [
+        (["a", "b", "a", "a"], ["a", "a"]),
+        ([1, 1.0, True], [1.0, True]),
+        ([[1], [2], [1]], [[1]]),
+        ([Column(name="a"), Column(name="b"), Column(name="a")], [Column(name="a")]),
+        # Models with unhashable fields
+        ([VectorScale.build([1]), VectorScale.build([2])], []),
+        ([VectorScale.build([1]), VectorScale.build([1])], [VectorScale.build([1])]),
+    ],
+)
+def test_duplicate_items(values: list[Any], dupes: list[Any]) -> None:
+    assert duplicate_items(values) == dupes
+
+
+def test_interner_only_shares_equal_models() -> None:
+    interner = MetadataInterner()
+    column = interner.share(Column(name="a"))
+    assert interner.share(Column(name="a")) is column
+    assert interner.share(Column(name="b")) is not column
+    # Values that compare equal, but have different types, are not shared
+    one = interner.share(Column(name="a", value=1))  # type: ignore[call-arg]
+    assert interner.share(Column(name="a", value=True)) is not one  # type: ignore[call-arg]
+    # Models in lists are replaced in place
+    columns = [Column(name="a"), Column(name="b")]
+    assert interner.share(columns) is columns
+    assert columns[0] is column
+
+
+def test_build_members() -> None:
+    array = ArraySpecv3.from_array(np.zeros((2, 2)))
+    well = GroupSpecv3(attributes={"well": 1}, members={"0": array})
+    members = {
+        "0": array,
+        # Members of a group that are read before the group itself
+        "A/1": well,
+        "A": GroupSpecv3(attributes={"row": "A"}, members={"2": well}),
+        "B/1/0": array,
+    }
+    flat: dict[str, Any] = {}
+    for path, member in members.items():
+        if isinstance(member, GroupSpecv3):
+            flat.update(member.to_flat(root_path=f"/{path}"))
+        else:
+            flat[f"/{path}"] = member
+    expected = GroupSpecv3.from_flat(flat).members
+    built = build_members(members, GroupSpecv3)
+    assert built == expected
+    # Groups come before arrays, as in GroupSpec.from_flat()
+    assert list(built) == list(expected) == ["A", "B", "0"]
+    # Specifications that have already been built are not copied
+    assert built["A"].members["1"] is well
+
+
 def test_load_ome_zarr_group_bad(tmp_path: Path) -> None:
     hcs_group = zarr.create_group(tmp_path / "test")
     with pytest.raises(
@@ -50,6 +207,31 @@ def test_load_ome_zarr_group_bad(tmp_path: Path) -> None:
         open_ome_zarr(hcs_group)
 
 
+def test_load_ome_zarr_group_async(store: Store) -> None:
+    hcs_path = get_examples_path(version="0.4") / "hcs_example.ome.zarr"
+    hcs = asyncio.run(open_ome_zarr_async(hcs_path, version="0.4"))
+    assert isinstance(hcs, ome_zarr_models.v04.HCS)
+    assert hcs == open_ome_zarr(zarr.open_group(hcs_path, mode="r"))
+
+    image_group = make_valid_image_group(store)
+    attrs = image_group.attrs.asdict()
+    attrs["ome"]["image-label"] = {}  # type: ignore[index]
+    image_group.update_attributes(attrs)
+    ome_zarr_group = asyncio.run(open_ome_zarr_async(image_group))
+    assert isinstance(ome_zarr_group, ome_zarr_models.v05.ImageLabel)
+
+
+def test_load_ome_zarr_group_async_bad(tmp_path: Path) -> None:
+    group = zarr.create_group(tmp_path / "test")
+    with pytest.raises(
+        RuntimeError,
+        match=re.escape(
+            f"Could not successfully validate <Group file://{tmp_path / 'test'}> "
+        ),
+    ):
+        asyncio.run(open_ome_zarr_async(group))
+
+
 @pytest.mark.vcr
 def test_load_remote_data() -> None:
     grp = open_ome_zarr(
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+import zarr
+from zarr.storage import LocalStore, MemoryStore
+
+from ome_zarr_models import open_ome_zarr, open_ome_zarr_async
+from ome_zarr_models.common.well import WellGroupNotFoundError
+from ome_zarr_models.selection import Selection
+from ome_zarr_models.v04.hcs import HCS
+from ome_zarr_models.v05.hcs import HCS as HCSv05
+from ome_zarr_models.v05.image import Image
+from ome_zarr_models.v05.labels import Labels
+from tests.conftest import get_examples_path
+from tests.v05.test_hcs import make_plate_group
+from tests.v05.test_image import make_valid_image_with_labels_group
+
+if TYPE_CHECKING:
+    from zarr.abc.store import ByteRequest
+    from zarr.core.buffer import Buffer, BufferPrototype
+
+
+class RecordingStore(LocalStore):
+    """
+    A local store that records the keys that are read.
+    """
+
+    keys: list[str]
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        self.keys.append(key)
+        return await super().get(key, prototype, byte_range)
+
+
+def open_example_hcs() -> zarr.Group:
+    store = RecordingStore(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr", read_only=True
+    )
+    store.keys = []
+    return zarr.open_group(store, mode="r", zarr_format=2)
+
+
+def test_no_wells() -> None:
+    group = open_example_hcs()
+    hcs = HCS.from_zarr(group, selection=Selection(wells=[]))
+    assert hcs.attributes == HCS.from_zarr(group).attributes
+    assert list(hcs.well_groups) == []
+    with pytest.raises(WellGroupNotFoundError):
+        hcs.get_well_group(0)
+
+
+def test_wells_not_read() -> None:
+    group = open_example_hcs()
+    HCS.from_zarr(group, selection=Selection(wells=["A/01"]))
+    keys = group.store.keys  # type: ignore[attr-defined]
+    assert keys
+    assert not any(key.startswith("B/03") for key in keys)
+
+
+def test_select_wells() -> None:
+    group = open_example_hcs()
+    hcs = HCS.from_zarr(group, selection=Selection(wells=["/B/03/"]))
+    assert hcs == HCS.from_zarr(group)
+
+
+@pytest.mark.parametrize(
+    ("max_depth", "n_wells", "n_images"), [(0, 0, 0), (2, 1, 0), (3, 1, 1)]
+)
+def test_max_depth(max_depth: int, n_wells: int, n_images: int) -> None:
+    group = open_example_hcs()
+    hcs = HCS.from_zarr(group, selection=Selection(max_depth=max_depth))
+    wells = list(hcs.well_groups)
+    assert len(wells) == n_wells
+    if wells:
+        assert wells[0].members is not None
+        assert len(wells[0].members) == n_images
+
+
+def test_iter_images() -> None:
+    group = open_example_hcs()
+    assert list(HCS.iter_images(group, selection=Selection(images=["1"]))) == []
+    assert not any(
+        key.startswith("B/03/0")
+        for key in group.store.keys  # type: ignore[attr-defined]
+    )
+    images = list(HCS.iter_images(group, selection=Selection(images=["0"])))
+    assert [path for path, _ in images] == ["B/03/0"]
+
+
+def test_exclude_labels() -> None:
+    store_dict: dict[str, Buffer] = {}
+    group = make_valid_image_with_labels_group(MemoryStore(store_dict=store_dict))
+    # Labels are not read, so an invalid labels group does not cause an error
+    del store_dict["labels/cell_space_segmentation/zarr.json"]
+
+    selection = Selection(include_labels=False)
+    image = Image.from_zarr(group, selection=selection)
+    assert image.labels is None
+    assert Image.from_zarr(group, lazy=True, selection=selection).labels is None
+    assert asyncio.run(Image.from_zarr_async(group, selection=selection)) == image
+    assert open_ome_zarr(group, selection=selection) == image
+    assert asyncio.run(open_ome_zarr_async(group, selection=selection)) == image
+
+
+def test_partial_selection_skipped_checks() -> None:
+    group = make_plate_group(MemoryStore(), 3)
+    assert HCSv05.from_zarr(group).skipped_checks == ()
+    # Well acquisitions are only checked for the wells that are read
+    hcs = HCSv05.from_zarr(group, selection=Selection(wells=["A/1"]))
+    assert hcs.skipped_checks == ("HCS._check_valid_acquisitions",)
+    hcs = HCSv05.from_zarr(group, selection=Selection(wells=["A/1"]), lazy=True)
+    assert len(hcs.members) == 1
+    assert hcs.skipped_checks == ("HCS._check_valid_acquisitions",)
+    hcs = HCSv05.from_zarr(group, lazy=True)
+    assert len(hcs.members) == 1
+    assert hcs.skipped_checks == ()
+
+    group = make_valid_image_with_labels_group(MemoryStore())
+    image = Image.from_zarr(group, selection=Selection(include_labels=False))
+    assert image.skipped_checks == ("Image._check_label_multiscales",)
+    image = Image.from_zarr(group, selection=Selection(max_depth=0))
+    assert image.skipped_checks == ("Image._check_label_multiscales",)
+
+
+def test_labels_selection() -> None:
+    group = make_valid_image_with_labels_group(MemoryStore())
+    labels = Labels.from_zarr(
+        group["labels"],  # type: ignore[arg-type]
+        selection=Selection(include_arrays=False),
+    )
+    assert labels.skipped_checks == (
+        "Image._check_arrays_compatible",
+        "Labels._check_valid_dtypes",
+    )
+    assert labels.attributes == Labels.from_zarr(group["labels"]).attributes  # type: ignore[arg-type]
+
+
+def test_invalid_max_depth() -> None:
+    with pytest.raises(ValueError, match="max_depth must be at least 0"):
+        Selection(max_depth=-1)
+
+
+def test_attrs_only() -> None:
+    group = open_example_hcs()
+    hcs = HCS.from_zarr(group, selection=Selection(include_arrays=False))
+    assert not any(
+        key.endswith(".zarray")
+        for key in group.store.keys  # type: ignore[attr-defined]
+    )
+    assert hcs.skipped_checks == ("Image._check_arrays_compatible",)
+    # Models of members can be created without arrays
+    image = next(hcs.get_well_group(0).images)
+    assert image.skipped_checks == ("Image._check_arrays_compatible",)
+    assert (
+        image.attributes
+        == HCS.from_zarr(group).get_well_group(0).get_image(0).attributes
+    )
+    assert HCS.from_zarr(group).skipped_checks == ()
+
+
+def test_attrs_only_missing_arrays() -> None:
+    store_dict: dict[str, Buffer] = {}
+    group = make_valid_image_with_labels_group(MemoryStore(store_dict=store_dict))
+    for key in list(store_dict):
+        if key.endswith("0/zarr.json"):
+            del store_dict[key]
+
+    image = Image.from_zarr(group, selection=Selection(include_arrays=False))
+    assert image.skipped_checks == (
+        "Image._check_arrays_compatible",
+        "Labels._check_valid_dtypes",
+    )
+    assert image.labels is not None
+    assert image.labels.get_image_labels_group("cell_space_segmentation")
+    with pytest.raises(ValueError, match="Expected to find an array at 0"):
+        Image.from_zarr(group)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from zarr.storage import MemoryStore
+
+from ome_zarr_models.selection import Selection
+from ome_zarr_models.snapshot import from_snapshot, to_snapshot
+from ome_zarr_models.v04.hcs import HCS
+from ome_zarr_models.v05.image import Image
+from tests.test_selection import open_example_hcs
+from tests.v05.test_image import make_valid_image_with_labels_group
+
+
+def test_snapshot_hcs() -> None:
+    group = open_example_hcs()
+    hcs = HCS.from_zarr(group)
+    data = to_snapshot(hcs)
+
+    group.store.keys.clear()  # type: ignore[attr-defined]
+    loaded = from_snapshot(data)
+    assert isinstance(loaded, HCS)
+    assert loaded == hcs
+    # Member models are stored, so are not validated or read again
+    well = loaded.get_well_group(0)
+    assert loaded.get_well_group(0) is well
+    assert well.get_image(0) == hcs.get_well_group(0).get_image(0)
+    assert group.store.keys == []  # type: ignore[attr-defined]
+
+
+def test_snapshot_image() -> None:
+    group = make_valid_image_with_labels_group(MemoryStore())
+    image = Image.from_zarr(group)
+    # Generic attribute models (e.g., BaseZarrAttrs[ImageAttrs]) can't be pickled
+    # on their own
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(image)
+    loaded = from_snapshot(to_snapshot(image))
+    assert loaded == image
+    assert loaded.labels == image.labels  # type: ignore[attr-defined]
+
+
+def test_snapshot_lazy() -> None:
+    group = make_valid_image_with_labels_group(MemoryStore())
+    image = Image.from_zarr(group, lazy=True)
+    loaded = from_snapshot(to_snapshot(image))
+    assert loaded == Image.from_zarr(group)
+    assert isinstance(loaded.members, dict)  # type: ignore[attr-defined]
+
+
+def test_snapshot_skipped_checks() -> None:
+    group = open_example_hcs()
+    hcs = HCS.from_zarr(group, selection=Selection(include_arrays=False))
+    loaded = from_snapshot(to_snapshot(hcs))
+    assert loaded.skipped_checks == ("Image._check_arrays_compatible",)
+
+
+def test_snapshot_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    image = Image.from_zarr(make_valid_image_with_labels_group(MemoryStore()))
+    data = to_snapshot(image)
+
+    with pytest.raises(ValueError, match="not an ome-zarr-models snapshot"):
+        from_snapshot(b"OME")
+    with pytest.raises(ValueError, match="not an ome-zarr-models snapshot"):
+        from_snapshot(b"X" + data[1:])
+    with pytest.raises(ValueError, match="Snapshot is corrupted"):
+        from_snapshot(data[:-10])
+    with pytest.raises(TypeError, match="Expected an OME-Zarr group"):
+        to_snapshot(image.attributes)  # type: ignore[arg-type]
+
+    monkeypatch.setattr("ome_zarr_models.__version__", "0.0.1")
+    with pytest.raises(ValueError, match=r"written by ome-zarr-models .* can't be"):
+        from_snapshot(data)
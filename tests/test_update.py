@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pydantic
+import pytest
+import zarr
+from zarr.storage import MemoryStore
+
+from ome_zarr_models.exceptions import MetadataConflictError, ValidationWarning
+from ome_zarr_models.v05.bioformats2raw import BioFormats2Raw
+from ome_zarr_models.v05.hcs import HCS
+from ome_zarr_models.v05.image import Image
+from ome_zarr_models.v05.well import Well
+from tests.v05.test_bioformats2raw import make_bioformats2raw_store
+from tests.v05.test_hcs import make_plate_group
+
+if TYPE_CHECKING:
+    from zarr.core.buffer import Buffer
+
+
+def changed_keys(store_dict: dict[str, Buffer], before: dict[str, bytes]) -> set[str]:
+    return {
+        key for key, value in store_dict.items() if before.get(key) != value.to_bytes()
+    }
+
+
+def snapshot(store_dict: dict[str, Buffer]) -> dict[str, bytes]:
+    return {key: value.to_bytes() for key, value in store_dict.items()}
+
+
+def rename_patch(image: Image, name: str) -> dict[str, Any]:
+    multiscale = image.ome_attributes.multiscales[0].model_dump(mode="json")
+    return {"ome": {"multiscales": [{**multiscale, "name": name}]}}
+
+
+def test_update_attributes() -> None:
+    store_dict: dict[str, Buffer] = {}
+    store = MemoryStore(store_dict=store_dict)
+    make_plate_group(store, 3)
+    image = Image.from_zarr(zarr.open_group(store, path="A/2/0", mode="r"))
+    before = snapshot(store_dict)
+
+    updated = image.update_attributes(
+        store, rename_patch(image, "renamed"), path="A/2/0"
+    )
+    assert updated.ome_attributes.multiscales[0].name == "renamed"
+    assert updated.members == image.members
+    # Only the attributes of the image are written
+    assert changed_keys(store_dict, before) == {"A/2/0/zarr.json"}
+    assert Image.from_zarr(zarr.open_group(store, path="A/2/0", mode="r")) == updated
+
+    # Updating again without changes writes nothing
+    before = snapshot(store_dict)
+    updated.update_attributes(store, {}, path="A/2/0")
+    assert changed_keys(store_dict, before) == set()
+
+
+def test_update_attributes_alias() -> None:
+    store = make_bioformats2raw_store(1)
+    model = BioFormats2Raw.from_zarr(zarr.open_group(store, mode="r"))
+    model.update_attributes(store, {"ome": {"series": ["0"]}})
+    attributes = zarr.open_group(store, mode="r").attrs["ome"]
+    assert attributes["bioformats2raw.layout"] == 3  # type: ignore[index, call-overload]
+    assert attributes["series"] == ["0"]  # type: ignore[index, call-overload]
+
+
+def test_update_attributes_invalid() -> None:
+    store_dict: dict[str, Buffer] = {}
+    store = MemoryStore(store_dict=store_dict)
+    make_plate_group(store, 1)
+    image = Image.from_zarr(zarr.open_group(store, path="A/1/0", mode="r"))
+    before = snapshot(store_dict)
+
+    with pytest.raises(pydantic.ValidationError):
+        image.update_attributes(store, {"ome": {"multiscales": None}}, path="A/1/0")
+    assert changed_keys(store_dict, before) == set()
+
+
+def test_update_attributes_conflict() -> None:
+    store = MemoryStore()
+    make_plate_group(store, 1)
+    image = Image.from_zarr(zarr.open_group(store, path="A/1/0", mode="r"))
+    # Someone else changes the image after it was read
+    image.update_attributes(store, rename_patch(image, "theirs"), path="A/1/0")
+
+    with pytest.raises(MetadataConflictError, match="'A/1/0' have changed"):
+        image.update_attributes(store, rename_patch(image, "ours"), path="A/1/0")
+    group = zarr.open_group(store, path="A/1/0", mode="r")
+    assert group.attrs["ome"]["multiscales"][0]["name"] == "theirs"  # type: ignore[index, call-overload]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_update_normalized_attributes(lazy: bool) -> None:
+    store = MemoryStore()
+    group = make_plate_group(store, 2)
+    plate = dict(group.attrs["ome"]["plate"])  # type: ignore[index, call-overload]
+    del plate["version"]
+    group.attrs["ome"] = {"plate": plate, "version": "0.5"}
+    with pytest.warns(ValidationWarning, match="'version' field not specified"):
+        hcs = HCS.from_zarr(zarr.open_group(store, mode="r"), lazy=lazy)
+
+    # The attributes in the store are compared with the attributes that were
+    # read, not with the attributes of the model
+    updated = hcs.update_attributes(store, {"ome": {"plate": {"name": "renamed"}}})
+    assert updated.ome_attributes.plate.name == "renamed"
+
+    # The plate has changed since hcs was read
+    with pytest.raises(MetadataConflictError, match="group at '' have changed"):
+        hcs.update_attributes(store, {"ome": {"plate": {"name": "ours"}}})
+
+
+def test_replace_well() -> None:
+    store_dict: dict[str, Buffer] = {}
+    store = MemoryStore(store_dict=store_dict)
+    make_plate_group(store, 3)
+    hcs = HCS.from_zarr(zarr.open_group(store, mode="r"))
+    well = hcs.get_well_group(1)
+    new_well = Well.model_validate(
+        {
+            **well.model_dump(),
+            "attributes": {
+                "ome": {
+                    "version": "0.5",
+                    "well": {"images": [{"path": "0", "acquisition": 1}]},
+                }
+            },
+        }
+    )
+    before = snapshot(store_dict)
+
+    updated = hcs.replace_well(store, "A/2", new_well)
+    assert changed_keys(store_dict, before) == {"A/2/zarr.json"}
+    assert updated.get_well_group(1) is new_well
+    assert updated.get_well_group(0) is hcs.get_well_group(0)
+    assert HCS.from_zarr(zarr.open_group(store, mode="r")) == updated
+
+    with pytest.raises(ValueError, match="Well 'B/1' is not in the plate metadata"):
+        hcs.replace_well(store, "B/1", new_well)
+
+
+def test_replace_well_dropped_image() -> None:
+    store_dict: dict[str, Buffer] = {}
+    store = MemoryStore(store_dict=store_dict)
+    make_plate_group(store, 2)
+    hcs = HCS.from_zarr(zarr.open_group(store, mode="r"))
+    well = hcs.get_well_group(1)
+    new_well = Well.model_validate(
+        {
+            "attributes": {
+                "ome": {"version": "0.5", "well": {"images": [{"path": "1"}]}}
+            },
+            "members": {"1": well.members["0"]},  # type: ignore[index]
+        }
+    )
+
+    updated = hcs.replace_well(store, "A/2", new_well)
+    # Keys that are null in the model are not written
+    group = zarr.open_group(store, mode="r")
+    assert group["A/2"].attrs.asdict() == {
+        "ome": {"version": "0.5", "well": {"images": [{"path": "1"}]}}
+    }
+    assert b"null" not in store_dict["A/2/1/zarr.json"].to_bytes()
+    # The image that is no longer in the well is left in the store
+    assert isinstance(group["A/2/0"], zarr.Group)
+    assert HCS.from_zarr(group) == updated
+
+
+def test_replace_well_copy() -> None:
+    store = MemoryStore()
+    make_plate_group(store, 3)
+    hcs = HCS.from_zarr(zarr.open_group(store, mode="r"))
+    well = hcs.get_well_group(1)
+    # Make the specification of the well before copying it
+    hcs.replace_well(store, "A/2", well)
+    attributes = type(well.attributes).model_validate(
+        {
+            "ome": {
+                "version": "0.5",
+                "well": {"images": [{"path": "0", "acquisition": 0}]},
+            }
+        }
+    )
+    new_well = well.model_copy(update={"attributes": attributes})
+
+    updated = hcs.replace_well(store, "A/2", new_well)
+    assert updated.get_well_group(1).ome_attributes.well.images[0].acquisition == 0
+    reread = HCS.from_zarr(zarr.open_group(store, mode="r"))
+    assert reread.get_well_group(1).ome_attributes.well.images[0].acquisition == 0
+    assert reread == updated
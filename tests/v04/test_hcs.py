@@ -1,6 +1,13 @@
+import asyncio
+import shutil
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pytest
 import zarr
+from zarr.abc.store import ByteRequest
+from zarr.core.buffer import Buffer, BufferPrototype
+from zarr.storage import LocalStore, MemoryStore
 
 from ome_zarr_models.common.omero import Channel, Omero, Window
 from ome_zarr_models.v04.axes import Axis
@@ -158,3 +165,118 @@ def test_non_existent_wells_from_zarr() -> None:
         attributes={"plate": plate, "version": "0.4"},
     )
     HCS.from_zarr(group)
+
+
+def test_example_hcs_consolidated_metadata(tmp_path: Path) -> None:
+    path = tmp_path / "hcs_example.ome.zarr"
+    shutil.copytree(get_examples_path(version="0.4") / "hcs_example.ome.zarr", path)
+    expected = HCS.from_zarr(zarr.open_group(path, mode="r"))
+    zarr.consolidate_metadata(path)
+
+    # Remove all metadata apart from the root group metadata, to check that only
+    # the consolidated metadata is used to load the plate
+    for metadata_path in path.glob("*/**/.z*"):
+        metadata_path.unlink()
+
+    group = zarr.open_group(path, mode="r")
+    assert group.metadata.consolidated_metadata is not None
+    assert HCS.from_zarr(group) == expected
+
+
+def test_example_hcs_to_zarr_consolidate() -> None:
+    hcs = HCS.from_zarr(
+        zarr.open_group(
+            get_examples_path(version="0.4") / "hcs_example.ome.zarr", mode="r"
+        )
+    )
+    store = MemoryStore()
+    group = hcs.to_zarr(store, path="", consolidate=True)
+    consolidated = group.metadata.consolidated_metadata
+    assert consolidated is not None
+    assert "B/03/0/4" in consolidated.flattened_metadata
+
+    group = zarr.open_group(store, mode="r")
+    assert group.metadata.consolidated_metadata == consolidated
+    assert HCS.from_zarr(group) == hcs
+
+
+def test_example_hcs_async() -> None:
+    group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr",
+        mode="r",
+        zarr_format=2,
+    )
+    assert asyncio.run(HCS.from_zarr_async(group)) == HCS.from_zarr(group)
+
+
+def test_example_hcs_reads_metadata_once() -> None:
+    # Each metadata document should only be read once, even though the
+    # plate members are read concurrently
+    class RecordingStore(LocalStore):
+        async def get(
+            self,
+            key: str,
+            prototype: BufferPrototype,
+            byte_range: ByteRequest | None = None,
+        ) -> Buffer | None:
+            keys.append(key)
+            return await super().get(key, prototype, byte_range)
+
+    keys: list[str] = []
+    store = RecordingStore(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr", read_only=True
+    )
+    HCS.from_zarr(zarr.open_group(store, mode="r", zarr_format=2))
+    assert "B/03/.zattrs" in keys
+    assert len(keys) == len(set(keys))
+
+
+def test_example_hcs_lazy() -> None:
+    group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr",
+        mode="r",
+        zarr_format=2,
+    )
+    hcs = HCS.from_zarr(group, lazy=True)
+    expected = HCS.from_zarr(group)
+    assert hcs.skipped_checks == ("HCS._check_valid_acquisitions",)
+    assert hcs.attributes == expected.attributes
+    assert hcs.get_well_group(0) == expected.get_well_group(0)
+    assert hcs == expected
+    # Comparing the members reads them all, so the checks have been run
+    assert hcs.skipped_checks == ()
+
+
+@pytest.mark.parametrize("read_ahead", [1, 2, 100])
+def test_example_hcs_iter_wells(read_ahead: int) -> None:
+    group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr",
+        mode="r",
+        zarr_format=2,
+    )
+    hcs = HCS.from_zarr(group)
+    wells = list(HCS.iter_wells(group, read_ahead=read_ahead))
+    assert [path for path, _ in wells] == ["B/03"]
+    assert [well for _, well in wells] == list(hcs.well_groups)
+
+    images = list(HCS.iter_images(group, read_ahead=read_ahead))
+    assert [path for path, _ in images] == ["B/03/0"]
+    assert [image for _, image in images] == list(hcs.get_well_group(0).images)
+
+
+def test_iter_wells_missing_wells() -> None:
+    plate: dict[str, JsonValue] = {
+        "columns": [{"name": "1"}],
+        "rows": [{"name": "A"}],
+        "wells": [{"path": "A/1", "rowIndex": 0, "columnIndex": 0}],
+        "version": "0.4",
+    }
+    group = zarr.create_group(
+        store={},
+        zarr_format=2,
+        attributes={"plate": plate, "version": "0.4"},
+    )
+    assert list(HCS.iter_wells(group)) == []
+    assert list(HCS.iter_images(group)) == []
+    with pytest.raises(ValueError, match="read_ahead must be at least 1"):
+        next(HCS.iter_wells(group, read_ahead=0))
@@ -1,7 +1,11 @@
+from typing import TYPE_CHECKING, Any
+
 import pytest
 import zarr
 from zarr.abc.store import Store
+from zarr.storage import MemoryStore
 
+from ome_zarr_models.cache import ListingIndexStore
 from ome_zarr_models.exceptions import ValidationWarning
 from ome_zarr_models.v05.bioformats2raw import BioFormats2Raw, BioFormats2RawAttrs
 from ome_zarr_models.v05.image import Image
@@ -12,7 +16,12 @@ from ome_zarr_models.v05.plate import (
     Row,
     WellInPlate,
 )
+from tests.test_cache import RecordingMemoryStore
 from tests.v05.conftest import json_to_zarr_group
+from tests.v05.test_image import make_valid_image_group
+
+if TYPE_CHECKING:
+    from zarr.core.buffer import Buffer
 
 
 def test_bioformats2raw_example_json(store: Store) -> None:
@@ -55,3 +64,59 @@ def test_bioformats2raw_get_image() -> None:
     assert model.image_paths == [str(i) for i in range(9)]
     assert list(model.images.keys()) == model.image_paths
     assert all(isinstance(v, Image) for v in model.images.values())
+
+
+def make_bioformats2raw_store(n_images: int, **attributes: Any) -> RecordingMemoryStore:
+    image_dict: dict[str, Buffer] = {}
+    make_valid_image_group(MemoryStore(store_dict=image_dict))
+    store_dict: dict[str, Buffer] = {}
+    zarr.create_group(
+        MemoryStore(store_dict=store_dict),
+        attributes={
+            "ome": {"version": "0.5", "bioformats2raw.layout": 3, **attributes}
+        },
+    )
+    for index in range(n_images):
+        for key, value in image_dict.items():
+            store_dict[f"{index}/{key}"] = value
+    return RecordingMemoryStore(store_dict)
+
+
+def read_image_paths(store: RecordingMemoryStore) -> set[str]:
+    return {key.split("/")[0] for key in store.keys if "/" in key}
+
+
+@pytest.mark.parametrize("n_images", [0, 1, 9, 100])
+def test_bioformats2raw_find_images(n_images: int) -> None:
+    store = make_bioformats2raw_store(n_images)
+    model = BioFormats2Raw.from_zarr(zarr.open_group(store, mode="r"))
+    assert model.image_paths == [str(i) for i in range(n_images)]
+    assert list(model.images) == model.image_paths
+    # Only a few paths after the last image are checked
+    missing_paths = read_image_paths(store) - set(model.image_paths)
+    assert len(missing_paths) < 20
+
+
+def test_bioformats2raw_find_images_gap() -> None:
+    store = make_bioformats2raw_store(40)
+    for key in list(store._store_dict):
+        if key.startswith("20/"):
+            del store._store_dict[key]
+    model = BioFormats2Raw.from_zarr(zarr.open_group(store, mode="r"))
+    assert model.image_paths == [str(i) for i in range(20)]
+
+
+def test_bioformats2raw_series() -> None:
+    store = make_bioformats2raw_store(3, series=["0", "1"])
+    model = BioFormats2Raw.from_zarr(zarr.open_group(store, mode="r"))
+    assert model.image_paths == ["0", "1"]
+    assert read_image_paths(store) == {"0", "1"}
+
+
+def test_bioformats2raw_listing_index() -> None:
+    store = make_bioformats2raw_store(9)
+    model = BioFormats2Raw.from_zarr(
+        zarr.open_group(ListingIndexStore(store), mode="r")
+    )
+    assert len(model.image_paths) == 9
+    assert read_image_paths(store) == set(model.image_paths)
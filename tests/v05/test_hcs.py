@@ -1,11 +1,14 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import pytest
 import zarr
 from zarr.abc.store import Store
 
 from ome_zarr_models.v05.hcs import HCS, HCSAttrs
+from ome_zarr_models.v05.image import Image
 from ome_zarr_models.v05.plate import Acquisition, Column, Plate, Row, WellInPlate
-from tests.v05.conftest import json_to_zarr_group
+from ome_zarr_models.v05.well import Well
+from tests.v05.conftest import json_to_dict, json_to_zarr_group
 
 if TYPE_CHECKING:
     from pydantic import JsonValue
@@ -96,3 +99,129 @@ def test_non_existent_wells_from_zarr() -> None:
         attributes={"ome": {"plate": plate, "version": "0.5"}},
     )
     HCS.from_zarr(group)
+
+
+def test_iter_wells(store: Store) -> None:
+    plate: dict[str, JsonValue] = {
+        "columns": [{"name": "1"}, {"name": "2"}],
+        "rows": [{"name": "A"}],
+        "wells": [
+            {"path": "A/1", "rowIndex": 0, "columnIndex": 0},
+            {"path": "A/2", "rowIndex": 0, "columnIndex": 1},
+        ],
+        "version": "0.5",
+    }
+    group = zarr.create_group(
+        store=store, attributes={"ome": {"plate": plate, "version": "0.5"}}
+    )
+    # Only create the first well
+    well_group = group.create_group(
+        "A/1",
+        attributes={"ome": {"well": {"images": [{"path": "0"}]}, "version": "0.5"}},
+    )
+    image_group = well_group.create_group(
+        "0", attributes=json_to_dict(json_fname="image_example.json")
+    )
+    for path in ["0", "1", "2"]:
+        image_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+
+    hcs = HCS.from_zarr(group)
+    wells = list(HCS.iter_wells(group, read_ahead=1))
+    assert wells == [("A/1", hcs.get_well_group(0))]
+    images = list(HCS.iter_images(group, read_ahead=1))
+    assert images == [("A/1/0", Image.from_zarr(image_group))]
+
+
+def make_plate_group(store: Store, n_wells: int) -> zarr.Group:
+    """
+    Make a plate with one row of wells, each with a single image.
+    """
+    plate: dict[str, JsonValue] = {
+        "columns": [{"name": str(i)} for i in range(1, n_wells + 1)],
+        "rows": [{"name": "A"}],
+        "wells": [
+            {"path": f"A/{i + 1}", "rowIndex": 0, "columnIndex": i}
+            for i in range(n_wells)
+        ],
+        "version": "0.5",
+    }
+    group = zarr.create_group(
+        store=store, attributes={"ome": {"plate": plate, "version": "0.5"}}
+    )
+    for i in range(n_wells):
+        image_group = group.create_group(
+            f"A/{i + 1}",
+            attributes={"ome": {"well": {"images": [{"path": "0"}]}, "version": "0.5"}},
+        ).create_group("0", attributes=json_to_dict(json_fname="image_example.json"))
+        for path in ["0", "1", "2"]:
+            image_group.create_array(
+                path,
+                shape=(1, 1, 1, 1, 1),
+                dtype="uint8",
+                dimension_names=["t", "c", "z", "y", "x"],
+            )
+    return group
+
+
+@pytest.mark.parametrize("n_wells", [1, 4, 16])
+def test_wells_validated_once(
+    store: Store, n_wells: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    group = make_plate_group(store, n_wells)
+    n_validated = {"Well": 0, "Image": 0}
+    for cls in [Well, Image]:
+
+        def counting_init(
+            self: Any, _cls: type[Any] = cls, _init: Any = cls.__init__, **data: Any
+        ) -> None:
+            n_validated[_cls.__name__] += 1
+            _init(self, **data)
+
+        monkeypatch.setattr(cls, "__init__", counting_init)
+
+    hcs = HCS.from_zarr(group)
+    # Models of members are re-used from loading, and cached on the parent
+    wells = list(hcs.well_groups)
+    assert list(hcs.well_groups) == wells
+    assert all(hcs.get_well_group(i) is well for i, well in enumerate(wells))
+    assert n_validated == {"Well": n_wells, "Image": n_wells}
+
+
+def test_identical_metadata_shared(store: Store) -> None:
+    hcs = HCS.from_zarr(make_plate_group(store, n_wells=2))
+    wells = list(hcs.well_groups)
+    assert wells[0].ome_attributes is wells[1].ome_attributes
+    assert hcs.members is not None
+    images = [hcs.members["A"].members[col].members["0"] for col in ["1", "2"]]  # type: ignore[union-attr]
+    assert images[0] is images[1]
+    # Sharing models doesn't stop member models being re-used
+    assert hcs.get_well_group(0) is wells[0]
+
+
+def test_lazy_checks_run_when_loaded(store: Store) -> None:
+    group = make_plate_group(store, n_wells=2)
+    group.attrs["ome"] = {
+        **group.attrs["ome"],  # type: ignore[dict-item]
+        "plate": {**group.attrs["ome"]["plate"], "acquisitions": [{"id": 0}]},  # type: ignore[index, call-overload, dict-item]
+    }
+    hcs = HCS.from_zarr(group, lazy=True)
+    assert hcs.skipped_checks == ("HCS._check_valid_acquisitions",)
+    assert len(list(hcs.well_groups)) == 2
+    assert hcs.skipped_checks == ()
+
+    group["A/2"].attrs["ome"] = {
+        "well": {"images": [{"path": "0", "acquisition": 1}]},
+        "version": "0.5",
+    }
+    hcs = HCS.from_zarr(group, lazy=True)
+    with pytest.raises(ValueError, match="is not in list of plate acquisitions"):
+        list(hcs.well_groups)
+    # The error is raised on every access, and the check is still reported
+    with pytest.raises(ValueError, match="is not in list of plate acquisitions"):
+        len(hcs.members)
+    assert hcs.skipped_checks == ("HCS._check_valid_acquisitions",)
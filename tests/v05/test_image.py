@@ -1,9 +1,12 @@
+import asyncio
 import re
+from typing import TYPE_CHECKING
 
 import pytest
 import zarr
 from pydantic import ValidationError
 from zarr.abc.store import Store
+from zarr.errors import ZarrUserWarning
 from zarr.storage import MemoryStore
 
 from ome_zarr_models.v05.axes import Axis
@@ -13,6 +16,9 @@ from ome_zarr_models.v05.labels import LabelsAttrs
 from ome_zarr_models.v05.multiscales import Dataset, Multiscale
 from tests.v05.conftest import json_to_dict, json_to_zarr_group
 
+if TYPE_CHECKING:
+    from zarr.core.buffer import Buffer
+
 
 def make_valid_image_group(store: Store) -> zarr.Group:
     zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
@@ -37,6 +43,26 @@ def make_valid_image_group(store: Store) -> zarr.Group:
     return zarr_group
 
 
+def make_valid_image_with_labels_group(store: Store) -> zarr.Group:
+    zarr_group = make_valid_image_group(store)
+    labels_group = zarr_group.create_group(
+        "labels",
+        attributes=json_to_dict(json_fname="labels_example.json"),
+    )
+    image_label_group = labels_group.create_group(
+        "cell_space_segmentation",
+        attributes=json_to_dict(json_fname="image_label_example.json"),
+    )
+    for path in ["0", "1", "2"]:
+        image_label_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+    return zarr_group
+
+
 def test_image(store: Store) -> None:
     zarr_group = make_valid_image_group(store)
     ome_group = Image.from_zarr(zarr_group)
@@ -426,3 +452,93 @@ def test_image_convert_v06() -> None:
             )
         ],
     )
+
+
+def test_image_consolidated_metadata() -> None:
+    store_dict: dict[str, Buffer] = {}
+    store = MemoryStore(store_dict=store_dict)
+    expected = Image.from_zarr(make_valid_image_with_labels_group(store))
+    with pytest.warns(ZarrUserWarning, match="Consolidated metadata"):
+        zarr.consolidate_metadata(store)
+
+    # Remove all metadata apart from the root group metadata, to check that only
+    # the consolidated metadata is used to load the image
+    for key in list(store_dict):
+        if key != "zarr.json":
+            del store_dict[key]
+
+    zarr_group = zarr.open_group(store, mode="r")
+    assert Image.from_zarr(zarr_group) == expected
+
+
+def test_image_to_zarr_consolidate() -> None:
+    image = Image.from_zarr(make_valid_image_with_labels_group(MemoryStore()))
+    store_dict: dict[str, Buffer] = {}
+    store = MemoryStore(store_dict=store_dict)
+    image.to_zarr(store, path="", consolidate=True)
+
+    # Remove all metadata apart from the root group metadata, to check that the
+    # consolidated metadata covers the whole hierarchy
+    for key in list(store_dict):
+        if key != "zarr.json":
+            del store_dict[key]
+
+    zarr_group = zarr.open_group(store, mode="r")
+    assert zarr_group.metadata.consolidated_metadata is not None
+    assert Image.from_zarr(zarr_group) == image
+
+
+def test_image_from_zarr_async(store: Store) -> None:
+    group = make_valid_image_group(store)
+    image = Image.from_zarr(group)
+    assert asyncio.run(Image.from_zarr_async(group)) == image
+    assert asyncio.run(Image.from_zarr_async(group._async_group)) == image
+    assert asyncio.run(Image.from_zarr_async(group, max_concurrency=1)) == image
+
+
+def test_image_from_zarr_async_missing_arrays() -> None:
+    # When several arrays are missing, the error for the first one should be
+    # raised, even though the arrays are read concurrently
+    store_dict: dict[str, Buffer] = {}
+    group = make_valid_image_group(MemoryStore(store_dict=store_dict))
+    for array_path in ["1", "2"]:
+        del store_dict[f"{array_path}/zarr.json"]
+
+    msg = "Expected to find an array at 1, but no array was found there."
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        Image.from_zarr(group)
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        asyncio.run(Image.from_zarr_async(group))
+
+
+def test_image_from_zarr_async_invalid_max_concurrency(store: Store) -> None:
+    group = make_valid_image_group(store)
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        asyncio.run(Image.from_zarr_async(group, max_concurrency=0))
+
+
+def test_image_lazy() -> None:
+    store_dict: dict[str, Buffer] = {}
+    group = make_valid_image_with_labels_group(MemoryStore(store_dict=store_dict))
+    image = Image.from_zarr(group)
+
+    lazy_image = Image.from_zarr(group, lazy=True)
+    assert lazy_image.attributes == image.attributes
+    assert lazy_image.members is not None
+    assert lazy_image.members["0"] == image.members["0"]  # type: ignore[index]
+
+    # Members are only read once, and only when they are accessed
+    del store_dict["0/zarr.json"]
+    del store_dict["1/zarr.json"]
+    assert lazy_image.members["0"] == image.members["0"]  # type: ignore[index]
+    with pytest.raises(ValueError, match="Expected to find an array at 1"):
+        lazy_image.members["1"]
+
+
+def test_image_lazy_equal(store: Store) -> None:
+    group = make_valid_image_with_labels_group(store)
+    image = Image.from_zarr(group)
+    lazy_image = Image.from_zarr(group, lazy=True)
+    assert lazy_image == image
+    assert lazy_image.model_dump() == image.model_dump()
+    assert lazy_image.labels == image.labels
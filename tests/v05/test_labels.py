@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 from zarr.abc.store import Store
 
+from ome_zarr_models import _io
 from ome_zarr_models.v05.labels import Labels, LabelsAttrs
 from tests.v05.conftest import json_to_zarr_group
 
@@ -65,3 +66,30 @@ def test_labels_invalid_dtype(store: Store) -> None:
         ),
     ):
         Labels.from_zarr(zarr_group)
+
+
+def test_labels_lazy_no_images(store: Store) -> None:
+    # Missing label images are only found when they are accessed
+    zarr_group = json_to_zarr_group(json_fname="labels_example.json", store=store)
+    ome_group = Labels.from_zarr(zarr_group, lazy=True)
+    assert ome_group.attributes.ome.labels == ["cell_space_segmentation"]
+    with pytest.raises(
+        ValueError,
+        match="Label path 'cell_space_segmentation' not found in zarr group",
+    ):
+        ome_group.members["cell_space_segmentation"]  # type: ignore[index]
+
+
+def test_labels_no_images_attrs_only() -> None:
+    # Label paths are still checked when checks on arrays are skipped
+    with _io.skipping_array_checks():
+        with pytest.raises(
+            ValueError,
+            match="Label path 'cell_space_segmentation' not found in zarr group",
+        ):
+            Labels(
+                attributes={
+                    "ome": {"labels": ["cell_space_segmentation"], "version": "0.5"}
+                },
+                members={},
+            )
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 import pytest
 import zarr
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, ArraySpec, GroupSpec
 
 from ome_zarr_models.common.coordinate_transformations import (
@@ -300,6 +300,49 @@ def test_swap_translation_scale() -> None:
     )
 
 
+def test_dataset_validation_builds_no_schemas(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Validating a dataset should not build any pydantic models or type adapters,
+    which are much slower to build than to use.
+    """
+    n_built = 0
+    type_adapter_init = TypeAdapter.__init__
+
+    def count_model(cls: type[BaseModel], **kwargs: Any) -> None:
+        nonlocal n_built
+        n_built += 1
+
+    def count_type_adapter(self: TypeAdapter[Any], *args: Any, **kwargs: Any) -> None:
+        nonlocal n_built
+        n_built += 1
+        type_adapter_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        BaseModel, "__pydantic_init_subclass__", classmethod(count_model)
+    )
+    monkeypatch.setattr(TypeAdapter, "__init__", count_type_adapter)
+    for i in range(1000):
+        Dataset(
+            path=str(i),
+            coordinateTransformations=[
+                {"type": "scale", "scale": [1, 2**i, 2**i]},
+                {"type": "translation", "translation": [0, i, i]},
+            ],
+        )
+    assert n_built == 0
+
+
+def test_transforms_error_location() -> None:
+    with pytest.raises(ValidationError) as e:
+        Dataset(path="foo", coordinateTransformations=[{"type": "foo"}])
+    assert e.value.errors()[0]["loc"] == (
+        "coordinateTransformations",
+        "transforms",
+        0,
+        "type",
+    )
+
+
 def test_validate_axes_top_transforms() -> None:
     """
     Test that the number of axes must match the dimensionality of the
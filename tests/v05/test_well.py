@@ -1,3 +1,5 @@
+import pytest
+from pydantic import ValidationError
 from zarr.abc.store import Store
 
 from ome_zarr_models.v05.well import Well, WellAttrs
@@ -34,3 +36,10 @@ def test_get_paths() -> None:
     )
 
     assert well.get_acquisition_paths() == {1: ["0", "1"], 2: ["2", "3"]}
+
+
+def test_many_images() -> None:
+    images = [WellImage(path=str(i), acquisition=i) for i in range(10_000)]
+    assert len(WellMeta(images=images).images) == 10_000
+    with pytest.raises(ValidationError, match="Duplicate values found in"):
+        WellMeta(images=[*images, WellImage(path="9999", acquisition=9999)])